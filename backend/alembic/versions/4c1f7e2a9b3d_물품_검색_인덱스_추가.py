@@ -0,0 +1,88 @@
+"""물품_검색_인덱스_추가
+
+Revision ID: 4c1f7e2a9b3d
+Revises: 56fc955e9ea5
+Create Date: 2026-10-18 17:40:12.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c1f7e2a9b3d'
+down_revision: Union[str, Sequence[str], None] = '56fc955e9ea5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# inventory_items(name, category, tags) 키워드 검색용 인덱스
+# - postgresql: pg_trgm GIN (ILIKE '%kw%' 를 인덱스로 처리)
+# - mysql     : ngram FULLTEXT (MATCH ... AGAINST)
+# - sqlite    : FTS5 trigram 가상 테이블 + 동기화 트리거 (로컬 개발용)
+TRGM_COLUMNS = ("name", "category", "tags")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for col in TRGM_COLUMNS:
+            op.execute(
+                f"CREATE INDEX ix_inventory_items_{col}_trgm "
+                f"ON inventory_items USING gin ({col} gin_trgm_ops)"
+            )
+
+    elif dialect == "mysql":
+        op.execute(
+            "CREATE FULLTEXT INDEX ft_inventory_items_search "
+            "ON inventory_items (name, category, tags) WITH PARSER ngram"
+        )
+
+    elif dialect == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE inventory_items_fts USING fts5("
+            "name, category, tags, "
+            "content='inventory_items', content_rowid='id', tokenize='trigram')"
+        )
+        op.execute(
+            "CREATE TRIGGER inventory_items_fts_ai AFTER INSERT ON inventory_items BEGIN "
+            "INSERT INTO inventory_items_fts(rowid, name, category, tags) "
+            "VALUES (new.id, new.name, new.category, new.tags); END"
+        )
+        op.execute(
+            "CREATE TRIGGER inventory_items_fts_ad AFTER DELETE ON inventory_items BEGIN "
+            "INSERT INTO inventory_items_fts(inventory_items_fts, rowid, name, category, tags) "
+            "VALUES ('delete', old.id, old.name, old.category, old.tags); END"
+        )
+        op.execute(
+            "CREATE TRIGGER inventory_items_fts_au AFTER UPDATE ON inventory_items BEGIN "
+            "INSERT INTO inventory_items_fts(inventory_items_fts, rowid, name, category, tags) "
+            "VALUES ('delete', old.id, old.name, old.category, old.tags); "
+            "INSERT INTO inventory_items_fts(rowid, name, category, tags) "
+            "VALUES (new.id, new.name, new.category, new.tags); END"
+        )
+        # 기존 행 backfill
+        op.execute("INSERT INTO inventory_items_fts(inventory_items_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        for col in TRGM_COLUMNS:
+            op.execute(f"DROP INDEX IF EXISTS ix_inventory_items_{col}_trgm")
+
+    elif dialect == "mysql":
+        op.drop_index("ft_inventory_items_search", table_name="inventory_items")
+
+    elif dialect == "sqlite":
+        op.execute("DROP TRIGGER IF EXISTS inventory_items_fts_au")
+        op.execute("DROP TRIGGER IF EXISTS inventory_items_fts_ad")
+        op.execute("DROP TRIGGER IF EXISTS inventory_items_fts_ai")
+        op.execute("DROP TABLE IF EXISTS inventory_items_fts")
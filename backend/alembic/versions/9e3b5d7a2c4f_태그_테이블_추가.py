@@ -0,0 +1,79 @@
+"""태그_테이블_추가
+
+Revision ID: 9e3b5d7a2c4f
+Revises: 4c1f7e2a9b3d
+Create Date: 2026-10-18 18:05:27.904113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e3b5d7a2c4f'
+down_revision: Union[str, Sequence[str], None] = '4c1f7e2a9b3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TAG_MAX_LENGTH = 50
+BATCH_SIZE = 1000
+
+
+def _parse_tags(raw):
+    # app.models.tag.parse_tags 와 동일 규칙 (마이그레이션은 앱 코드에 의존하지 않도록 복제)
+    if not raw:
+        return []
+    tags = []
+    for part in raw.split(","):
+        tag = part.strip().lstrip("#").strip()[:TAG_MAX_LENGTH]
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+def _backfill(source_table: str, target: sa.Table, owner_col: str) -> None:
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.text(f"SELECT id, tags FROM {source_table} WHERE tags IS NOT NULL AND tags <> ''")
+    )
+    batch = []
+    for owner_id, raw in rows:
+        for tag in _parse_tags(raw):
+            batch.append({owner_col: owner_id, "tag": tag})
+        if len(batch) >= BATCH_SIZE:
+            op.bulk_insert(target, batch)
+            batch = []
+    if batch:
+        op.bulk_insert(target, batch)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    item_tags = op.create_table('item_tags',
+    sa.Column('item_id', sa.Integer(), nullable=False),
+    sa.Column('tag', sa.String(length=TAG_MAX_LENGTH), nullable=False),
+    sa.ForeignKeyConstraint(['item_id'], ['inventory_items.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('item_id', 'tag')
+    )
+    op.create_index('ix_item_tags_tag_item', 'item_tags', ['tag', 'item_id'], unique=False)
+
+    post_tags = op.create_table('post_tags',
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('tag', sa.String(length=TAG_MAX_LENGTH), nullable=False),
+    sa.ForeignKeyConstraint(['post_id'], ['community_posts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('post_id', 'tag')
+    )
+    op.create_index('ix_post_tags_tag_post', 'post_tags', ['tag', 'post_id'], unique=False)
+
+    # 기존 콤마 문자열 backfill
+    _backfill('inventory_items', item_tags, 'item_id')
+    _backfill('community_posts', post_tags, 'post_id')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('post_tags')
+    op.drop_table('item_tags')
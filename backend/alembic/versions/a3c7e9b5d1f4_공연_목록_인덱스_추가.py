@@ -0,0 +1,28 @@
+"""공연_목록_인덱스_추가
+
+Revision ID: a3c7e9b5d1f4
+Revises: f2b6d8a4c1e9
+Create Date: 2026-10-19 10:12:44.381920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c7e9b5d1f4'
+down_revision: Union[str, Sequence[str], None] = 'f2b6d8a4c1e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_performances_region_theme_date', 'performances', ['region', 'theme_category', 'performance_date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_performances_region_theme_date', table_name='performances')
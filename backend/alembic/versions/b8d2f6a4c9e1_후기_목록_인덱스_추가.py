@@ -0,0 +1,28 @@
+"""후기_목록_인덱스_추가
+
+Revision ID: b8d2f6a4c9e1
+Revises: a3c7e9b5d1f4
+Create Date: 2026-10-19 15:41:07.512346
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d2f6a4c9e1'
+down_revision: Union[str, Sequence[str], None] = 'a3c7e9b5d1f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_reviews_performance_public_created', 'reviews', ['performance_id', 'is_public', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reviews_performance_public_created', table_name='reviews')
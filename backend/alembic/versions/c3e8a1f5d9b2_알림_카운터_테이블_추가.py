@@ -0,0 +1,42 @@
+"""알림_카운터_테이블_추가
+
+Revision ID: c3e8a1f5d9b2
+Revises: b7d2e9f4a1c6
+Create Date: 2026-10-18 21:03:15.527341
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e8a1f5d9b2'
+down_revision: Union[str, Sequence[str], None] = 'b7d2e9f4a1c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('notification_counters',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('unread_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+
+    # 기존 안 읽은 알림 수 backfill
+    op.execute(
+        sa.text(
+            "INSERT INTO notification_counters (user_id, unread_count) "
+            "SELECT recipient_user_id, COUNT(*) FROM notifications "
+            "WHERE is_read = :unread GROUP BY recipient_user_id"
+        ).bindparams(unread=False)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('notification_counters')
@@ -0,0 +1,83 @@
+"""공연_평점_집계_테이블_추가
+
+Revision ID: c4e1a7d3b5f8
+Revises: b8d2f6a4c9e1
+Create Date: 2026-10-19 18:27:53.904117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e1a7d3b5f8'
+down_revision: Union[str, Sequence[str], None] = 'b8d2f6a4c9e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('performance_ratings',
+    sa.Column('performance_id', sa.Integer(), nullable=False),
+    sa.Column('review_count', sa.Integer(), nullable=False),
+    sa.Column('rating_count', sa.Integer(), nullable=False),
+    sa.Column('rating_sum', sa.Integer(), nullable=False),
+    sa.Column('rating_avg', sa.Float(), nullable=True),
+    sa.Column('rating_1', sa.Integer(), nullable=False),
+    sa.Column('rating_2', sa.Integer(), nullable=False),
+    sa.Column('rating_3', sa.Integer(), nullable=False),
+    sa.Column('rating_4', sa.Integer(), nullable=False),
+    sa.Column('rating_5', sa.Integer(), nullable=False),
+    sa.Column('all_review_count', sa.Integer(), nullable=False),
+    sa.Column('all_rating_count', sa.Integer(), nullable=False),
+    sa.Column('all_rating_sum', sa.Integer(), nullable=False),
+    sa.Column('all_rating_1', sa.Integer(), nullable=False),
+    sa.Column('all_rating_2', sa.Integer(), nullable=False),
+    sa.Column('all_rating_3', sa.Integer(), nullable=False),
+    sa.Column('all_rating_4', sa.Integer(), nullable=False),
+    sa.Column('all_rating_5', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['performance_id'], ['performances.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('performance_id')
+    )
+    op.create_index(op.f('ix_performance_ratings_rating_avg'), 'performance_ratings', ['rating_avg'], unique=False)
+
+    # 기존 공연 전체 backfill (후기 없는 공연도 0으로 1행)
+    def total(cond: str, value: str = "1") -> str:
+        return f"COALESCE(SUM(CASE WHEN {cond} THEN {value} ELSE 0 END), 0)"
+
+    public = "r.is_public = :public"
+    rated = "r.rating IS NOT NULL"
+    exprs = {
+        "review_count": total(public),
+        "rating_count": total(f"{public} AND {rated}"),
+        "rating_sum": total(f"{public} AND {rated}", "r.rating"),
+        "all_review_count": "COUNT(r.id)",
+        "all_rating_count": total(rated),
+        "all_rating_sum": total(rated, "r.rating"),
+    }
+    for score in range(1, 6):
+        exprs[f"rating_{score}"] = total(f"{public} AND r.rating = {score}")
+        exprs[f"all_rating_{score}"] = total(f"r.rating = {score}")
+    exprs["rating_avg"] = (
+        f"CASE WHEN {exprs['rating_count']} > 0 "
+        f"THEN {exprs['rating_sum']} * 1.0 / {exprs['rating_count']} END"
+    )
+    exprs["updated_at"] = "CURRENT_TIMESTAMP"
+
+    op.execute(
+        sa.text(
+            f"INSERT INTO performance_ratings (performance_id, {', '.join(exprs)}) "
+            f"SELECT p.id, {', '.join(exprs.values())} FROM performances p "
+            "LEFT JOIN reviews r ON r.performance_id = p.id GROUP BY p.id"
+        ).bindparams(public=True)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_performance_ratings_rating_avg'), table_name='performance_ratings')
+    op.drop_table('performance_ratings')
@@ -0,0 +1,62 @@
+"""알림_보관_테이블_추가
+
+Revision ID: d5a9c2e7f3b8
+Revises: c3e8a1f5d9b2
+Create Date: 2026-10-18 21:47:09.184526
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a9c2e7f3b8'
+down_revision: Union[str, Sequence[str], None] = 'c3e8a1f5d9b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+NOTIFICATION_TYPES = ('ITEM_CHECK', 'TRADE_STATUS', 'POST_COMMENT', 'POST_REPLY', 'REQUEST_RESPONSE')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    is_postgres = bind.dialect.name == "postgresql"
+
+    table_kwargs = {}
+    if is_postgres:
+        # notifications 테이블이 이미 만든 enum 재사용
+        type_enum = postgresql.ENUM(*NOTIFICATION_TYPES, name='notificationtype', create_type=False)
+        # 월별 파티션은 보관 스크립트가 필요할 때 생성
+        table_kwargs["postgresql_partition_by"] = "RANGE (created_at)"
+    else:
+        type_enum = sa.Enum(*NOTIFICATION_TYPES, name='notificationtype')
+
+    op.create_table('notifications_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('recipient_user_id', sa.Integer(), nullable=False),
+    sa.Column('type', type_enum, nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=True),
+    sa.Column('payload', sa.Text(), nullable=True),
+    sa.Column('message', sa.String(length=500), nullable=False),
+    sa.Column('is_read', sa.Boolean(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id', 'created_at'),
+    **table_kwargs
+    )
+    op.create_index('ix_notifications_archive_recipient_created', 'notifications_archive', ['recipient_user_id', 'created_at'], unique=False)
+
+    if is_postgres:
+        # 월 파티션이 없는 범위의 행이 들어와도 INSERT가 실패하지 않도록
+        op.execute("CREATE TABLE notifications_archive_default PARTITION OF notifications_archive DEFAULT")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_notifications_archive_recipient_created', table_name='notifications_archive')
+    op.drop_table('notifications_archive')
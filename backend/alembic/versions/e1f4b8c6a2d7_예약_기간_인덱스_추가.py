@@ -0,0 +1,53 @@
+"""예약_기간_인덱스_추가
+
+Revision ID: e1f4b8c6a2d7
+Revises: d5a9c2e7f3b8
+Create Date: 2026-10-18 22:20:51.662310
+
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1f4b8c6a2d7'
+down_revision: Union[str, Sequence[str], None] = 'd5a9c2e7f3b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+EXCLUSION_NAME = 'ex_trade_reservations_no_overlap'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_trade_reservations_listing_period', 'trade_reservations', ['listing_id', 'start_at', 'end_at'], unique=False)
+
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    # 같은 listing의 (취소되지 않은) 대여 기간이 겹치지 않도록 EXCLUDE 제약
+    # btree_gist 확장 권한이 없으면 건너뜀 (앱의 listing 행 잠금으로만 보호)
+    try:
+        with bind.begin_nested():
+            op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+            op.execute(
+                f"ALTER TABLE trade_reservations ADD CONSTRAINT {EXCLUSION_NAME} "
+                "EXCLUDE USING gist (listing_id WITH =, tsrange(start_at, end_at, '[)') WITH &&) "
+                "WHERE (status <> 'CANCELED' AND trade_type = 'RENT' "
+                "AND start_at IS NOT NULL AND end_at IS NOT NULL)"
+            )
+    except sa.exc.DBAPIError as e:
+        logger.warning("Skipping %s: %s", EXCLUSION_NAME, e.orig)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(f"ALTER TABLE trade_reservations DROP CONSTRAINT IF EXISTS {EXCLUSION_NAME}")
+    op.drop_index('ix_trade_reservations_listing_period', table_name='trade_reservations')
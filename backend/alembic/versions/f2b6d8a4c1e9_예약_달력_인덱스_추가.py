@@ -0,0 +1,36 @@
+"""예약_달력_인덱스_추가
+
+Revision ID: f2b6d8a4c1e9
+Revises: e1f4b8c6a2d7
+Create Date: 2026-10-18 22:58:37.109245
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b6d8a4c1e9'
+down_revision: Union[str, Sequence[str], None] = 'e1f4b8c6a2d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('trade_reservations') as batch_op:
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute("UPDATE trade_reservations SET updated_at = created_at")
+    with op.batch_alter_table('trade_reservations') as batch_op:
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(), nullable=False)
+
+    op.create_index('ix_trade_reservations_listing_status_start', 'trade_reservations', ['listing_id', 'status', 'start_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_trade_reservations_listing_status_start', table_name='trade_reservations')
+    with op.batch_alter_table('trade_reservations') as batch_op:
+        batch_op.drop_column('updated_at')
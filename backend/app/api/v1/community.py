@@ -1,18 +1,21 @@
 from __future__ import annotations
 
-from typing import Optional, List
+from typing import Optional, List, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.repositories.community_repository import CommunityRepository
+from app.repositories.tag_repository import TagRepository
 from app.schemas.community import (
     CommunityPostCreate,
     CommunityPostUpdate,
     CommunityPostOut,
     CommunityPostListItem,
 )
+from app.schemas.tag import TagFacet
+from app.utils.http_cache import is_not_modified, latest, not_modified_response, set_validators, version_etag
 
 # ✅ 여기 import는 너 프로젝트 패턴에 맞춰야 함
 # 보통 app/dependencies/auth.py 안에 get_current_user 같은 게 있음
@@ -46,11 +49,15 @@ def create_post(
 def list_posts(
     type: Optional[str] = Query(default=None, description="general | request"),
     keyword: Optional[str] = Query(default=None, description="제목/본문/태그 검색"),
+    tag: Optional[str] = Query(default=None, description="태그 정확 일치, 콤마로 여러 개 지정"),
+    tag_mode: Literal["any", "all"] = Query(default="any", description="any: 하나라도 포함 / all: 모두 포함"),
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
     db: Session = Depends(get_db),
 ):
-    posts = CommunityRepository.list_posts(db, type=type, keyword=keyword, skip=skip, limit=limit)
+    posts = CommunityRepository.list_posts(
+        db, type=type, keyword=keyword, tag=tag, tag_mode=tag_mode, skip=skip, limit=limit
+    )
     result: List[CommunityPostListItem] = []
     for p in posts:
         result.append(
@@ -68,14 +75,36 @@ def list_posts(
     return result
 
 
+@router.get("/tags", response_model=List[TagFacet])
+def list_post_tag_facets(
+    limit: int = Query(default=30, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    rows = TagRepository.post_facets(db, limit)
+    return [TagFacet(tag=tag, count=count) for tag, count in rows]
+
+
 @router.get("/posts/{post_id}", response_model=CommunityPostOut)
 def get_post(
     post_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
 ):
+    """
+    ETag / Last-Modified = updated_at → 변경 없으면 본문 조회 없이 304
+    """
+    version = CommunityRepository.get_post_version(db, post_id)
+    if not version:
+        raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
+    etag, last_modified = version_etag("post", post_id, *version), latest(*version)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+
     post = CommunityRepository.get_post(db, post_id)
     if not post:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
+    set_validators(response, etag, last_modified)
     return post
 
 
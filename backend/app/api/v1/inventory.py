@@ -1,13 +1,17 @@
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.schemas.common import ApiResponse, PageData, ok, created, fail
 from app.schemas.inventory import InventoryItemCreate, InventoryItemUpdate, InventoryItemOut
-from app.repositories.inventory_repository import InventoryRepository
+from app.repositories.inventory_repository import InventoryRepository, AsyncInventoryRepository
 from app.dependencies.inventory_auth import get_current_admin_user, assert_club_admin
 from app.models.inventory_item import InventoryItem, ItemStatus
 from app.models.user import User
+from app.services.realtime_service import RealtimeService
+from app.utils.http_cache import is_not_modified, latest, not_modified_response, set_validators, version_etag
+from app.utils.responses import json_ok
 
 router = APIRouter(prefix="/inventory", tags=["Inventory"])
 
@@ -29,35 +33,55 @@ def create_item(
 
 
 @router.get("/items", response_model=ApiResponse[PageData[InventoryItemOut]])
-def list_items(
+async def list_items(
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
     sort: str | None = None,
     keyword: str | None = None,
     status: ItemStatus | None = None,
     club_id: int | None = None,
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(
+        None,
+        description="이전 응답의 meta.next_cursor (지정 시 page 무시). "
+        "keyword만 있고 sort가 없으면 관련도순이라 cursor 미지원 (next_cursor=null, 지정 시 400)",
+    ),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    items, meta = InventoryRepository.list(
-        db=db,
+    items, meta = await AsyncInventoryRepository.list(
+        db,
         club_id=club_id,
         status=status,
         keyword=keyword,
         sort=sort,
         page=page,
         size=size,
+        cursor=cursor,
     )
-    return ok(PageData(items=items, meta=meta))
+    # 행마다 한 번만 검증하고 봉투(ApiResponse/PageData) 재검증은 생략
+    return json_ok({"items": [InventoryItemOut.model_validate(i) for i in items], "meta": meta})
 
 
 @router.get("/items/{item_id}", response_model=ApiResponse[InventoryItemOut])
-def get_item(
+async def get_item(
     item_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    item = InventoryRepository.get(db, item_id)
+    """
+    ETag / Last-Modified = updated_at → 변경 없으면 본문 조회 없이 304
+    """
+    version = await AsyncInventoryRepository.get_version(db, item_id)
+    if not version:
+        raise HTTPException(status_code=404, detail="물품을 찾을 수 없습니다.")
+    etag, last_modified = version_etag("inventory", item_id, *version), latest(*version)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+
+    item = await AsyncInventoryRepository.get(db, item_id)
     if not item:
         raise HTTPException(status_code=404, detail="물품을 찾을 수 없습니다.")
+    set_validators(response, etag, last_modified)
     return ok(item)
 
 
@@ -65,6 +89,7 @@ def get_item(
 def update_item(
     item_id: int,
     payload: InventoryItemUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_admin_user),
 ):
@@ -82,12 +107,22 @@ def update_item(
         setattr(item, k, v)
 
     saved = InventoryRepository.update(db, item)
+
+    RealtimeService.publish_later(background_tasks, f"club:{saved.club_id}", "item.updated", {"item_id": saved.id})
+    if saved.trade_listing is not None:
+        RealtimeService.publish_later(
+            background_tasks,
+            f"listing:{saved.trade_listing.id}",
+            "listing.updated",
+            {"listing_id": saved.trade_listing.id},
+        )
     return ok(saved)
 
 
 @router.delete("/items/{item_id}", response_model=ApiResponse[dict])
 def delete_item(
     item_id: int,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_admin_user),
 ):
@@ -100,5 +135,13 @@ def delete_item(
     except PermissionError as e:
         raise HTTPException(status_code=403, detail=str(e))
 
+    club_id = item.club_id
+    listing_id = item.trade_listing.id if item.trade_listing is not None else None
     InventoryRepository.delete(db, item)
+
+    RealtimeService.publish_later(background_tasks, f"club:{club_id}", "item.deleted", {"item_id": item_id})
+    if listing_id is not None:
+        RealtimeService.publish_later(
+            background_tasks, f"listing:{listing_id}", "listing.deleted", {"listing_id": listing_id}
+        )
     return ok({"deleted": True})
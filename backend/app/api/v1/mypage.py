@@ -5,6 +5,7 @@ from app.database import get_db
 from app.dependencies.auth import get_current_user
 from app.models.user import User, UserRole
 from app.repositories.performance_repository import PerformanceRepository
+from app.repositories.user_repository import UserRepository
 from app.schemas.mypage import MyProfileOut, MyProfileUpdate
 from app.schemas.performance import PerformanceOut
 
@@ -38,12 +39,18 @@ def update_my_profile(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    # current_user는 캐시된 UserResponse이므로 ORM 객체를 다시 조회해 수정
+    # (commit 시 인증 사용자 캐시는 flush 이벤트로 무효화됨)
+    user = UserRepository.get_by_id(db, current_user.id)
+    if user is None:
+        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+
     if data.name is not None:
-        current_user.name = data.name
+        user.name = data.name
 
     db.commit()
-    db.refresh(current_user)
-    return current_user
+    db.refresh(user)
+    return user
 
 
 # --------------------
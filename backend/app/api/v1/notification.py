@@ -1,51 +1,80 @@
 from __future__ import annotations
 
-from math import ceil
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.dependencies.auth import get_current_user
 from app.models.user import User
-from app.repositories.notification_repository import NotificationRepository
-from app.schemas.common import ok, PageData, PaginationMeta
-from app.schemas.notification import NotificationOut
+from app.repositories.notification_repository import NotificationRepository, AsyncNotificationRepository
+from app.schemas.common import ok
+from app.schemas.notification import (
+    NotificationBulkReadOut,
+    NotificationBulkReadRequest,
+    NotificationOut,
+    UnreadCountOut,
+)
+from app.services.notification_service import NotificationService
+from app.utils.responses import json_ok
 
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
 
 @router.get("")
-def list_notifications(
+async def list_notifications(
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
     is_read: Optional[bool] = Query(None),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="이전 응답의 meta.next_cursor (지정 시 page 무시)"),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    items, total = NotificationRepository.list_for_user(
-        db=db,
+    items, meta = await AsyncNotificationRepository.list_for_user(
+        db,
         user_id=current_user.id,
         is_read=is_read,
         page=page,
         size=size,
+        cursor=cursor,
     )
 
-    total_pages = ceil(total / size) if size else 0
-    meta = PaginationMeta(
-        page=page,
-        size=size,
-        total=total,
-        total_pages=total_pages,
-        has_next=page < total_pages,
-        has_prev=page > 1,
-    )
-    data = PageData[NotificationOut](
-        items=[NotificationOut.model_validate(i) for i in items],
-        meta=meta,
+    # 이미 검증된 모델 → 봉투 재검증 없이 바로 직렬화
+    return json_ok({"items": [NotificationOut.model_validate(i) for i in items], "meta": meta})
+
+
+@router.get("/unread-count")
+async def get_unread_count(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    안 읽은 알림 수 (notification_counters PK 조회, COUNT 없음)
+    """
+    count = await AsyncNotificationRepository.unread_count(db, current_user.id)
+    return ok(UnreadCountOut(unread_count=count))
+
+
+@router.post("/read")
+async def mark_notifications_read(
+    data: NotificationBulkReadRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    일괄 읽음 처리 (ids 생략 시 전체). 변경 후 카운터를 WebSocket으로 1회 push.
+    """
+    updated = await AsyncNotificationRepository.mark_read_many(
+        db,
+        user_id=current_user.id,
+        ids=data.ids,
     )
-    return ok(data)
+    count = await AsyncNotificationRepository.unread_count(db, current_user.id)
+    if updated:
+        await NotificationService.push_unread_count(current_user.id, count)
+    return ok(NotificationBulkReadOut(updated=updated, unread_count=count))
 
 
 @router.post("/{notification_id}/read")
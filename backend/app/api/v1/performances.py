@@ -1,20 +1,25 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Optional, List
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.dependencies.auth import get_current_user
 from app.models.user import User, UserRole
-from app.repositories.performance_repository import PerformanceRepository
+from app.repositories.performance_repository import PerformanceRepository, AsyncPerformanceRepository
 from app.schemas.performance import (
     PerformanceCreate,
     PerformanceUpdate,
     PerformanceOut,
+    PerformanceListItem,
 )
+from app.schemas.common import ApiResponse, PageData, ok
+from app.utils.http_cache import is_not_modified, latest, not_modified_response, set_validators, version_etag
+from app.utils.response_cache import PERFORMANCES, response_cache
 
 router = APIRouter(prefix="/performances", tags=["Performances"])
 
@@ -35,32 +40,66 @@ def _ensure_can_manage(user: User, club_id: Optional[int]) -> None:
     )
 
 
-@router.get("", response_model=List[PerformanceOut])
-def list_performances(
+@router.get("", response_model=ApiResponse[PageData[PerformanceListItem]])
+async def list_performances(
+    request: Request,
     region: Optional[str] = Query(default=None),
     theme: Optional[str] = Query(default=None),
     start_date: Optional[date] = Query(default=None),
     end_date: Optional[date] = Query(default=None),
-    db: Session = Depends(get_db),
+    page: int = Query(1, ge=1),
+    size: int = Query(20, ge=1, le=100),
+    sort: Optional[str] = Query(None, description="기본: performance_date (예: -performance_date, title)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 meta.next_cursor (지정 시 page 무시)"),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    return PerformanceRepository.list(
-        db=db,
+    cached = response_cache.get(PERFORMANCES, request)
+    if cached is not None:
+        return cached
+
+    items, meta = await AsyncPerformanceRepository.list(
+        db,
         region=region,
         theme=theme,
         start_date=start_date,
         end_date=end_date,
+        page=page,
+        size=size,
+        sort=sort,
+        cursor=cursor,
+    )
+    return response_cache.put(
+        PERFORMANCES,
+        request,
+        ApiResponse[PageData[PerformanceListItem]],
+        ok(PageData(items=items, meta=meta)),
     )
 
 
 @router.get("/{performance_id}", response_model=PerformanceOut)
-def get_performance(
+async def get_performance(
     performance_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    performance = PerformanceRepository.get(db, performance_id)
-    if not performance:
+    """
+    ETag / Last-Modified = updated_at → 변경 없으면 본문 조회 없이 304
+    """
+    version = await AsyncPerformanceRepository.get_version(db, performance_id)
+    if not version:
         raise HTTPException(status_code=404, detail="공연 정보를 찾을 수 없습니다.")
-    return performance
+    etag, last_modified = version_etag("performance", performance_id, *version), latest(*version)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+
+    response = response_cache.get(PERFORMANCES, request, variant=etag)
+    if response is None:
+        performance = await AsyncPerformanceRepository.get(db, performance_id)
+        if not performance:
+            raise HTTPException(status_code=404, detail="공연 정보를 찾을 수 없습니다.")
+        response = response_cache.put(PERFORMANCES, request, PerformanceOut, performance, variant=etag)
+    set_validators(response, etag, last_modified)
+    return response
 
 
 @router.post("", response_model=PerformanceOut, status_code=status.HTTP_201_CREATED)
@@ -2,8 +2,13 @@ import json
 import logging
 from typing import Any, Dict
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect, status
+from starlette.concurrency import run_in_threadpool
 
+from app.dependencies.auth import authenticate_token
+from app.schemas.user import UserResponse
+from app.utils.exceptions import AppException
+from app.utils.websocket_manager import parse_topic
 from app.utils.ws import ws_manager
 
 router = APIRouter(
@@ -70,3 +75,67 @@ async def websocket_echo(websocket: WebSocket) -> None:
     except Exception:
         logger.exception("Unexpected WebSocket error")
         ws_manager.disconnect(websocket)
+
+
+def _can_subscribe(user: UserResponse, topic: str) -> bool:
+    # 동아리 topic은 소속 동아리만, 거래/공연 topic은 공개
+    prefix, _, entity_id = topic.partition(":")
+    if prefix == "club":
+        return user.club_id == int(entity_id)
+    return True
+
+
+@router.websocket("/notifications")
+async def websocket_notifications(
+    websocket: WebSocket,
+    token: str | None = Query(None),
+) -> None:
+    """
+    인증된 실시간 알림 엔드포인트 (브라우저 WebSocket은 헤더를 못 보내므로 ?token= 사용)
+
+    - 서버 → 클라이언트: NOTIFICATION (본인 알림만), topic 이벤트
+    - 클라이언트 → 서버:
+        {"type": "subscribe", "topic": "listing:3"}
+        {"type": "unsubscribe", "topic": "listing:3"}
+        topic prefix: club / listing / performance
+    """
+    try:
+        # 사용자 캐시 miss 시 동기 DB 조회 → 이벤트 루프를 막지 않도록 스레드풀에서
+        user = await run_in_threadpool(authenticate_token, token)
+    except AppException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await ws_manager.connect(websocket, user_id=user.id)
+
+    try:
+        while True:
+            try:
+                payload: Dict[str, Any] = json.loads(await websocket.receive_text())
+            except json.JSONDecodeError:
+                continue
+
+            msg_type = payload.get("type")
+            if msg_type not in ("subscribe", "unsubscribe"):
+                continue
+
+            topic = parse_topic(str(payload.get("topic", "")))
+            if topic is None or not _can_subscribe(user, topic):
+                await ws_manager.send_personal_json(
+                    websocket,
+                    {"type": "error", "payload": "구독할 수 없는 topic입니다."},
+                )
+                continue
+
+            if msg_type == "subscribe":
+                ws_manager.subscribe(websocket, topic)
+            else:
+                ws_manager.unsubscribe(websocket, topic)
+            await ws_manager.send_personal_json(websocket, {"type": msg_type, "topic": topic})
+
+    except WebSocketDisconnect:
+        ws_manager.disconnect(websocket)
+
+    except Exception:
+        logger.exception("Unexpected WebSocket error")
+        ws_manager.disconnect(websocket)
@@ -1,34 +1,40 @@
 from __future__ import annotations
 
 import json
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import or_
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.dependencies.auth import get_current_user
 from app.models.user import User, UserRole
 from app.schemas.common import ok
 
-from app.models.review import Review
-from app.repositories.review_repository import ReviewRepository
+from app.repositories.review_repository import (
+    LIST_FIELDS as REVIEW_LIST_FIELDS,
+    ReviewRepository,
+    AsyncReviewRepository,
+)
+from app.repositories.performance_repository import AsyncPerformanceRepository
+from app.repositories.user_repository import AsyncUserRepository
 from app.schemas.review import ReviewCreate, ReviewUpdate, ReviewOut
 
-from app.models.performance import Performance  # 공연 도메인
 from app.models.notification import NotificationType
 from app.services.notification_service import NotificationService
+from app.services.realtime_service import RealtimeService
+from app.utils.responses import json_ok
 
 
 router = APIRouter(tags=["Reviews"])
 
 
-def _is_admin_of_performance(user: User, performance: Performance) -> bool:
+def _is_admin_of_club(user: User, club_id: Optional[int]) -> bool:
     return (
         user.role == UserRole.ADMIN
         and user.club_id is not None
-        and user.club_id == performance.club_id
+        and user.club_id == club_id
     )
 
 
@@ -39,29 +45,25 @@ def _is_admin_of_performance(user: User, performance: Performance) -> bool:
 async def create_review(
     performance_id: int,
     data: ReviewCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    performance = db.query(Performance).filter(Performance.id == performance_id).first()
+    performance = await AsyncPerformanceRepository.get(db, performance_id)
     if not performance:
         raise HTTPException(status_code=404, detail="공연 정보를 찾을 수 없습니다.")
 
-    review = ReviewRepository.create(
-        db=db,
+    review = await AsyncReviewRepository.create(
+        db,
         performance_id=performance_id,
         author_user_id=current_user.id,
         content=data.content,
         is_public=data.is_public,
         rating=data.rating,
+        commit=False,
     )
 
     # 🔔 알림 발행: 해당 공연 동아리 관리자에게
-    admins: List[User] = (
-        db.query(User)
-        .filter(User.role == UserRole.ADMIN)
-        .filter(User.club_id == performance.club_id)
-        .all()
-    )
+    admins: List[User] = await AsyncUserRepository.list_club_admins(db, performance.club_id)
 
     payload = json.dumps(
         {
@@ -72,55 +74,55 @@ async def create_review(
         ensure_ascii=False,
     )
 
-    for admin in admins:
-        if admin.id == current_user.id:
-            continue
-
-        await NotificationService.notify_user(
-            db=db,
-            user_id=admin.id,
-            type=NotificationType.POST_COMMENT,
-            message="공연에 새로운 후기가 등록되었습니다.",
-            entity_id=performance.id,
-            payload=payload,
-        )
+    # 후기 + 알림 + outbox를 한 번에 commit (push는 백그라운드 dispatcher)
+    await NotificationService.notify_users_async(
+        db,
+        user_ids=[admin.id for admin in admins if admin.id != current_user.id],
+        type=NotificationType.POST_COMMENT,
+        message="공연에 새로운 후기가 등록되었습니다.",
+        entity_id=performance.id,
+        payload=payload,
+    )
 
+    if review.is_public:
+        await RealtimeService.publish(
+            f"performance:{performance_id}", "review.created", {"review_id": review.id}
+        )
     return ok(ReviewOut.model_validate(review))
 
 
 @router.get("/performances/{performance_id}/reviews")
-def list_reviews(
+async def list_reviews(
     performance_id: int,
-    db: Session = Depends(get_db),
+    page: int = Query(1, ge=1),
+    size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="이전 응답 meta.next_cursor (있으면 page 무시)"),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    performance = db.query(Performance).filter(Performance.id == performance_id).first()
-    if not performance:
+    exists, club_id = await AsyncPerformanceRepository.get_owner(db, performance_id)
+    if not exists:
         raise HTTPException(status_code=404, detail="공연 정보를 찾을 수 없습니다.")
 
-    q = db.query(Review).filter(Review.performance_id == performance_id)
-
-    if _is_admin_of_performance(current_user, performance):
-        reviews = q.order_by(Review.created_at.desc()).all()
-    else:
-        reviews = (
-            q.filter(
-                or_(
-                    Review.is_public == True,  # noqa: E712
-                    Review.author_user_id == current_user.id,
-                )
-            )
-            .order_by(Review.created_at.desc())
-            .all()
-        )
+    rows, meta = await AsyncReviewRepository.list_for_performance(
+        db,
+        performance_id=performance_id,
+        viewer_user_id=current_user.id,
+        include_private=_is_admin_of_club(current_user, club_id),
+        page=page,
+        size=size,
+        cursor=cursor,
+    )
 
-    return ok([ReviewOut.model_validate(r) for r in reviews])
+    items = [dict(zip(REVIEW_LIST_FIELDS, row)) for row in rows]
+    return json_ok({"items": items, "meta": meta})
 
 
 @router.patch("/reviews/{review_id}")
 def update_review(
     review_id: int,
     data: ReviewUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -134,6 +136,7 @@ def update_review(
             detail="작성자만 수정할 수 있습니다.",
         )
 
+    was_public = review.is_public
     if data.content is not None:
         review.content = data.content
     if data.is_public is not None:
@@ -142,12 +145,21 @@ def update_review(
         review.rating = data.rating
 
     review = ReviewRepository.update(db, review)
+    # 공개 → 비공개 전환도 목록에서 빠지므로 알림
+    if review.is_public or was_public:
+        RealtimeService.publish_later(
+            background_tasks,
+            f"performance:{review.performance_id}",
+            "review.updated",
+            {"review_id": review.id},
+        )
     return ok(ReviewOut.model_validate(review))
 
 
 @router.delete("/reviews/{review_id}")
 def delete_review(
     review_id: int,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -161,5 +173,10 @@ def delete_review(
             detail="작성자만 삭제할 수 있습니다.",
         )
 
+    performance_id, was_public = review.performance_id, review.is_public
     ReviewRepository.delete(db, review)
+    if was_public:
+        RealtimeService.publish_later(
+            background_tasks, f"performance:{performance_id}", "review.deleted", {"review_id": review_id}
+        )
     return ok({"message": "삭제되었습니다."})
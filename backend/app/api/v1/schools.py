@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_async_db
 from app.schemas.school import SchoolListItem
 from app.schemas.club import ClubListItem
 from app.schemas.common import ApiResponse, PageData, ok
-from app.repositories.school_repository import SchoolRepository
+from app.repositories.school_repository import AsyncSchoolRepository
+from app.utils.response_cache import SCHOOLS, response_cache
 
 router = APIRouter(prefix="/schools", tags=["Schools"])
 
@@ -14,26 +15,33 @@ router = APIRouter(prefix="/schools", tags=["Schools"])
     "",
     response_model=ApiResponse[PageData[SchoolListItem]],
 )
-def get_schools(
+async def get_schools(
+    request: Request,
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
     keyword: str | None = None,
     sort: str | None = None,
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(None, description="이전 응답의 meta.next_cursor (지정 시 page 무시)"),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    items, meta = SchoolRepository.list_schools(
-        db=db,
+    cached = response_cache.get(SCHOOLS, request)
+    if cached is not None:
+        return cached
+
+    items, meta = await AsyncSchoolRepository.list_schools(
+        db,
         page=page,
         size=size,
         keyword=keyword,
         sort=sort,
+        cursor=cursor,
     )
 
-    return ok(
-        PageData(
-            items=items,
-            meta=meta,
-        )
+    return response_cache.put(
+        SCHOOLS,
+        request,
+        ApiResponse[PageData[SchoolListItem]],
+        ok(PageData(items=items, meta=meta)),
     )
 
 
@@ -41,27 +49,34 @@ def get_schools(
     "/{school_id}/clubs",
     response_model=ApiResponse[PageData[ClubListItem]],
 )
-def get_school_clubs(
+async def get_school_clubs(
     school_id: int,
+    request: Request,
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
     keyword: str | None = None,
     sort: str | None = None,
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(None, description="이전 응답의 meta.next_cursor (지정 시 page 무시)"),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    items, meta = SchoolRepository.list_clubs_by_school(
-        db=db,
+    cached = response_cache.get(SCHOOLS, request)
+    if cached is not None:
+        return cached
+
+    items, meta = await AsyncSchoolRepository.list_clubs_by_school(
+        db,
         school_id=school_id,
         page=page,
         size=size,
         keyword=keyword,
         sort=sort,
+        cursor=cursor,
     )
 
-    return ok(
-        PageData(
-            items=items,
-            meta=meta,
-        )
+    return response_cache.put(
+        SCHOOLS,
+        request,
+        ApiResponse[PageData[ClubListItem]],
+        ok(PageData(items=items, meta=meta)),
     )
 
@@ -1,7 +1,11 @@
-from fastapi import APIRouter, Depends, Query, HTTPException
+from datetime import datetime, timedelta, timezone
+from typing import Literal, Optional
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.schemas.common import ApiResponse, PageData, ok, created
 from app.schemas.trade import (
     TradeListItem,
@@ -9,98 +13,138 @@ from app.schemas.trade import (
     ReserveCreate,
     ReservationOut,
     ReservationCalendarRange,
+    ReservationAvailability,
+    ReservationMonthBucket,
+    TimeWindow,
 )
-from app.repositories.trade_repository import TradeRepository
+from app.schemas.tag import TagFacet
+from app.repositories.trade_repository import LIST_FIELDS, TradeRepository, AsyncTradeRepository
 from app.models.trade_listing import TradeType
 from app.models.trade_reservation import TradeReservation
 from app.models.user import User
 from app.dependencies.auth import get_current_user  # 프로젝트 기존 함수명 기준
+from app.services.realtime_service import RealtimeService
+from app.utils.http_cache import (
+    compute_etag,
+    is_not_modified,
+    latest,
+    not_modified_response,
+    set_validators,
+    version_etag,
+)
+from app.utils.responses import json_ok
+from app.utils.response_cache import TRADE, response_cache
 
 
 router = APIRouter(prefix="/trade", tags=["Trade"])
 
 
 @router.get("/list", response_model=ApiResponse[PageData[TradeListItem]])
-def list_trade(
+async def list_trade(
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
     keyword: str | None = None,
     trade_type: TradeType | None = None,
     category: str | None = None,
-    tag: str | None = None,
+    tag: str | None = Query(None, description="태그 정확 일치, 콤마로 여러 개 지정"),
+    tag_mode: Literal["any", "all"] = Query("any", description="any: 하나라도 포함 / all: 모두 포함"),
     price_min: int | None = Query(None, ge=0),
     price_max: int | None = Query(None, ge=0),
     sort: str | None = None,
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(
+        None,
+        description="이전 응답의 meta.next_cursor (지정 시 page 무시). "
+        "keyword만 있고 sort가 없으면 관련도순이라 cursor 미지원 (next_cursor=null, 지정 시 400)",
+    ),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    rows, meta = TradeRepository.list(
-        db=db,
+    rows, meta = await AsyncTradeRepository.list(
+        db,
         page=page,
         size=size,
         keyword=keyword,
         trade_type=trade_type,
         category=category,
         tag=tag,
+        tag_mode=tag_mode,
         price_min=price_min,
         price_max=price_max,
         sort=sort,
+        cursor=cursor,
     )
 
-    # rows: [(TradeListing, InventoryItem), ...]
-    items: list[TradeListItem] = []
-    for listing, inv in rows:
-        items.append(
-            TradeListItem(
+    # rows: LIST_COLUMNS 순서의 컬럼 tuple → TradeListItem 모양 dict (행마다 모델 생성/검증 없음)
+    items = [dict(zip(LIST_FIELDS, row)) for row in rows]
+    return json_ok({"items": items, "meta": meta})
+
+
+@router.get("/tags", response_model=ApiResponse[list[TagFacet]])
+async def list_trade_tag_facets(
+    limit: int = Query(30, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db),
+):
+    rows = await AsyncTradeRepository.tag_facets(db, limit)
+    return ok([TagFacet(tag=tag, count=count) for tag, count in rows])
+
+
+@router.get("/{listing_id}", response_model=ApiResponse[TradeDetail])
+async def get_trade_detail(
+    listing_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    ETag / Last-Modified = 게시물·물품 updated_at → 변경 없으면 본문 조회 없이 304
+    """
+    version = await AsyncTradeRepository.get_version(db, listing_id)
+    if not version:
+        raise HTTPException(status_code=404, detail="거래 게시물을 찾을 수 없습니다.")
+    etag, last_modified = version_etag("trade", listing_id, *version), latest(*version)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+
+    response = response_cache.get(TRADE, request, variant=etag)
+    if response is None:
+        response = await _trade_detail_response(db, listing_id, request, etag)
+    set_validators(response, etag, last_modified)
+    return response
+
+
+async def _trade_detail_response(db: AsyncSession, listing_id: int, request: Request, etag: str) -> Response:
+    row = await AsyncTradeRepository.get_detail(db, listing_id)
+    if not row:
+        raise HTTPException(status_code=404, detail="거래 게시물을 찾을 수 없습니다.")
+
+    listing, inv = row
+
+    return response_cache.put(
+        TRADE,
+        request,
+        ApiResponse[TradeDetail],
+        ok(
+            TradeDetail(
                 id=listing.id,
                 trade_type=listing.trade_type,
                 price=listing.price,
                 deposit=listing.deposit,
                 is_public=listing.is_public,
+                title=listing.title,
+                description=listing.description,
                 item_id=inv.id,
                 club_id=inv.club_id,
                 name=inv.name,
                 category=inv.category,
                 tags=inv.tags,
+                size=inv.size,
+                contact=inv.contact,
                 image_path=inv.image_path,
+                purchased_at=inv.purchased_at,
+                status=str(inv.status),
+                is_deal_done=inv.is_deal_done,
+                item_description=inv.description,
             )
-        )
-
-    return ok(PageData(items=items, meta=meta))
-
-
-@router.get("/{listing_id}", response_model=ApiResponse[TradeDetail])
-def get_trade_detail(
-    listing_id: int,
-    db: Session = Depends(get_db),
-):
-    row = TradeRepository.get_detail(db, listing_id)
-    if not row:
-        raise HTTPException(status_code=404, detail="거래 게시물을 찾을 수 없습니다.")
-
-    listing, inv = row
-
-    return ok(
-        TradeDetail(
-            id=listing.id,
-            trade_type=listing.trade_type,
-            price=listing.price,
-            deposit=listing.deposit,
-            is_public=listing.is_public,
-            title=listing.title,
-            description=listing.description,
-            item_id=inv.id,
-            club_id=inv.club_id,
-            name=inv.name,
-            category=inv.category,
-            tags=inv.tags,
-            size=inv.size,
-            contact=inv.contact,
-            image_path=inv.image_path,
-            purchased_at=inv.purchased_at,
-            status=str(inv.status),
-            is_deal_done=inv.is_deal_done,
-            item_description=inv.description,
-        )
+        ),
+        variant=etag,
     )
 
 
@@ -108,6 +152,7 @@ def get_trade_detail(
 def reserve_trade(
     listing_id: int,
     payload: ReserveCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),  # 로그인 필수
 ):
@@ -128,6 +173,7 @@ def reserve_trade(
             raise HTTPException(status_code=400, detail="종료 시간이 시작 시간보다 빠를 수 없습니다.")
 
     # SELL인 경우 기간 없어도 됨 (None 허용)
+    # 기간 겹침은 create_reservation에서 검사 (겹치면 409)
 
     reservation = TradeReservation(
         listing_id=listing.id,
@@ -139,28 +185,161 @@ def reserve_trade(
     )
 
     saved = TradeRepository.create_reservation(db, reservation)
+
+    # 예약 달력 갱신용 (listing: 공개 정보만, club: 소속 동아리에는 예약자까지)
+    event = {
+        "listing_id": listing.id,
+        "reservation_id": saved.id,
+        "trade_type": saved.trade_type.value,
+        "start_at": saved.start_at.isoformat() if saved.start_at else None,
+        "end_at": saved.end_at.isoformat() if saved.end_at else None,
+    }
+    RealtimeService.publish_later(background_tasks, f"listing:{listing.id}", "reservation.created", event)
+    RealtimeService.publish_later(
+        background_tasks, f"club:{inv.club_id}", "reservation.created", {**event, "user_id": user.id}
+    )
     return created(saved)
 
 
+AVAILABILITY_MAX_DAYS = 366
+CALENDAR_DEFAULT_MONTHS = 3
+CALENDAR_MAX_MONTHS = 12
+
+
+def _naive_utc(value: datetime) -> datetime:
+    # DB에는 naive(UTC) datetime 저장
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _month_start(value: datetime) -> datetime:
+    return datetime(value.year, value.month, 1)
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    index = value.year * 12 + value.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def _parse_month(value: Optional[str]) -> datetime:
+    if value is None:
+        return _month_start(datetime.utcnow())
+    try:
+        return datetime.strptime(value, "%Y-%m")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="월은 YYYY-MM 형식이어야 합니다.")
+
+
+def _calendar_range(r) -> ReservationCalendarRange:
+    return ReservationCalendarRange(
+        start_at=r.start_at,
+        end_at=r.end_at,
+        trade_type=r.trade_type,
+        status=r.status,
+    )
+
+
 @router.get("/{listing_id}/reservations", response_model=ApiResponse[list[ReservationCalendarRange]])
-def get_trade_reservations_calendar(
+async def get_trade_reservations_calendar(
     listing_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    from_at: Optional[datetime] = Query(None, alias="from", description="기본: 이번 달 1일"),
+    to_at: Optional[datetime] = Query(None, alias="to", description=f"기본: from + {CALENDAR_DEFAULT_MONTHS}개월"),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    # 달력용: 날짜 범위 리스트 형태로 내려줌
-    res = TradeRepository.list_reservations(db, listing_id)
-    ranges = [
-        ReservationCalendarRange(
-            start_at=r.start_at,
-            end_at=r.end_at,
-            trade_type=r.trade_type,
-            status=r.status,
-        )
-        for r in res
-    ]
+    """
+    달력용: [from, to) 구간에 걸친 예약 기간 목록.
+    ETag / Last-Modified 지원 → 변경 없는 구간은 304
+    """
+    from_at = _naive_utc(from_at) if from_at else _month_start(datetime.utcnow())
+    to_at = _naive_utc(to_at) if to_at else _add_months(from_at, CALENDAR_DEFAULT_MONTHS)
+    if to_at <= from_at:
+        raise HTTPException(status_code=400, detail="종료 시간이 시작 시간보다 빠를 수 없습니다.")
+    if to_at - from_at > timedelta(days=AVAILABILITY_MAX_DAYS):
+        raise HTTPException(status_code=400, detail=f"조회 기간은 최대 {AVAILABILITY_MAX_DAYS}일입니다.")
+
+    res, last_modified = await AsyncTradeRepository.list_reservations(
+        db, listing_id=listing_id, start_at=from_at, end_at=to_at
+    )
+    ranges = [_calendar_range(r) for r in res]
+
+    etag = compute_etag([r.model_dump(mode="json") for r in ranges])
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    set_validators(response, etag, last_modified)
     return ok(ranges)
 
 
+@router.get(
+    "/{listing_id}/reservations/monthly",
+    response_model=ApiResponse[list[ReservationMonthBucket]],
+)
+async def get_trade_reservations_monthly(
+    listing_id: int,
+    request: Request,
+    response: Response,
+    from_month: Optional[str] = Query(None, description="YYYY-MM (기본: 이번 달)"),
+    months: int = Query(CALENDAR_DEFAULT_MONTHS, ge=1, le=CALENDAR_MAX_MONTHS),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    달력용 월 단위 묶음: 월별 예약 건수 + 그 달에 걸친 예약 기간.
+    (여러 달에 걸친 예약은 해당하는 각 달에 포함)
+    """
+    start = _parse_month(from_month)
+    end = _add_months(start, months)
+
+    res, last_modified = await AsyncTradeRepository.list_reservations(
+        db, listing_id=listing_id, start_at=start, end_at=end
+    )
+
+    buckets = []
+    for i in range(months):
+        month_start, month_end = _add_months(start, i), _add_months(start, i + 1)
+        ranges = [_calendar_range(r) for r in res if r.start_at < month_end and r.end_at > month_start]
+        buckets.append(
+            ReservationMonthBucket(month=month_start.strftime("%Y-%m"), count=len(ranges), ranges=ranges)
+        )
+
+    etag = compute_etag([b.model_dump(mode="json") for b in buckets])
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    set_validators(response, etag, last_modified)
+    return ok(buckets)
+
+
+@router.get("/{listing_id}/availability", response_model=ApiResponse[ReservationAvailability])
+async def get_trade_availability(
+    listing_id: int,
+    from_at: datetime = Query(..., alias="from"),
+    to_at: datetime = Query(..., alias="to"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    [from, to) 구간의 예약된 구간(busy)과 빈 구간(free)
+    """
+    from_at, to_at = _naive_utc(from_at), _naive_utc(to_at)
+    if to_at <= from_at:
+        raise HTTPException(status_code=400, detail="종료 시간이 시작 시간보다 빠를 수 없습니다.")
+    if to_at - from_at > timedelta(days=AVAILABILITY_MAX_DAYS):
+        raise HTTPException(status_code=400, detail=f"조회 기간은 최대 {AVAILABILITY_MAX_DAYS}일입니다.")
+
+    busy, free = await AsyncTradeRepository.availability(
+        db, listing_id=listing_id, start_at=from_at, end_at=to_at
+    )
+    return ok(
+        ReservationAvailability(
+            listing_id=listing_id,
+            from_at=from_at,
+            to_at=to_at,
+            busy=[TimeWindow(start_at=s, end_at=e) for s, e in busy],
+            free=[TimeWindow(start_at=s, end_at=e) for s, e in free],
+        )
+    )
+
+
 # TODO: 본인 예약 조회/취소 스펙(후속)
 # - GET /api/v1/me/reservations
 # - DELETE /api/v1/trade/reservations/{reservation_id}
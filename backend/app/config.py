@@ -10,6 +10,19 @@ load_dotenv(dotenv_path=env_path)
 class Settings:
     ENV: str = os.getenv("ENV", "local")
     DATABASE_URL: str = os.getenv("DATABASE_URL")
+    # 비워두면 DATABASE_URL에서 async 드라이버 URL을 유도
+    ASYNC_DATABASE_URL: str | None = os.getenv("ASYNC_DATABASE_URL") or None
+
+    # DB 커넥션 풀 (워커 프로세스당)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    # 초 단위, -1이면 재활용 안 함
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    # 체크아웃 대기가 이 값(ms) 이상이면 경고 로그
+    DB_POOL_SLOW_CHECKOUT_MS: float = float(os.getenv("DB_POOL_SLOW_CHECKOUT_MS", "100"))
+    DB_ECHO: bool = os.getenv("DB_ECHO", "true" if os.getenv("ENV", "local") == "local" else "false").lower() == "true"
     SECRET_KEY: str = os.getenv("SECRET_KEY", "change_me_later")
 
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
@@ -17,6 +30,64 @@ class Settings:
 
     ADMIN_SIGNUP_CODE: str = os.getenv("ADMIN_SIGNUP_CODE", "CHANGE_ME")
 
+    # 페이지네이션 total 계산 전략: exact | cached | estimate
+    PAGINATION_COUNT_STRATEGY: str = os.getenv("PAGINATION_COUNT_STRATEGY", "exact")
+    TRADE_LIST_COUNT_STRATEGY: str = os.getenv("TRADE_LIST_COUNT_STRATEGY", "cached")
+    COUNT_CACHE_TTL_SECONDS: float = float(os.getenv("COUNT_CACHE_TTL_SECONDS", "30"))
+    # planner 추정치가 이 값보다 작으면 정확히 COUNT
+    COUNT_ESTIMATE_THRESHOLD: int = int(os.getenv("COUNT_ESTIMATE_THRESHOLD", "1000"))
+
+    # 캐시 (memory | redis)
+    CACHE_BACKEND: str = os.getenv("CACHE_BACKEND", "memory")
+    REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    REDIS_SOCKET_TIMEOUT: float = float(os.getenv("REDIS_SOCKET_TIMEOUT", "0.5"))
+
+    # 인증: 토큰 디코드 / 사용자 조회 캐시
+    AUTH_USER_CACHE_TTL_SECONDS: float = float(os.getenv("AUTH_USER_CACHE_TTL_SECONDS", "60"))
+    AUTH_USER_CACHE_MAX_ENTRIES: int = int(os.getenv("AUTH_USER_CACHE_MAX_ENTRIES", "10000"))
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = int(os.getenv("AUTH_TOKEN_CACHE_MAX_ENTRIES", "10000"))
+
+    # 공개 조회(GET) 응답 캐시: 공연 / 거래 상세 / 학교·동아리 (쓰기 시 그룹 단위 무효화)
+    RESPONSE_CACHE_ENABLED: bool = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+    RESPONSE_CACHE_TTL_SECONDS: float = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "60"))
+    RESPONSE_CACHE_MAX_ENTRIES: int = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "2000"))
+
+    # 공연 존재/소유 동아리 캐시 (후기 목록 권한 확인용, 공연 수정/삭제 시 무효화)
+    PERFORMANCE_OWNER_CACHE_TTL_SECONDS: float = float(os.getenv("PERFORMANCE_OWNER_CACHE_TTL_SECONDS", "300"))
+    PERFORMANCE_OWNER_CACHE_MAX_ENTRIES: int = int(os.getenv("PERFORMANCE_OWNER_CACHE_MAX_ENTRIES", "10000"))
+
+    # 응답 압축: 서버 선호 순서(br | gzip, br은 brotli 패키지 필요) / 최소 크기(bytes) / 대상 content-type(접두사)
+    COMPRESSION_ENABLED: bool = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    COMPRESSION_ALGORITHMS: list[str] = os.getenv("COMPRESSION_ALGORITHMS", "br,gzip").split(",")
+    COMPRESSION_MIN_SIZE: int = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+    COMPRESSION_GZIP_LEVEL: int = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+    COMPRESSION_BROTLI_QUALITY: int = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+    COMPRESSION_CONTENT_TYPES: list[str] = os.getenv("COMPRESSION_CONTENT_TYPES", "application/json,text/").split(",")
+
+    # 물품 키워드 검색: auto(DB별 검색 인덱스) | like(기존 ILIKE)
+    SEARCH_BACKEND: str = os.getenv("SEARCH_BACKEND", "auto")
+
+    # WebSocket 전송: 연결별 송신 큐 크기 / 느린 클라이언트 정책(drop_oldest | disconnect)
+    WS_SEND_QUEUE_SIZE: int = int(os.getenv("WS_SEND_QUEUE_SIZE", "100"))
+    WS_SLOW_CONSUMER_POLICY: str = os.getenv("WS_SLOW_CONSUMER_POLICY", "drop_oldest")
+    WS_SEND_TIMEOUT_SECONDS: float = float(os.getenv("WS_SEND_TIMEOUT_SECONDS", "5"))
+    # 워커 간 실시간 메시지 중계: memory(단일 워커) | redis | postgres(LISTEN/NOTIFY)
+    WS_BROKER_BACKEND: str = os.getenv("WS_BROKER_BACKEND", "memory")
+    WS_BROKER_CHANNEL: str = os.getenv("WS_BROKER_CHANNEL", "replay:ws")
+
+    # 알림 outbox dispatcher
+    NOTIFICATION_DISPATCHER_ENABLED: bool = os.getenv("NOTIFICATION_DISPATCHER_ENABLED", "true").lower() == "true"
+    NOTIFICATION_DISPATCH_INTERVAL_SECONDS: float = float(os.getenv("NOTIFICATION_DISPATCH_INTERVAL_SECONDS", "1"))
+    NOTIFICATION_DISPATCH_BATCH_SIZE: int = int(os.getenv("NOTIFICATION_DISPATCH_BATCH_SIZE", "200"))
+    NOTIFICATION_DISPATCH_MAX_ATTEMPTS: int = int(os.getenv("NOTIFICATION_DISPATCH_MAX_ATTEMPTS", "5"))
+    NOTIFICATION_DISPATCH_RETRY_BASE_SECONDS: float = float(os.getenv("NOTIFICATION_DISPATCH_RETRY_BASE_SECONDS", "2"))
+
+    # 알림 보존: 읽은 알림은 N일 후 notifications_archive로 이동 (app/scripts/archive_notifications.py)
+    NOTIFICATION_RETENTION_DAYS: int = int(os.getenv("NOTIFICATION_RETENTION_DAYS", "90"))
+    NOTIFICATION_ARCHIVE_BATCH_SIZE: int = int(os.getenv("NOTIFICATION_ARCHIVE_BATCH_SIZE", "1000"))
+    # 보관 테이블에서도 N일 후 삭제 (0이면 계속 보관)
+    NOTIFICATION_ARCHIVE_RETENTION_DAYS: int = int(os.getenv("NOTIFICATION_ARCHIVE_RETENTION_DAYS", "0"))
+
     @property
     def is_local(self) -> bool:
         return self.ENV == "local"
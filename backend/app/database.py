@@ -1,7 +1,11 @@
-from sqlalchemy import create_engine, text
+from functools import lru_cache
+
+from sqlalchemy import create_engine, make_url, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 
 from app.config import settings
+from app.utils.db_pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool
 
 # --------------------------------------------------------------------
 # 1. DATABASE_URL 검증
@@ -14,11 +18,35 @@ if not getattr(settings, "DATABASE_URL", None):
 # --------------------------------------------------------------------
 is_dev = getattr(settings, "ENV", "production") != "production"
 
+
+def _pool_kwargs(url: str, async_: bool = False) -> dict:
+    """
+    풀 설정 (settings.DB_POOL_*)
+    - pre_ping 대신 recycle 기반 liveness를 쓰려면 DB_POOL_PRE_PING=false + DB_POOL_RECYCLE 설정
+      (pre_ping은 체크아웃마다 왕복 1회 추가)
+    - SQLite는 드라이버 기본 풀 사용
+    """
+    kwargs = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "echo": settings.DB_ECHO,
+    }
+    if make_url(url).get_backend_name() == "sqlite":
+        return kwargs
+
+    kwargs.update(
+        poolclass=InstrumentedAsyncQueuePool if async_ else InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+    return kwargs
+
+
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    echo=is_dev,
     future=True,
+    **_pool_kwargs(settings.DATABASE_URL),
 )
 
 SessionLocal = sessionmaker(
@@ -46,7 +74,64 @@ def get_db():
 
 
 # --------------------------------------------------------------------
-# 5. (선택) DB 연결 테스트 함수
+# 5. Async Engine / Session (asyncpg / aiomysql / aiosqlite)
+# --------------------------------------------------------------------
+# 동기 드라이버 URL → async 드라이버 URL (ASYNC_DATABASE_URL로 직접 지정 가능)
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url() -> str:
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+
+    url = make_url(settings.DATABASE_URL)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{backend}'. Set ASYNC_DATABASE_URL.")
+
+    query = dict(url.query)
+    # psycopg2의 sslmode → asyncpg의 ssl
+    if backend == "postgresql" and "sslmode" in query:
+        query["ssl"] = query.pop("sslmode")
+
+    return url.set(drivername=ASYNC_DRIVERS[backend], query=query).render_as_string(
+        hide_password=False
+    )
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    # async 드라이버는 실제로 사용할 때 로딩 (동기 경로만 쓰는 스크립트/alembic에 영향 없음)
+    url = get_async_database_url()
+    return create_async_engine(url, **_pool_kwargs(url, async_=True))
+
+
+@lru_cache
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        autoflush=False,
+        expire_on_commit=False,
+        class_=AsyncSession,
+    )
+
+
+async def get_async_db():
+    """
+    FastAPI Dependency - AsyncSession
+    동기 repository 로직은 `await db.run_sync(Repository.method, ...)` 로 재사용한다.
+    (greenlet 위에서 async 드라이버로 실행되므로 threadpool을 점유하지 않음)
+    """
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+# --------------------------------------------------------------------
+# 6. (선택) DB 연결 테스트 함수
 # --------------------------------------------------------------------
 def check_db_connection() -> None:
     """
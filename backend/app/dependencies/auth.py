@@ -1,35 +1,119 @@
+import hashlib
+import time
+
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 from jose import JWTError, ExpiredSignatureError
 
-from app.database import get_db
+from app.config import settings
+from app.database import SessionLocal
 from app.services.user_service import UserService
-from app.utils.security import decode_token
+from app.utils.cache import build_cache
+from app.utils.security import TokenPayload, decode_token
 from app.utils.exceptions import (
     UnauthorizedException,
     NotFoundException,
     ForbiddenException,
 )
-from app.models.user import UserRole
+from app.models.user import User, UserRole
 from app.schemas.user import UserResponse
 
 security = HTTPBearer(auto_error=False)
 
+# --------------------------------------------------------------------
+# 캐시
+# - 토큰: sha256(token) → TokenPayload (프로세스 메모리, 토큰 만료 시각까지)
+# - 사용자: user_id → UserResponse dict (CACHE_BACKEND에 따라 메모리/Redis 공유)
+# --------------------------------------------------------------------
+_token_cache = build_cache(
+    "auth:token",
+    max_entries=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    shared=False,
+)
+_user_cache = build_cache(
+    "auth:user",
+    max_entries=settings.AUTH_USER_CACHE_MAX_ENTRIES,
+    ttl=settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
 
-def get_current_user(
-    creds: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-) -> UserResponse:
+
+# 커밋 후 캐시에서 지울 user_id (Session.info)
+_PENDING_USERS_KEY = "auth_user_cache_invalidate"
+
+
+def invalidate_user_cache(user_id: int) -> None:
     """
-    Authorization: Bearer <token> → 토큰 검증 → 사용자 조회
+    프로필/권한 변경 시 호출. (ORM으로 User를 수정하면 commit 후 자동 호출됨)
     """
-    if creds is None or not creds.credentials:
+    _user_cache.delete(str(user_id))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_user_writes(session: Session, flush_context) -> None:
+    # flush 시점에 지우면 commit 전에 다른 요청이 이전 값을 다시 캐시할 수 있으므로 모아 두기만 함
+    user_ids = {
+        obj.id
+        for obj in (*session.dirty, *session.deleted)
+        if isinstance(obj, User) and obj.id is not None
+    }
+    if user_ids:
+        session.info.setdefault(_PENDING_USERS_KEY, set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_users_after_commit(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_USERS_KEY, ()):
+        invalidate_user_cache(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_user_writes(session: Session) -> None:
+    session.info.pop(_PENDING_USERS_KEY, None)
+
+
+def _decode_cached(token: str) -> TokenPayload:
+    key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    payload = _token_cache.get(key)
+    if payload is not None and payload.exp > time.time():
+        return payload
+
+    # 만료/서명 오류는 decode_token에서 예외로 처리됨
+    payload = decode_token(token)
+    _token_cache.set(key, payload, ttl=payload.exp - time.time())
+    return payload
+
+
+def _load_user(user_id: int) -> UserResponse:
+    cached = _user_cache.get(str(user_id))
+    if cached is not None:
+        return UserResponse.model_validate(cached)
+
+    # 캐시 miss일 때만 DB 세션을 엶
+    db = SessionLocal()
+    try:
+        user = UserService().get_user_by_id(db, user_id)
+        if not user:
+            raise NotFoundException("사용자를 찾을 수 없습니다.")
+        result = UserResponse.model_validate(user, from_attributes=True)
+    finally:
+        db.close()
+
+    _user_cache.set(str(user_id), result.model_dump(mode="json"))
+    return result
+
+
+def authenticate_token(token: str | None) -> UserResponse:
+    """
+    토큰 검증 → 사용자 조회 (둘 다 캐시). WebSocket 등 Depends 밖에서도 사용.
+    """
+    if not token:
         raise UnauthorizedException("로그인이 필요합니다.")
 
-    token = creds.credentials
     try:
-        payload = decode_token(token)
+        payload = _decode_cached(token)
     except ExpiredSignatureError:
         raise UnauthorizedException("토큰이 만료되었습니다.")
     except JWTError:
@@ -37,11 +121,19 @@ def get_current_user(
 
     user_id = int(payload.sub)
 
-    user = UserService().get_user_by_id(db, user_id)
-    if not user:
-        raise NotFoundException("사용자를 찾을 수 없습니다.")
+    return _load_user(user_id)
+
+
+def get_current_user(
+    creds: HTTPAuthorizationCredentials = Depends(security),
+) -> UserResponse:
+    """
+    Authorization: Bearer <token> → 토큰 검증 → 사용자 조회
+    """
+    if creds is None or not creds.credentials:
+        raise UnauthorizedException("로그인이 필요합니다.")
 
-    return UserResponse.model_validate(user, from_attributes=True)
+    return authenticate_token(creds.credentials)
 
 
 def require_admin(
@@ -1,5 +1,6 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import HTTPException
 
@@ -7,11 +8,17 @@ from app.config import settings
 from app.api.v1.router import api_router
 from app.api.v1 import realtime
 
-from app.schemas.common import fail
+from app.schemas.common import ok
 from app.utils.exceptions import AppException
+from app.utils.compression import CompressionMiddleware
+from app.utils.db_pool import pool_stats
+from app.utils.responses import DEFAULT_RESPONSE_CLASS, json_fail
+from app.utils.response_cache import response_cache
+from app.utils.ws import ws_manager
+from app.services.notification_dispatcher import notification_dispatcher
 
 import sqlalchemy as sa
-from app.database import engine
+from app.database import engine, get_async_engine
 
 
 tags_metadata = [
@@ -21,11 +28,27 @@ tags_metadata = [
     },
 ]
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 워커 간 WebSocket 메시지 중계 (WS_BROKER_BACKEND)
+    await ws_manager.start()
+    # 알림 outbox → WebSocket push (요청 경로 밖에서)
+    if settings.NOTIFICATION_DISPATCHER_ENABLED:
+        await notification_dispatcher.start()
+    try:
+        yield
+    finally:
+        await notification_dispatcher.stop()
+        await ws_manager.stop()
+
+
 app = FastAPI(
     title="RePlay API",
     description="연극/영화 소품 중고거래 플랫폼 Re;Play 백엔드 API",
     version="0.1.0",
     openapi_tags=tags_metadata,
+    lifespan=lifespan,
+    default_response_class=DEFAULT_RESPONSE_CLASS,
 )
 
 
@@ -34,10 +57,7 @@ app = FastAPI(
 # -----------------------------
 @app.exception_handler(AppException)
 async def app_exception_handler(request: Request, exc: AppException):
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=fail(exc.code, exc.message).dict(),
-    )
+    return json_fail(exc.code, exc.message, exc.status_code)
 
 
 # -----------------------------
@@ -45,10 +65,7 @@ async def app_exception_handler(request: Request, exc: AppException):
 # -----------------------------
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=fail("HTTP_ERROR", exc.detail).dict(),
-    )
+    return json_fail("HTTP_ERROR", exc.detail, exc.status_code)
 
 
 # -----------------------------
@@ -78,6 +95,57 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# -----------------------------
+# 응답 압축 (br / gzip)
+# -----------------------------
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        algorithms=settings.COMPRESSION_ALGORITHMS,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        content_types=settings.COMPRESSION_CONTENT_TYPES,
+    )
+
+# -----------------------------
+# Health
+# -----------------------------
+@app.get("/health/db-pool", tags=["health"])
+def db_pool_health():
+    """
+    커넥션 풀 사용량(checked_out/overflow)과 체크아웃 대기시간 통계
+    """
+    data = {"sync": pool_stats(engine.pool)}
+    if get_async_engine.cache_info().currsize:
+        data["async"] = pool_stats(get_async_engine().pool)
+    return ok(data)
+
+
+@app.get("/health/websocket", tags=["health"])
+def websocket_health():
+    """
+    WebSocket 연결 수, 송신 큐 깊이, 전송 지연/드롭 통계
+    """
+    return ok(ws_manager.stats())
+
+
+@app.get("/health/notification-outbox", tags=["health"])
+async def notification_outbox_health():
+    """
+    알림 outbox 대기 건수 / 가장 오래된 대기 시간(lag) / 전송·재시도 통계
+    """
+    return ok(await notification_dispatcher.stats())
+
+
+@app.get("/health/response-cache", tags=["health"])
+def response_cache_health():
+    """
+    공개 조회 응답 캐시 그룹별 hit/miss/무효화 횟수
+    """
+    return ok(response_cache.stats())
+
+
 # -----------------------------
 # Router 등록
 # -----------------------------
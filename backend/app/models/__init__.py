@@ -9,5 +9,10 @@ from .trade_listing import TradeListing
 from .trade_reservation import TradeReservation
 from .community_post import CommunityPost
 from .performance import Performance
+from .performance_rating import PerformanceRating
 from .notification import Notification
-from .review import Review
\ No newline at end of file
+from .notification_outbox import NotificationOutbox
+from .notification_counter import NotificationCounter
+from .notification_archive import notifications_archive
+from .review import Review
+from .tag import item_tags, post_tags
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from sqlalchemy import Boolean, Column, DateTime, Enum, Index, Integer, String, Table, Text
+
+from app.database import Base
+from .notification import NotificationType
+
+# 보존 기간이 지난 "읽은" 알림 보관용 (app/scripts/archive_notifications.py가 채움)
+# - PK에 created_at 포함: Postgres에서는 created_at 기준 월별 RANGE 파티션 테이블로 생성
+#   → 오래된 보관분은 DELETE 없이 파티션 DROP
+notifications_archive = Table(
+    "notifications_archive",
+    Base.metadata,
+    Column("id", Integer, primary_key=True, autoincrement=False),
+    Column("created_at", DateTime, primary_key=True),
+    Column("recipient_user_id", Integer, nullable=False),
+    Column("type", Enum(NotificationType), nullable=False),
+    Column("entity_id", Integer, nullable=True),
+    Column("payload", Text, nullable=True),
+    Column("message", String(500), nullable=False),
+    Column("is_read", Boolean, nullable=False),
+    Column("archived_at", DateTime, nullable=False),
+    Index("ix_notifications_archive_recipient_created", "recipient_user_id", "created_at"),
+)
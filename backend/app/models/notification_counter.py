@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from sqlalchemy import Column, ForeignKey, Integer
+from app.database import Base
+
+
+class NotificationCounter(Base):
+    """
+    사용자별 안 읽은 알림 수 (알림 생성/읽음 처리 시 repository에서 함께 갱신)
+    → 배지 polling이 notifications COUNT 대신 PK 조회 1회
+    """
+
+    __tablename__ = "notification_counters"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    unread_count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
+from app.database import Base
+
+
+class NotificationOutbox(Base):
+    """
+    실시간 push 대기열 (transactional outbox).
+    알림과 같은 트랜잭션에서 INSERT → 백그라운드 dispatcher가 push 후 삭제.
+    """
+
+    __tablename__ = "notification_outbox"
+
+    id = Column(Integer, primary_key=True)
+
+    notification_id = Column(Integer, ForeignKey("notifications.id", ondelete="CASCADE"), nullable=False)
+    recipient_user_id = Column(Integer, nullable=False)
+
+    # 직렬화된 WebSocket 프레임 (JSON 문자열)
+    data = Column(Text, nullable=False)
+
+    attempts = Column(Integer, nullable=False, default=0)
+    # NULL이면 재시도 한도 초과(dead) → 더 이상 전송하지 않음
+    next_attempt_at = Column(DateTime, nullable=True, default=datetime.utcnow)
+    last_error = Column(String(500), nullable=True)
+
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_notification_outbox_next_attempt", "next_attempt_at", "id"),
+    )
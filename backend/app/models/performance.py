@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from datetime import datetime, date
 from sqlalchemy import (
-    Column, Integer, String, Text, Date, DateTime, ForeignKey
+    Column, Integer, String, Text, Date, DateTime, ForeignKey, Index
 )
+from sqlalchemy.orm import relationship
 from app.database import Base
 
 
@@ -27,4 +28,17 @@ class Performance(Base):
     performance_date = Column(Date, nullable=False, index=True)
 
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # 후기/평점 집계 (1:1, 공연 생성 시 함께 생성). 상세/목록 응답에 항상 쓰이므로 joined 로딩
+    rating = relationship(
+        "PerformanceRating",
+        uselist=False,
+        lazy="joined",
+        cascade="all, delete-orphan",
+    )
+
+    __table_args__ = (
+        # 목록 기본 필터(지역 + 테마) + 공연일 정렬/범위
+        Index("ix_performances_region_theme_date", "region", "theme_category", "performance_date"),
+    )
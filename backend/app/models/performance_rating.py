@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer
+from app.database import Base
+
+
+class PerformanceRating(Base):
+    """
+    공연별 후기/평점 집계 (후기 작성/수정/삭제 시 repository에서 증감 갱신, 공연당 1행)
+    - review_count / rating_* : 공개 후기만 (공연 조회 응답·정렬에 사용)
+    - all_* : 비공개 포함 전체
+    - rating_count는 평점이 있는 후기 수 (평점은 선택이라 review_count와 다를 수 있음)
+    """
+
+    __tablename__ = "performance_ratings"
+
+    performance_id = Column(
+        Integer, ForeignKey("performances.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    review_count = Column(Integer, nullable=False, default=0)
+    rating_count = Column(Integer, nullable=False, default=0)
+    rating_sum = Column(Integer, nullable=False, default=0)
+    # rating_sum / rating_count (평점 없으면 NULL) — 평균 정렬용으로 함께 저장
+    rating_avg = Column(Float, nullable=True, index=True)
+    rating_1 = Column(Integer, nullable=False, default=0)
+    rating_2 = Column(Integer, nullable=False, default=0)
+    rating_3 = Column(Integer, nullable=False, default=0)
+    rating_4 = Column(Integer, nullable=False, default=0)
+    rating_5 = Column(Integer, nullable=False, default=0)
+
+    all_review_count = Column(Integer, nullable=False, default=0)
+    all_rating_count = Column(Integer, nullable=False, default=0)
+    all_rating_sum = Column(Integer, nullable=False, default=0)
+    all_rating_1 = Column(Integer, nullable=False, default=0)
+    all_rating_2 = Column(Integer, nullable=False, default=0)
+    all_rating_3 = Column(Integer, nullable=False, default=0)
+    all_rating_4 = Column(Integer, nullable=False, default=0)
+    all_rating_5 = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    @property
+    def histogram(self) -> Dict[int, int]:
+        return {score: getattr(self, f"rating_{score}") or 0 for score in range(1, 6)}
+
+    @property
+    def all_histogram(self) -> Dict[int, int]:
+        return {score: getattr(self, f"all_rating_{score}") or 0 for score in range(1, 6)}
@@ -27,4 +27,6 @@ class Review(Base):
 
     __table_args__ = (
         Index("ix_reviews_performance_created", "performance_id", "created_at"),
+        # 일반 사용자 목록: 공개 후기 / 본인 비공개 후기를 각각 created_at 순으로 읽음
+        Index("ix_reviews_performance_public_created", "performance_id", "is_public", "created_at"),
     )
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import List
+
+from sqlalchemy import Column, ForeignKey, Index, String, Table, event, inspect
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from .community_post import CommunityPost
+from .inventory_item import InventoryItem
+
+TAG_MAX_LENGTH = 50
+
+# 콤마 문자열(tags 컬럼)을 정규화한 역색인 테이블
+# - PK (owner_id, tag): 물품/게시글별 태그 교체
+# - ix (tag, owner_id): 태그 정확 일치 검색 / facet 집계
+item_tags = Table(
+    "item_tags",
+    Base.metadata,
+    Column("item_id", ForeignKey("inventory_items.id", ondelete="CASCADE"), primary_key=True),
+    Column("tag", String(TAG_MAX_LENGTH), primary_key=True),
+    Index("ix_item_tags_tag_item", "tag", "item_id"),
+)
+
+post_tags = Table(
+    "post_tags",
+    Base.metadata,
+    Column("post_id", ForeignKey("community_posts.id", ondelete="CASCADE"), primary_key=True),
+    Column("tag", String(TAG_MAX_LENGTH), primary_key=True),
+    Index("ix_post_tags_tag_post", "tag", "post_id"),
+)
+
+
+def parse_tags(raw: str | None) -> List[str]:
+    """
+    "조명, #무대,조명" → ["조명", "무대"]
+    """
+    if not raw:
+        return []
+    tags: List[str] = []
+    for part in raw.split(","):
+        tag = part.strip().lstrip("#").strip()[:TAG_MAX_LENGTH]
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+# --------------------------------------------------------------------
+# tags 컬럼 ↔ 태그 테이블 동기화
+# (repository / seed 스크립트 등 어디서 쓰든 flush 시점에 반영)
+# --------------------------------------------------------------------
+_TAG_TABLES = (
+    (InventoryItem, item_tags, item_tags.c.item_id),
+    (CommunityPost, post_tags, post_tags.c.post_id),
+)
+
+
+@event.listens_for(Session, "before_flush")
+def _delete_tags_of_deleted_owners(session: Session, flush_context, instances) -> None:
+    # FK 때문에 본 행 삭제 전에 태그 행을 먼저 지움 (SQLite는 CASCADE 미적용)
+    for model, table, owner_col in _TAG_TABLES:
+        ids = [obj.id for obj in session.deleted if isinstance(obj, model) and obj.id is not None]
+        if ids:
+            session.connection().execute(table.delete().where(owner_col.in_(ids)))
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_tags(session: Session, flush_context) -> None:
+    for obj in (*session.new, *session.dirty):
+        for model, table, owner_col in _TAG_TABLES:
+            if not isinstance(obj, model):
+                continue
+            if obj not in session.new and not inspect(obj).attrs.tags.history.has_changes():
+                continue
+
+            conn = session.connection()
+            conn.execute(table.delete().where(owner_col == obj.id))
+            tags = parse_tags(obj.tags)
+            if tags:
+                conn.execute(
+                    table.insert(),
+                    [{owner_col.name: obj.id, "tag": t} for t in tags],
+                )
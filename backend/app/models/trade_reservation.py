@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, DateTime, Enum, Integer, String, Text
+from sqlalchemy import ForeignKey, DateTime, Enum, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -33,6 +33,16 @@ class TradeReservation(Base):
     status: Mapped[ReservationStatus] = mapped_column(Enum(ReservationStatus), default=ReservationStatus.PENDING, index=True)
 
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # 상태 변경 포함 마지막 수정 시각 (달력 Last-Modified 계산용)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     listing: Mapped["TradeListing"] = relationship(back_populates="reservations")
     user: Mapped["User"] = relationship()  # 필요시 back_populates 확장 가능
+
+    __table_args__ = (
+        # 기간 겹침 검사 / 가용 시간 조회 (listing_id = ? AND start_at < :to AND end_at > :from)
+        # Postgres는 마이그레이션에서 EXCLUDE 제약도 추가 (동시 예약 최종 방어)
+        Index("ix_trade_reservations_listing_period", "listing_id", "start_at", "end_at"),
+        # 달력 날짜 구간 조회 (listing_id = ? AND status IN (...) AND start_at < :to)
+        Index("ix_trade_reservations_listing_status_start", "listing_id", "status", "start_at"),
+    )
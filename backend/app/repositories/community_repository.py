@@ -8,6 +8,7 @@ from sqlalchemy import or_
 
 from app.models.community_post import CommunityPost, CommunityPostType
 from app.schemas.community import CommunityPostCreate, CommunityPostUpdate
+from app.repositories.tag_repository import TagRepository, TagMode
 
 
 class CommunityRepository:
@@ -37,12 +38,21 @@ class CommunityRepository:
     def get_post(db: Session, post_id: int) -> Optional[CommunityPost]:
         return db.query(CommunityPost).filter(CommunityPost.id == post_id).first()
 
+    @staticmethod
+    def get_post_version(db: Session, post_id: int):
+        """
+        ETag용 (updated_at,). 없으면 None.
+        """
+        return db.query(CommunityPost.updated_at).filter(CommunityPost.id == post_id).first()
+
     @staticmethod
     def list_posts(
         db: Session,
         *,
         type: Optional[str] = None,
         keyword: Optional[str] = None,
+        tag: Optional[str] = None,
+        tag_mode: TagMode = "any",
         skip: int = 0,
         limit: int = 20,
     ) -> List[CommunityPost]:
@@ -61,6 +71,10 @@ class CommunityRepository:
                 )
             )
 
+        if tag:
+            # post_tags 역색인으로 정확 일치
+            q = TagRepository.filter_posts(q, tag, tag_mode)
+
         return (
             q.order_by(CommunityPost.created_at.desc())
              .offset(skip)
@@ -1,6 +1,10 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.inventory_item import InventoryItem, ItemStatus
-from app.utils.pagination import paginate_query, apply_keyword_filter, apply_sort
+from app.utils.exceptions import AppException
+from app.utils.pagination import paginate_query, resolve_sort
+from app.utils.search import apply_item_search
+from app.utils.response_cache import TRADE, response_cache
 
 
 class InventoryRepository:
@@ -16,10 +20,19 @@ class InventoryRepository:
     def get(db: Session, item_id: int) -> InventoryItem | None:
         return db.query(InventoryItem).filter(InventoryItem.id == item_id).first()
 
+    @staticmethod
+    def get_version(db: Session, item_id: int):
+        """
+        ETag용 (updated_at,). 없으면 None.
+        """
+        return db.query(InventoryItem.updated_at).filter(InventoryItem.id == item_id).first()
+
     @staticmethod
     def update(db: Session, item: InventoryItem) -> InventoryItem:
         db.add(item)
         db.commit()
+        # 거래 상세는 물품 정보를 함께 내려줌
+        response_cache.invalidate(TRADE)
         db.refresh(item)
         return item
 
@@ -27,6 +40,7 @@ class InventoryRepository:
     def delete(db: Session, item: InventoryItem) -> None:
         db.delete(item)
         db.commit()
+        response_cache.invalidate(TRADE)
 
     @staticmethod
     def list(
@@ -37,6 +51,7 @@ class InventoryRepository:
         sort: str | None,
         page: int,
         size: int,
+        cursor: str | None = None,
     ):
         query = db.query(InventoryItem)
 
@@ -46,12 +61,38 @@ class InventoryRepository:
         if status is not None:
             query = query.filter(InventoryItem.status == status)
 
-        query = apply_keyword_filter(
-            query,
-            keyword,
-            [InventoryItem.name, InventoryItem.category, InventoryItem.tags],
-        )
+        query, rank = apply_item_search(query, keyword)
+
+        if rank is not None and not sort:
+            # 키워드 검색 + 정렬 미지정: 관련도순 (offset 페이징만 지원, next_cursor 없음)
+            if cursor is not None:
+                # 무시하면 1페이지가 반복되므로 거부
+                raise AppException(
+                    code="CURSOR_NOT_SUPPORTED",
+                    message="관련도순 검색에서는 cursor를 사용할 수 없습니다. page를 사용하거나 sort를 지정하세요.",
+                    status_code=400,
+                )
+            query = query.order_by(rank.desc(), InventoryItem.id.asc())
+            sort_key = None
+        else:
+            sort_key = resolve_sort(sort, InventoryItem, tiebreaker=InventoryItem.id)
+
+        return paginate_query(query, page, size, cursor=cursor, sort_key=sort_key)
+
 
-        query = apply_sort(query, sort, InventoryItem)
+class AsyncInventoryRepository:
+    """
+    AsyncSession용 래퍼 (조회 전용). 로직은 InventoryRepository를 run_sync로 재사용.
+    """
 
-        return paginate_query(query, page, size)
+    @staticmethod
+    async def get(db: AsyncSession, item_id: int) -> InventoryItem | None:
+        return await db.run_sync(InventoryRepository.get, item_id)
+
+    @staticmethod
+    async def get_version(db: AsyncSession, item_id: int):
+        return await db.run_sync(InventoryRepository.get_version, item_id)
+
+    @staticmethod
+    async def list(db: AsyncSession, **kwargs):
+        return await db.run_sync(InventoryRepository.list, **kwargs)
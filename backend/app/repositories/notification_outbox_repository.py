@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Tuple
+
+from sqlalchemy import delete, func, insert
+from sqlalchemy.orm import Session
+
+from app.models.notification_outbox import NotificationOutbox
+
+
+class NotificationOutboxRepository:
+    @staticmethod
+    def add_many(db: Session, entries: Iterable[Tuple[int, int, str]]) -> None:
+        """
+        (notification_id, recipient_user_id, data) 목록을 outbox에 추가 (flush/commit은 호출자)
+        """
+        now = datetime.utcnow()
+        rows = [
+            {
+                "notification_id": notification_id,
+                "recipient_user_id": user_id,
+                "data": data,
+                "attempts": 0,
+                "next_attempt_at": now,
+                "created_at": now,
+            }
+            for notification_id, user_id, data in entries
+        ]
+        if rows:
+            db.execute(insert(NotificationOutbox), rows)
+
+    @staticmethod
+    def claim_batch(db: Session, limit: int) -> List[NotificationOutbox]:
+        """
+        전송할 차례인 행을 잠그고 가져옴.
+        SKIP LOCKED: 여러 워커의 dispatcher가 같은 행을 중복 전송하지 않음 (SQLite는 무시)
+        """
+        return (
+            db.query(NotificationOutbox)
+            .filter(NotificationOutbox.next_attempt_at <= datetime.utcnow())
+            .order_by(NotificationOutbox.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+
+    @staticmethod
+    def delete_many(db: Session, ids: List[int]) -> None:
+        db.execute(delete(NotificationOutbox).where(NotificationOutbox.id.in_(ids)))
+
+    @staticmethod
+    def mark_failed(
+        db: Session,
+        entries: List[NotificationOutbox],
+        error: str,
+        max_attempts: int,
+        retry_base_seconds: float,
+    ) -> int:
+        """
+        재시도 예약 (지수 backoff). 한도 초과 시 next_attempt_at=NULL(dead). dead 건수 반환.
+        """
+        now = datetime.utcnow()
+        dead = 0
+        for entry in entries:
+            entry.attempts += 1
+            entry.last_error = error[:500]
+            if entry.attempts >= max_attempts:
+                entry.next_attempt_at = None
+                dead += 1
+            else:
+                entry.next_attempt_at = now + timedelta(seconds=retry_base_seconds * 2 ** (entry.attempts - 1))
+        return dead
+
+    @staticmethod
+    def stats(db: Session) -> Dict[str, Any]:
+        pending, oldest = (
+            db.query(func.count(NotificationOutbox.id), func.min(NotificationOutbox.created_at))
+            .filter(NotificationOutbox.next_attempt_at.is_not(None))
+            .one()
+        )
+        dead = (
+            db.query(func.count(NotificationOutbox.id))
+            .filter(NotificationOutbox.next_attempt_at.is_(None))
+            .scalar()
+        )
+        lag = (datetime.utcnow() - oldest).total_seconds() if oldest else 0.0
+        return {"pending": pending, "dead": dead, "oldest_pending_age_seconds": round(lag, 3)}
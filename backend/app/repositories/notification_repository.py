@@ -1,13 +1,75 @@
 from __future__ import annotations
 
+from datetime import datetime
+
+from sqlalchemy import case, delete, insert, literal, select, update
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from typing import Optional, Tuple, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Iterable, List, Optional
 
 from app.models.notification import Notification, NotificationType
+from app.models.notification_archive import notifications_archive
+from app.models.notification_counter import NotificationCounter
+from app.models.notification_outbox import NotificationOutbox
+from app.utils.pagination import SortKey, paginate_query
 
 
 class NotificationRepository:
+    # ------------------------------------------------------------------
+    # 안 읽은 알림 카운터 (notification_counters)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _increment_unread(db: Session, deltas: Dict[int, int]) -> None:
+        """
+        user_id별 unread_count += delta (행이 없으면 생성). 원자적 upsert 1문장.
+        """
+        if not deltas:
+            return
+        table = NotificationCounter.__table__
+        # user_id 순서로 잠금 → 동시 요청 간 교착 방지
+        rows = [{"user_id": user_id, "unread_count": delta} for user_id, delta in sorted(deltas.items())]
+
+        dialect = db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            stmt = (postgresql if dialect == "postgresql" else sqlite).insert(table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.user_id],
+                set_={"unread_count": table.c.unread_count + stmt.excluded.unread_count},
+            )
+        elif dialect in ("mysql", "mariadb"):
+            stmt = mysql.insert(table)
+            stmt = stmt.on_duplicate_key_update(unread_count=table.c.unread_count + stmt.inserted.unread_count)
+        else:
+            for row in rows:
+                updated = db.execute(
+                    update(table)
+                    .where(table.c.user_id == row["user_id"])
+                    .values(unread_count=table.c.unread_count + row["unread_count"])
+                ).rowcount
+                if not updated:
+                    db.execute(insert(table), row)
+            return
+        db.execute(stmt, rows)
+
+    @staticmethod
+    def _decrement_unread(db: Session, user_id: int, delta: int) -> None:
+        if delta <= 0:
+            return
+        col = NotificationCounter.unread_count
+        db.execute(
+            update(NotificationCounter)
+            .where(NotificationCounter.user_id == user_id)
+            .values(unread_count=case((col < delta, 0), else_=col - delta))
+        )
+
+    @staticmethod
+    def unread_count(db: Session, user_id: int) -> int:
+        count = db.execute(
+            select(NotificationCounter.unread_count).where(NotificationCounter.user_id == user_id)
+        ).scalar()
+        return count or 0
+
     @staticmethod
     def create(
         db: Session,
@@ -26,10 +88,51 @@ class NotificationRepository:
             is_read=False,
         )
         db.add(n)
+        NotificationRepository._increment_unread(db, {recipient_user_id: 1})
         db.commit()
         db.refresh(n)
         return n
 
+    @staticmethod
+    def create_many(
+        db: Session,
+        recipient_user_ids: Iterable[int],
+        type: NotificationType,
+        message: str,
+        entity_id: Optional[int] = None,
+        payload: Optional[str] = None,
+    ) -> List[Notification]:
+        """
+        같은 내용의 알림을 여러 수신자에게 한 번에 생성.
+        - commit은 호출자가 (요청 트랜잭션 안에서 한 번만)
+        - RETURNING 지원 DB(Postgres/SQLite/MariaDB)는 multi-row INSERT ... RETURNING 1회
+          (반환 순서는 보장하지 않음), 그 외(MySQL)는 ORM flush로 대체
+        """
+        rows = [
+            {
+                "recipient_user_id": user_id,
+                "type": type,
+                "message": message,
+                "entity_id": entity_id,
+                "payload": payload,
+                "is_read": False,
+                "created_at": datetime.utcnow(),
+            }
+            for user_id in dict.fromkeys(recipient_user_ids)
+        ]
+        if not rows:
+            return []
+
+        NotificationRepository._increment_unread(db, {row["recipient_user_id"]: 1 for row in rows})
+
+        if db.get_bind().dialect.insert_returning:
+            return list(db.scalars(insert(Notification).returning(Notification), rows))
+
+        notifications = [Notification(**row) for row in rows]
+        db.add_all(notifications)
+        db.flush()
+        return notifications
+
     @staticmethod
     def get_by_id(db: Session, notification_id: int) -> Optional[Notification]:
         return db.query(Notification).filter(Notification.id == notification_id).first()
@@ -41,23 +144,110 @@ class NotificationRepository:
         is_read: Optional[bool],
         page: int,
         size: int,
-    ) -> Tuple[List[Notification], int]:
+        cursor: Optional[str] = None,
+    ):
         q = db.query(Notification).filter(Notification.recipient_user_id == user_id)
         if is_read is not None:
             q = q.filter(Notification.is_read == is_read)
 
-        total = q.count()
-        items = (
-            q.order_by(desc(Notification.created_at))
-            .offset((page - 1) * size)
-            .limit(size)
-            .all()
-        )
-        return items, total
+        # 최신순 (ix_notifications_recipient_created 사용)
+        sort_key = SortKey(Notification.created_at, True, Notification.id)
+        return paginate_query(q, page, size, cursor=cursor, sort_key=sort_key)
 
     @staticmethod
     def mark_read(db: Session, notification: Notification) -> Notification:
-        notification.is_read = True
+        if not notification.is_read:
+            notification.is_read = True
+            NotificationRepository._decrement_unread(db, notification.recipient_user_id, 1)
         db.commit()
         db.refresh(notification)
         return notification
+
+    @staticmethod
+    def mark_read_many(db: Session, user_id: int, ids: Optional[List[int]] = None) -> int:
+        """
+        본인 알림 일괄 읽음 처리 (UPDATE 1문장). ids가 없으면 전체. 변경된 행 수 반환.
+        """
+        stmt = (
+            update(Notification)
+            .where(Notification.recipient_user_id == user_id, Notification.is_read == False)  # noqa: E712
+            .values(is_read=True)
+            .execution_options(synchronize_session=False)
+        )
+        if ids is not None:
+            stmt = stmt.where(Notification.id.in_(ids))
+        updated = db.execute(stmt).rowcount
+
+        if ids is None:
+            # 전체 읽음 → 카운터를 0으로 맞춤 (누적 오차 보정)
+            db.execute(
+                update(NotificationCounter)
+                .where(NotificationCounter.user_id == user_id)
+                .values(unread_count=0)
+            )
+        else:
+            NotificationRepository._decrement_unread(db, user_id, updated)
+
+        db.commit()
+        return updated
+
+
+    @staticmethod
+    def archive_read_before(db: Session, cutoff: datetime, limit: int, archive: bool = True) -> int:
+        """
+        cutoff 이전에 생성된 "읽은" 알림 최대 limit건을 보관 테이블로 옮기고(archive=False면 삭제만) commit.
+        배치마다 짧은 트랜잭션 → 긴 잠금 없이 반복 호출. 처리한 행 수 반환.
+        (오래된 행일수록 id가 작으므로 PK 순서로 앞에서부터 잘라냄)
+        """
+        ids = list(
+            db.execute(
+                select(Notification.id)
+                .where(Notification.is_read == True, Notification.created_at < cutoff)  # noqa: E712
+                .order_by(Notification.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            ).scalars()
+        )
+        if not ids:
+            db.rollback()
+            return 0
+
+        if archive:
+            columns = ["id", "created_at", "recipient_user_id", "type", "entity_id", "payload", "message", "is_read"]
+            db.execute(
+                insert(notifications_archive).from_select(
+                    [*columns, "archived_at"],
+                    select(
+                        *(Notification.__table__.c[name] for name in columns),
+                        literal(datetime.utcnow()),
+                    ).where(Notification.id.in_(ids)),
+                )
+            )
+
+        # 재시도 한도를 넘긴(dead) outbox 행이 남아 있을 수 있음 (SQLite는 FK CASCADE 미적용)
+        db.execute(delete(NotificationOutbox).where(NotificationOutbox.notification_id.in_(ids)))
+        db.execute(delete(Notification).where(Notification.id.in_(ids)))
+        db.commit()
+        return len(ids)
+
+
+class AsyncNotificationRepository:
+    """
+    AsyncSession용 래퍼. 로직은 NotificationRepository를 run_sync로 재사용.
+    """
+
+    @staticmethod
+    async def create(db: AsyncSession, **kwargs) -> Notification:
+        return await db.run_sync(NotificationRepository.create, **kwargs)
+
+    @staticmethod
+    async def list_for_user(db: AsyncSession, **kwargs):
+        return await db.run_sync(NotificationRepository.list_for_user, **kwargs)
+
+    @staticmethod
+    async def unread_count(db: AsyncSession, user_id: int) -> int:
+        return await db.run_sync(NotificationRepository.unread_count, user_id=user_id)
+
+    @staticmethod
+    async def mark_read_many(db: AsyncSession, **kwargs) -> int:
+        return await db.run_sync(NotificationRepository.mark_read_many, **kwargs)
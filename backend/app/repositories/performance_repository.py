@@ -1,17 +1,51 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager, load_only
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from app.models.performance import Performance
+from app.models.performance_rating import PerformanceRating
+from app.utils.pagination import paginate_query, resolve_sort
+from app.config import settings
 from app.schemas.performance import PerformanceCreate, PerformanceUpdate
+from app.utils.cache import build_cache
+from app.utils.response_cache import PERFORMANCES, response_cache
+
+
+# 목록 응답(PerformanceListItem) 컬럼
+LIST_COLUMNS = (
+    Performance.id,
+    Performance.title,
+    Performance.region,
+    Performance.theme_category,
+    Performance.poster_image_url,
+    Performance.performance_date,
+    Performance.club_id,
+    Performance.school_id,
+)
+
+# 목록 정렬에 쓸 수 있는 평점 집계 컬럼 (공개 후기 기준)
+RATING_SORT_FIELDS = ("rating_avg", "review_count", "rating_count")
+
+# performance_id → [club_id] (존재하는 공연만 저장, 수정/삭제 시 무효화)
+_owner_cache = build_cache(
+    "performance:owner",
+    max_entries=settings.PERFORMANCE_OWNER_CACHE_MAX_ENTRIES,
+    ttl=settings.PERFORMANCE_OWNER_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_owner_cache(performance_id: int) -> None:
+    _owner_cache.delete(str(performance_id))
 
 
 class PerformanceRepository:
 
     @staticmethod
     def create(db: Session, data: PerformanceCreate) -> Performance:
-        performance = Performance(**data.model_dump())
+        performance = Performance(**data.model_dump(), rating=PerformanceRating())
         db.add(performance)
         db.commit()
+        response_cache.invalidate(PERFORMANCES)
         db.refresh(performance)
         return performance
 
@@ -19,6 +53,34 @@ class PerformanceRepository:
     def get(db: Session, performance_id: int) -> Optional[Performance]:
         return db.query(Performance).filter(Performance.id == performance_id).first()
 
+    @staticmethod
+    def get_version(db: Session, performance_id: int):
+        """
+        ETag용 (공연 updated_at, 평점 집계 updated_at). 없으면 None.
+        """
+        return (
+            db.query(Performance.updated_at, PerformanceRating.updated_at)
+            .outerjoin(PerformanceRating, PerformanceRating.performance_id == Performance.id)
+            .filter(Performance.id == performance_id)
+            .first()
+        )
+
+    @staticmethod
+    def get_owner(db: Session, performance_id: int) -> Tuple[bool, Optional[int]]:
+        """
+        (존재 여부, 소유 동아리 id). 후기 목록 등 권한 확인만 필요한 곳에서 공연 전체 대신 사용 (캐시)
+        """
+        cached = _owner_cache.get(str(performance_id))
+        if cached is not None:
+            return True, cached[0]
+
+        row = db.query(Performance.club_id).filter(Performance.id == performance_id).first()
+        if row is None:
+            # 없는 공연은 캐시하지 않음 (생성 직후 바로 보이도록)
+            return False, None
+        _owner_cache.set(str(performance_id), [row.club_id])
+        return True, row.club_id
+
     @staticmethod
     def list(
         db: Session,
@@ -26,8 +88,21 @@ class PerformanceRepository:
         theme: Optional[str],
         start_date: Optional[date],
         end_date: Optional[date],
-    ) -> List[Performance]:
-        q = db.query(Performance)
+        page: int = 1,
+        size: int = 20,
+        sort: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ):
+        """
+        목록 컬럼만 로드 (description 제외). 기본 정렬은 공연일 오름차순.
+        region + theme + 공연일 조건은 ix_performances_region_theme_date 사용
+        평점 집계 컬럼으로도 정렬 가능 (예: -rating_avg, -review_count)
+        """
+        q = (
+            db.query(Performance)
+            .outerjoin(Performance.rating)
+            .options(load_only(*LIST_COLUMNS), contains_eager(Performance.rating))
+        )
         if region:
             q = q.filter(Performance.region == region)
         if theme:
@@ -36,7 +111,12 @@ class PerformanceRepository:
             q = q.filter(Performance.performance_date >= start_date)
         if end_date:
             q = q.filter(Performance.performance_date <= end_date)
-        return q.order_by(Performance.performance_date).all()
+
+        sort = sort or "performance_date"
+        # 집계 컬럼은 공개 후기 기준만 정렬 허용 (all_*은 비공개 후기 포함)
+        models = (PerformanceRating,) if sort.lstrip("-") in RATING_SORT_FIELDS else (Performance,)
+        sort_key = resolve_sort(sort, *models, tiebreaker=Performance.id)
+        return paginate_query(q, page, size, cursor=cursor, sort_key=sort_key)
 
     @staticmethod
     def list_by_club(db: Session, club_id: int) -> List[Performance]:
@@ -47,10 +127,37 @@ class PerformanceRepository:
         for k, v in data.model_dump(exclude_unset=True).items():
             setattr(performance, k, v)
         db.commit()
+        invalidate_owner_cache(performance.id)
+        response_cache.invalidate(PERFORMANCES)
         db.refresh(performance)
         return performance
 
     @staticmethod
     def delete(db: Session, performance: Performance):
+        performance_id = performance.id
         db.delete(performance)
         db.commit()
+        invalidate_owner_cache(performance_id)
+        response_cache.invalidate(PERFORMANCES)
+
+
+class AsyncPerformanceRepository:
+    """
+    AsyncSession용 래퍼 (조회 전용). 로직은 PerformanceRepository를 run_sync로 재사용.
+    """
+
+    @staticmethod
+    async def get(db: AsyncSession, performance_id: int) -> Optional[Performance]:
+        return await db.run_sync(PerformanceRepository.get, performance_id)
+
+    @staticmethod
+    async def get_owner(db: AsyncSession, performance_id: int) -> Tuple[bool, Optional[int]]:
+        return await db.run_sync(PerformanceRepository.get_owner, performance_id)
+
+    @staticmethod
+    async def get_version(db: AsyncSession, performance_id: int):
+        return await db.run_sync(PerformanceRepository.get_version, performance_id)
+
+    @staticmethod
+    async def list(db: AsyncSession, **kwargs):
+        return await db.run_sync(PerformanceRepository.list, **kwargs)
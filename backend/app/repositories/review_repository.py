@@ -1,15 +1,133 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Dict, Optional, Tuple
 
-from sqlalchemy import desc
+from sqlalchemy import case, insert, inspect, literal, update
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.performance_rating import PerformanceRating
 from app.models.review import Review
+from app.utils.pagination import SortKey, paginate_query
+from app.utils.response_cache import PERFORMANCES, invalidate_on_commit
+
+
+# 목록 응답(ReviewOut) 컬럼 — ORM 객체 대신 튜플로 조회
+LIST_COLUMNS = (
+    Review.id,
+    Review.performance_id,
+    Review.author_user_id,
+    Review.content,
+    Review.is_public,
+    Review.rating,
+    Review.created_at,
+    Review.updated_at,
+)
+LIST_FIELDS = tuple(col.key for col in LIST_COLUMNS)
+
+# 최신순 (created_at, id) keyset
+LIST_SORT_KEY = SortKey(Review.created_at, True, Review.id)
+
+
+# performance_ratings 증감 대상 컬럼 (rating_avg / updated_at 제외)
+RATING_COUNTER_COLUMNS = tuple(
+    f"{prefix}{name}"
+    for prefix in ("", "all_")
+    for name in ("review_count", "rating_count", "rating_sum", *(f"rating_{score}" for score in range(1, 6)))
+)
+
+
+def rating_contribution(is_public: bool, rating: Optional[int], sign: int = 1) -> Dict[str, int]:
+    """
+    후기 1건이 집계에 더하는 값 (sign=-1이면 빼는 값)
+    """
+    delta: Dict[str, int] = {}
+    for prefix, included in (("", is_public), ("all_", True)):
+        if not included:
+            continue
+        delta[f"{prefix}review_count"] = sign
+        if rating is not None:
+            delta[f"{prefix}rating_count"] = sign
+            delta[f"{prefix}rating_sum"] = sign * rating
+            delta[f"{prefix}rating_{rating}"] = sign
+    return delta
+
+
+def _previous_value(obj, key: str):
+    # flush 전 변경 이력에서 수정 전 값
+    history = inspect(obj).attrs[key].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(obj, key)
 
 
 class ReviewRepository:
+    # ------------------------------------------------------------------
+    # 공연별 평점 집계 (performance_ratings)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _apply_rating_delta(db: Session, performance_id: int, *deltas: Dict[str, int]) -> None:
+        """
+        집계 += 합산 delta (행이 없으면 생성). 후기 변경과 같은 트랜잭션에서 원자적 upsert 1문장.
+        rating_avg는 갱신된 합계/개수로 같은 문장에서 다시 계산
+        """
+        merged: Dict[str, int] = {}
+        for delta in deltas:
+            for key, value in delta.items():
+                merged[key] = merged.get(key, 0) + value
+        if not any(merged.values()):
+            return
+
+        table = PerformanceRating.__table__
+        now = datetime.utcnow()
+        row = {"performance_id": performance_id, "updated_at": now}
+        row.update({name: merged.get(name, 0) for name in RATING_COUNTER_COLUMNS})
+        row["rating_avg"] = row["rating_sum"] / row["rating_count"] if row["rating_count"] > 0 else None
+
+        def average(count, total):
+            return case((count > 0, total * literal(1.0) / count), else_=None)
+
+        dialect = db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite", "mysql", "mariadb"):
+            if dialect in ("mysql", "mariadb"):
+                stmt = mysql.insert(table).values(row)
+                source = stmt.inserted
+            else:
+                stmt = (postgresql if dialect == "postgresql" else sqlite).insert(table).values(row)
+                source = stmt.excluded
+            new = {name: table.c[name] + source[name] for name in RATING_COUNTER_COLUMNS}
+            set_ = {
+                **new,
+                "rating_avg": average(new["rating_count"], new["rating_sum"]),
+                "updated_at": source.updated_at,
+            }
+            if dialect in ("mysql", "mariadb"):
+                # MySQL은 SET 순서대로 평가되므로 rating_avg를 앞에 둬 갱신 전 값을 기준으로 계산
+                stmt = stmt.on_duplicate_key_update(
+                    [("rating_avg", set_.pop("rating_avg")), *set_.items()]
+                )
+            else:
+                stmt = stmt.on_conflict_do_update(index_elements=[table.c.performance_id], set_=set_)
+            db.execute(stmt)
+        else:
+            new = {name: table.c[name] + row[name] for name in RATING_COUNTER_COLUMNS}
+            updated = db.execute(
+                update(table)
+                .where(table.c.performance_id == performance_id)
+                .values(
+                    **new,
+                    rating_avg=average(new["rating_count"], new["rating_sum"]),
+                    updated_at=now,
+                )
+            ).rowcount
+            if not updated:
+                db.execute(insert(table), row)
+
+        # 공연 목록/상세 응답에 집계가 포함되므로 커밋 후 공연 응답 캐시 무효화
+        invalidate_on_commit(db, PERFORMANCES)
+
     @staticmethod
     def create(
         db: Session,
@@ -18,7 +136,11 @@ class ReviewRepository:
         content: str,
         is_public: bool,
         rating: Optional[int],
+        commit: bool = True,
     ) -> Review:
+        """
+        commit=False면 flush만 (알림 등 후속 변경과 한 트랜잭션으로 묶을 때)
+        """
         r = Review(
             performance_id=performance_id,
             author_user_id=author_user_id,
@@ -27,6 +149,10 @@ class ReviewRepository:
             rating=rating,
         )
         db.add(r)
+        ReviewRepository._apply_rating_delta(db, performance_id, rating_contribution(is_public, rating))
+        if not commit:
+            db.flush()
+            return r
         db.commit()
         db.refresh(r)
         return r
@@ -39,15 +165,40 @@ class ReviewRepository:
     def list_for_performance(
         db: Session,
         performance_id: int,
+        viewer_user_id: Optional[int],
         include_private: bool,
-    ) -> List[Review]:
-        q = db.query(Review).filter(Review.performance_id == performance_id)
+        page: int = 1,
+        size: int = 20,
+        cursor: Optional[str] = None,
+    ):
+        """
+        최신순 후기 목록 (LIST_COLUMNS 튜플 row).
+        - include_private: 전체 → ix_reviews_performance_created
+        - 그 외: 공개 후기 UNION ALL 본인 비공개 후기
+          (is_public OR author 조건은 인덱스 순서를 못 쓰므로, 각 갈래가
+           ix_reviews_performance_public_created를 created_at 순으로 읽도록 분리)
+        """
+        q = db.query(*LIST_COLUMNS).filter(Review.performance_id == performance_id)
         if not include_private:
-            q = q.filter(Review.is_public == True)  # noqa: E712
-        return q.order_by(desc(Review.created_at)).all()
+            public = q.filter(Review.is_public == True)  # noqa: E712
+            own_private = q.filter(
+                Review.is_public == False,  # noqa: E712
+                Review.author_user_id == viewer_user_id,
+            )
+            q = public.union_all(own_private)
+        return paginate_query(q, page, size, cursor=cursor, sort_key=LIST_SORT_KEY)
 
     @staticmethod
     def update(db: Session, review: Review) -> Review:
+        """
+        호출자가 필드를 바꾼 뒤 호출 (변경 이력으로 수정 전 공개 여부/평점을 알아내 집계 보정)
+        """
+        ReviewRepository._apply_rating_delta(
+            db,
+            review.performance_id,
+            rating_contribution(_previous_value(review, "is_public"), _previous_value(review, "rating"), sign=-1),
+            rating_contribution(review.is_public, review.rating),
+        )
         review.updated_at = datetime.utcnow()
         db.commit()
         db.refresh(review)
@@ -55,5 +206,22 @@ class ReviewRepository:
 
     @staticmethod
     def delete(db: Session, review: Review) -> None:
+        ReviewRepository._apply_rating_delta(
+            db, review.performance_id, rating_contribution(review.is_public, review.rating, sign=-1)
+        )
         db.delete(review)
         db.commit()
+
+
+class AsyncReviewRepository:
+    """
+    AsyncSession용 래퍼. 로직은 ReviewRepository를 run_sync로 재사용.
+    """
+
+    @staticmethod
+    async def create(db: AsyncSession, **kwargs) -> Review:
+        return await db.run_sync(ReviewRepository.create, **kwargs)
+
+    @staticmethod
+    async def list_for_performance(db: AsyncSession, **kwargs):
+        return await db.run_sync(ReviewRepository.list_for_performance, **kwargs)
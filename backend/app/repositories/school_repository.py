@@ -1,11 +1,12 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.school import School
 from app.models.club import Club
 from app.utils.pagination import (
     paginate_query,
     apply_keyword_filter,
-    apply_sort,
+    resolve_sort,
 )
 
 
@@ -22,6 +23,7 @@ class SchoolRepository:
         size: int,
         keyword: str | None,
         sort: str | None,
+        cursor: str | None = None,
     ):
         query = db.query(School)
 
@@ -33,10 +35,10 @@ class SchoolRepository:
         )
 
         # 정렬
-        query = apply_sort(query, sort, School)
+        sort_key = resolve_sort(sort, School, tiebreaker=School.id)
 
-        # 페이징
-        return paginate_query(query, page, size)
+        # 페이징 (cursor가 있으면 keyset)
+        return paginate_query(query, page, size, cursor=cursor, sort_key=sort_key)
 
     @staticmethod
     def list_clubs_by_school(
@@ -46,6 +48,7 @@ class SchoolRepository:
         size: int,
         keyword: str | None,
         sort: str | None,
+        cursor: str | None = None,
     ):
         query = (
             db.query(Club)
@@ -60,7 +63,21 @@ class SchoolRepository:
         )
 
         # 정렬
-        query = apply_sort(query, sort, Club)
+        sort_key = resolve_sort(sort, Club, tiebreaker=Club.id)
 
-        # 페이징
-        return paginate_query(query, page, size)
+        # 페이징 (cursor가 있으면 keyset)
+        return paginate_query(query, page, size, cursor=cursor, sort_key=sort_key)
+
+
+class AsyncSchoolRepository:
+    """
+    AsyncSession용 래퍼. 로직은 SchoolRepository를 run_sync로 재사용.
+    """
+
+    @staticmethod
+    async def list_schools(db: AsyncSession, **kwargs):
+        return await db.run_sync(SchoolRepository.list_schools, **kwargs)
+
+    @staticmethod
+    async def list_clubs_by_school(db: AsyncSession, **kwargs):
+        return await db.run_sync(SchoolRepository.list_clubs_by_school, **kwargs)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import List, Literal
+
+from sqlalchemy import desc, func, select
+from sqlalchemy.orm import Query, Session
+
+from app.models.tag import item_tags, post_tags, parse_tags
+from app.models.inventory_item import InventoryItem
+from app.models.community_post import CommunityPost
+
+TagMode = Literal["any", "all"]
+
+
+def _tag_filter(table, owner_col, target_col, tags: List[str], mode: TagMode):
+    # (tag, owner_id) 인덱스로 owner id 집합을 먼저 구함
+    owners = select(owner_col).where(table.c.tag.in_(tags))
+    if mode == "all" and len(tags) > 1:
+        # PK(owner_id, tag)라 중복이 없으므로 count == 태그 수면 모두 포함
+        owners = owners.group_by(owner_col).having(func.count() == len(tags))
+    return target_col.in_(owners)
+
+
+class TagRepository:
+    @staticmethod
+    def filter_items(query: Query, raw_tags: str | None, mode: TagMode = "any") -> Query:
+        """
+        tag="조명,무대" → 태그 정확 일치 (any: OR / all: AND)
+        """
+        tags = parse_tags(raw_tags)
+        if not tags:
+            return query
+        return query.filter(_tag_filter(item_tags, item_tags.c.item_id, InventoryItem.id, tags, mode))
+
+    @staticmethod
+    def filter_posts(query: Query, raw_tags: str | None, mode: TagMode = "any") -> Query:
+        tags = parse_tags(raw_tags)
+        if not tags:
+            return query
+        return query.filter(_tag_filter(post_tags, post_tags.c.post_id, CommunityPost.id, tags, mode))
+
+    @staticmethod
+    def post_facets(db: Session, limit: int) -> List[tuple[str, int]]:
+        cnt = func.count().label("count")
+        return (
+            db.query(post_tags.c.tag, cnt)
+            .group_by(post_tags.c.tag)
+            .order_by(desc(cnt), post_tags.c.tag)
+            .limit(limit)
+            .all()
+        )
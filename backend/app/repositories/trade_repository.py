@@ -1,14 +1,50 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, desc, func, update
 
 from app.models.trade_listing import TradeListing, TradeType
 from app.models.trade_reservation import TradeReservation, ReservationStatus
 from app.models.inventory_item import InventoryItem, ItemStatus
-from app.utils.pagination import paginate_query
+from app.models.tag import item_tags
+from app.config import settings
+from app.utils.pagination import paginate_query, resolve_sort
+from app.utils.exceptions import AppException, ConflictException
+from app.utils.search import apply_item_search
+from app.repositories.tag_repository import TagRepository, TagMode
+
+
+# 목록(TradeListItem)에 필요한 컬럼만 조회. 순서 = LIST_FIELDS (라우터에서 zip으로 dict 변환)
+LIST_COLUMNS = (
+    TradeListing.id,
+    TradeListing.trade_type,
+    TradeListing.price,
+    TradeListing.deposit,
+    TradeListing.is_public,
+    InventoryItem.id.label("item_id"),
+    InventoryItem.club_id,
+    InventoryItem.name,
+    InventoryItem.category,
+    InventoryItem.tags,
+    InventoryItem.image_path,
+)
+LIST_FIELDS = tuple(col.key for col in LIST_COLUMNS)
 
 
 class TradeRepository:
 
+    @staticmethod
+    def _listable_filters():
+        # 공개 + 인벤토리 공개 가능 조건(AVAILABLE + 거래미완료)
+        return (
+            TradeListing.is_public.is_(True),
+            InventoryItem.status == ItemStatus.AVAILABLE,
+            InventoryItem.is_deal_done.is_(False),
+        )
+
     @staticmethod
     def list(
         db: Session,
@@ -21,14 +57,18 @@ class TradeRepository:
         price_min: int | None,
         price_max: int | None,
         sort: str | None,
+        cursor: str | None = None,
+        tag_mode: TagMode = "any",
     ):
-        # 공개 + 인벤토리 공개 가능 조건(AVAILABLE + 거래미완료)
+        """
+        반환 row는 LIST_COLUMNS 순서의 컬럼 tuple (ORM 엔티티 로딩 없음).
+        목록에 없는 컬럼으로 정렬하면 cursor 계산용으로 그 컬럼이 뒤에 추가됨.
+        """
         query = (
-            db.query(TradeListing, InventoryItem)
+            db.query(*LIST_COLUMNS)
+            .select_from(TradeListing)
             .join(InventoryItem, TradeListing.inventory_item_id == InventoryItem.id)
-            .filter(TradeListing.is_public.is_(True))
-            .filter(InventoryItem.status == ItemStatus.AVAILABLE)
-            .filter(InventoryItem.is_deal_done.is_(False))
+            .filter(*TradeRepository._listable_filters())
         )
 
         if trade_type:
@@ -38,15 +78,11 @@ class TradeRepository:
             query = query.filter(InventoryItem.category == category)
 
         if tag:
-            # tags 문자열에 포함되는지(간단 LIKE)
-            query = query.filter(InventoryItem.tags.ilike(f"%{tag}%"))
-
-        if keyword:
-            query = query.filter(
-                (InventoryItem.name.ilike(f"%{keyword}%")) |
-                (InventoryItem.category.ilike(f"%{keyword}%")) |
-                (InventoryItem.tags.ilike(f"%{keyword}%"))
-            )
+            # item_tags 역색인으로 정확 일치 (콤마로 여러 개, any/all)
+            query = TagRepository.filter_items(query, tag, tag_mode)
+
+        # 키워드: DB별 검색 인덱스(trigram / FULLTEXT / FTS5)로 라우팅
+        query, rank = apply_item_search(query, keyword)
 
         if price_min is not None:
             query = query.filter(TradeListing.price >= price_min)
@@ -55,29 +91,51 @@ class TradeRepository:
             query = query.filter(TradeListing.price <= price_max)
 
         # 정렬: sort=name, -price 등
-        # Listing 필드 우선, 없으면 InventoryItem 필드에서 찾음
-        if sort:
-            desc = False
-            field = sort
-            if sort.startswith("-"):
-                desc = True
-                field = sort[1:]
-
-            if hasattr(TradeListing, field):
-                col = getattr(TradeListing, field)
-            elif hasattr(InventoryItem, field):
-                col = getattr(InventoryItem, field)
-            else:
-                col = TradeListing.id
-
-            query = query.order_by(col.desc() if desc else col.asc())
+        # Listing 필드 우선, 없으면 InventoryItem 필드에서 찾음 (동점은 listing id로 정렬)
+        if rank is not None and not sort:
+            # 키워드 검색 + 정렬 미지정: 관련도순 (offset 페이징만 지원, next_cursor 없음)
+            if cursor is not None:
+                # 무시하면 1페이지가 반복되므로 거부
+                raise AppException(
+                    code="CURSOR_NOT_SUPPORTED",
+                    message="관련도순 검색에서는 cursor를 사용할 수 없습니다. page를 사용하거나 sort를 지정하세요.",
+                    status_code=400,
+                )
+            query = query.order_by(rank.desc(), TradeListing.id.asc())
+            sort_key = None
         else:
-            query = query.order_by(TradeListing.id.asc())
+            sort_key = resolve_sort(sort, TradeListing, InventoryItem, tiebreaker=TradeListing.id)
+            if not any(sort_key.column is col for col in LIST_COLUMNS):
+                query = query.add_columns(sort_key.column)
 
-        # paginate_query는 Query.count()를 쓰므로, (TradeListing, InventoryItem) 튜플이어도 동작함
-        items, meta = paginate_query(query, page, size)
+        # join + ILIKE count가 페이지 조회보다 비싸므로 total은 캐시/추정 전략 사용
+        items, meta = paginate_query(
+            query,
+            page,
+            size,
+            cursor=cursor,
+            sort_key=sort_key,
+            count_strategy=settings.TRADE_LIST_COUNT_STRATEGY,
+        )
         return items, meta
 
+    @staticmethod
+    def tag_facets(db: Session, limit: int):
+        """
+        거래 가능한 물품 기준 태그별 개수 (item_tags에서 집계, tags 문자열 스캔 없음)
+        """
+        cnt = func.count().label("count")
+        return (
+            db.query(item_tags.c.tag, cnt)
+            .join(InventoryItem, InventoryItem.id == item_tags.c.item_id)
+            .join(TradeListing, TradeListing.inventory_item_id == InventoryItem.id)
+            .filter(*TradeRepository._listable_filters())
+            .group_by(item_tags.c.tag)
+            .order_by(desc(cnt), item_tags.c.tag)
+            .limit(limit)
+            .all()
+        )
+
     @staticmethod
     def get_detail(db: Session, listing_id: int):
         return (
@@ -88,18 +146,167 @@ class TradeRepository:
         )
 
     @staticmethod
-    def list_reservations(db: Session, listing_id: int):
+    def get_version(db: Session, listing_id: int):
+        """
+        ETag용 (게시물 updated_at, 물품 updated_at). 없으면 None. 본문 컬럼은 읽지 않음.
+        """
+        return (
+            db.query(TradeListing.updated_at, InventoryItem.updated_at)
+            .join(InventoryItem, TradeListing.inventory_item_id == InventoryItem.id)
+            .filter(TradeListing.id == listing_id)
+            .first()
+        )
+
+    @staticmethod
+    def list_reservations(
+        db: Session,
+        listing_id: int,
+        start_at: datetime,
+        end_at: datetime,
+    ) -> Tuple[List[TradeReservation], Optional[datetime]]:
+        """
+        달력용: [start_at, end_at)에 걸친 유효 예약(시작 시각 순) + 구간의 마지막 수정 시각.
+        - 취소 건도 함께 읽어 Last-Modified에 반영 (취소되면 목록에서 빠지므로)
+        - 기간 없는 SELL 예약은 달력에 표시하지 않음
+        """
+        rows = (
+            db.query(TradeReservation)
+            .filter(
+                TradeReservation.listing_id == listing_id,
+                TradeReservation.status.in_(list(ReservationStatus)),
+                TradeReservation.start_at < end_at,
+                TradeReservation.end_at > start_at,
+            )
+            .order_by(TradeReservation.start_at.asc(), TradeReservation.id.asc())
+            .all()
+        )
+        last_modified = max((r.updated_at for r in rows), default=None)
+        active = [r for r in rows if r.status != ReservationStatus.CANCELED]
+        return active, last_modified
+
+    @staticmethod
+    def find_overlapping(
+        db: Session,
+        listing_id: int,
+        start_at: datetime,
+        end_at: datetime,
+    ) -> List[TradeReservation]:
+        """
+        [start_at, end_at)와 겹치는 유효(취소 제외) 대여 예약, 시작 시각 순.
+        ix_trade_reservations_listing_period 사용.
+        """
         return (
             db.query(TradeReservation)
-            .filter(TradeReservation.listing_id == listing_id)
-            .filter(TradeReservation.status != ReservationStatus.CANCELED)
-            .order_by(TradeReservation.created_at.asc())
+            .filter(
+                TradeReservation.listing_id == listing_id,
+                TradeReservation.start_at < end_at,
+                TradeReservation.end_at > start_at,
+                TradeReservation.trade_type == TradeType.RENT,
+                TradeReservation.status.in_([ReservationStatus.PENDING, ReservationStatus.CONFIRMED]),
+            )
+            .order_by(TradeReservation.start_at.asc())
             .all()
         )
 
+    @staticmethod
+    def availability(
+        db: Session,
+        listing_id: int,
+        start_at: datetime,
+        end_at: datetime,
+    ) -> Tuple[List[Tuple[datetime, datetime]], List[Tuple[datetime, datetime]]]:
+        """
+        조회 구간 안의 (예약된 구간 병합 목록, 빈 구간 목록)
+        """
+        busy: List[Tuple[datetime, datetime]] = []
+        for r in TradeRepository.find_overlapping(db, listing_id, start_at, end_at):
+            s, e = max(r.start_at, start_at), min(r.end_at, end_at)
+            if busy and s <= busy[-1][1]:
+                busy[-1] = (busy[-1][0], max(busy[-1][1], e))
+            else:
+                busy.append((s, e))
+
+        free: List[Tuple[datetime, datetime]] = []
+        cursor = start_at
+        for s, e in busy:
+            if cursor < s:
+                free.append((cursor, s))
+            cursor = max(cursor, e)
+        if cursor < end_at:
+            free.append((cursor, end_at))
+        return busy, free
+
+    @staticmethod
+    def _lock_listing(db: Session, listing_id: int) -> None:
+        if db.get_bind().dialect.name == "sqlite":
+            # SQLite는 FOR UPDATE 미지원 → no-op UPDATE로 쓰기 잠금을 먼저 잡음
+            # (updated_at을 명시해 onupdate가 돌지 않게 → 상세 ETag/응답 캐시 유지)
+            db.execute(
+                update(TradeListing)
+                .where(TradeListing.id == listing_id)
+                .values(id=TradeListing.id, updated_at=TradeListing.updated_at)
+            )
+        else:
+            db.query(TradeListing.id).filter(TradeListing.id == listing_id).with_for_update().first()
+
+    @staticmethod
+    def _is_exclusion_violation(e: IntegrityError) -> bool:
+        # Postgres ex_trade_reservations_no_overlap 위반 (psycopg2: pgcode / asyncpg: sqlstate)
+        code = getattr(e.orig, "pgcode", None) or getattr(e.orig, "sqlstate", None)
+        return code == "23P01"
+
     @staticmethod
     def create_reservation(db: Session, reservation: TradeReservation) -> TradeReservation:
+        """
+        대여(RENT) 예약은 기간 겹침 검사 후 INSERT.
+        listing 행을 잠가 같은 listing에 대한 동시 예약을 직렬화
+        (Postgres는 EXCLUDE 제약으로 한 번 더 방어)
+        """
+        if reservation.trade_type == TradeType.RENT and reservation.start_at and reservation.end_at:
+            TradeRepository._lock_listing(db, reservation.listing_id)
+            if TradeRepository.find_overlapping(
+                db, reservation.listing_id, reservation.start_at, reservation.end_at
+            ):
+                db.rollback()
+                raise ConflictException("이미 예약된 기간과 겹칩니다.")
+
         db.add(reservation)
-        db.commit()
+        try:
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            if TradeRepository._is_exclusion_violation(e):
+                raise ConflictException("이미 예약된 기간과 겹칩니다.") from e
+            raise
         db.refresh(reservation)
         return reservation
+
+
+class AsyncTradeRepository:
+    """
+    AsyncSession용 래퍼. 쿼리 조립 로직은 TradeRepository를 그대로 run_sync로 실행.
+    """
+
+    @staticmethod
+    async def list(db: AsyncSession, **kwargs):
+        return await db.run_sync(TradeRepository.list, **kwargs)
+
+    @staticmethod
+    async def tag_facets(db: AsyncSession, limit: int):
+        return await db.run_sync(TradeRepository.tag_facets, limit)
+
+    @staticmethod
+    async def get_detail(db: AsyncSession, listing_id: int):
+        return await db.run_sync(TradeRepository.get_detail, listing_id)
+
+    @staticmethod
+    async def get_version(db: AsyncSession, listing_id: int):
+        return await db.run_sync(TradeRepository.get_version, listing_id)
+
+    @staticmethod
+    async def list_reservations(db: AsyncSession, **kwargs):
+        return await db.run_sync(TradeRepository.list_reservations, **kwargs)
+
+    @staticmethod
+    async def availability(db: AsyncSession, **kwargs):
+        return await db.run_sync(TradeRepository.availability, **kwargs)
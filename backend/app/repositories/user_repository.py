@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
-from app.models.user import User
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.user import User, UserRole
 
 class UserRepository:
     @staticmethod
@@ -15,4 +16,19 @@ class UserRepository:
         db.add(user)
         db.commit()
         db.refresh(user)
-        return user
\ No newline at end of file
+        return user
+
+    @staticmethod
+    def list_club_admins(db: Session, club_id: int | None):
+        return (
+            db.query(User)
+            .filter(User.role == UserRole.ADMIN)
+            .filter(User.club_id == club_id)
+            .all()
+        )
+
+
+class AsyncUserRepository:
+    @staticmethod
+    async def list_club_admins(db: AsyncSession, club_id: int | None):
+        return await db.run_sync(UserRepository.list_club_admins, club_id)
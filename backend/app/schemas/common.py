@@ -1,6 +1,5 @@
 from typing import Generic, Optional, TypeVar, List
 from pydantic import BaseModel, Field
-from pydantic.generics import GenericModel
 
 T = TypeVar("T")
 
@@ -10,7 +9,8 @@ class ErrorInfo(BaseModel):
     message: str
 
 
-class ApiResponse(GenericModel, Generic[T]):
+# pydantic v2 네이티브 제네릭 (ApiResponse[X] 파라미터화 클래스는 pydantic이 캐시)
+class ApiResponse(BaseModel, Generic[T]):
     success: bool
     data: Optional[T] = None
     error: Optional[ErrorInfo] = None
@@ -20,15 +20,19 @@ class ApiResponse(GenericModel, Generic[T]):
 # Pagination (공통)
 # -------------------------
 class PaginationMeta(BaseModel):
-    page: int = Field(..., ge=1)
+    # cursor 모드에서는 page/total/total_pages를 계산하지 않음(None)
+    page: Optional[int] = Field(None, ge=1)
     size: int = Field(..., ge=1)
-    total: int = Field(..., ge=0)
-    total_pages: int = Field(..., ge=0)
+    total: Optional[int] = Field(None, ge=0)
+    total_pages: Optional[int] = Field(None, ge=0)
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None
+    # total이 캐시/planner 추정치이면 True
+    total_is_estimate: bool = False
 
 
-class PageData(GenericModel, Generic[T]):
+class PageData(BaseModel, Generic[T]):
     items: List[T]
     meta: PaginationMeta
 
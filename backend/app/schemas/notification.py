@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, Field
 
 
 class NotificationOut(BaseModel):
@@ -17,3 +17,17 @@ class NotificationOut(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class NotificationBulkReadRequest(BaseModel):
+    # 없으면 전체 읽음 처리
+    ids: Optional[List[int]] = Field(None, max_length=500)
+
+
+class UnreadCountOut(BaseModel):
+    unread_count: int
+
+
+class NotificationBulkReadOut(BaseModel):
+    updated: int
+    unread_count: int
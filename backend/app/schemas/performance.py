@@ -1,5 +1,5 @@
 from datetime import date, datetime
-from typing import Optional
+from typing import Dict, Optional
 from pydantic import BaseModel
 
 
@@ -23,6 +23,19 @@ class PerformanceUpdate(BaseModel):
     performance_date: Optional[date] = None
 
 
+class RatingSummary(BaseModel):
+    """
+    공개 후기 기준 집계 (histogram: 평점 1~5별 후기 수)
+    """
+    review_count: int = 0
+    rating_count: int = 0
+    rating_avg: Optional[float] = None
+    histogram: Dict[int, int] = {}
+
+    class Config:
+        from_attributes = True
+
+
 class PerformanceOut(BaseModel):
     id: int
     title: str
@@ -33,6 +46,25 @@ class PerformanceOut(BaseModel):
     performance_date: date
     club_id: Optional[int]
     school_id: Optional[int]
+    rating: Optional[RatingSummary] = None
+
+    class Config:
+        from_attributes = True
+
+
+class PerformanceListItem(BaseModel):
+    """
+    목록용 (description 제외)
+    """
+    id: int
+    title: str
+    region: str
+    theme_category: str
+    poster_image_url: Optional[str]
+    performance_date: date
+    club_id: Optional[int]
+    school_id: Optional[int]
+    rating: Optional[RatingSummary] = None
 
     class Config:
         from_attributes = True
@@ -79,3 +79,22 @@ class ReservationCalendarRange(BaseModel):
     end_at: Optional[datetime]
     trade_type: TradeType
     status: ReservationStatus
+
+
+class ReservationMonthBucket(BaseModel):
+    month: str  # YYYY-MM
+    count: int
+    ranges: List[ReservationCalendarRange]
+
+
+class TimeWindow(BaseModel):
+    start_at: datetime
+    end_at: datetime
+
+
+class ReservationAvailability(BaseModel):
+    listing_id: int
+    from_at: datetime
+    to_at: datetime
+    busy: List[TimeWindow]
+    free: List[TimeWindow]
@@ -0,0 +1,183 @@
+"""
+읽은 알림 보존 기간 정리 (cron 등으로 주기 실행)
+
+    python -m app.scripts.archive_notifications
+    python -m app.scripts.archive_notifications --days 30 --delete
+    python -m app.scripts.archive_notifications --purge-archive-days 365
+
+- 보존 기간(NOTIFICATION_RETENTION_DAYS)이 지난 "읽은" 알림만 대상 (안 읽은 알림은 유지)
+- 배치(NOTIFICATION_ARCHIVE_BATCH_SIZE)마다 commit → 긴 잠금 없이 hot 인덱스를 작게 유지
+- Postgres: notifications_archive는 월별 RANGE 파티션. 필요한 월 파티션을 미리 만들고,
+  --purge-archive-days는 오래된 월 파티션을 DROP (그 외 DB는 배치 DELETE)
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.notification import Notification
+from app.models.notification_archive import notifications_archive
+from app.repositories.notification_repository import NotificationRepository
+
+
+PARTITION_PREFIX = "notifications_archive_y"
+
+
+def _month_start(value: datetime) -> datetime:
+    return datetime(value.year, value.month, 1)
+
+
+def _next_month(value: datetime) -> datetime:
+    return datetime(value.year + value.month // 12, value.month % 12 + 1, 1)
+
+
+def _partition_name(month: datetime) -> str:
+    return f"{PARTITION_PREFIX}{month.year:04d}m{month.month:02d}"
+
+
+def _is_postgres(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def ensure_archive_partitions(db: Session, cutoff: datetime) -> List[str]:
+    """
+    보관 대상 알림의 생성 월마다 파티션 생성 (Postgres 전용, 이미 있으면 skip)
+    """
+    if not _is_postgres(db):
+        return []
+
+    oldest = db.execute(
+        select(func.min(Notification.created_at)).where(
+            Notification.is_read == True,  # noqa: E712
+            Notification.created_at < cutoff,
+        )
+    ).scalar()
+    if oldest is None:
+        return []
+
+    created = []
+    month = _month_start(oldest)
+    while month < cutoff:
+        name = _partition_name(month)
+        db.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF notifications_archive "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_next_month(month).isoformat()}')"
+            )
+        )
+        created.append(name)
+        month = _next_month(month)
+    db.commit()
+    return created
+
+
+def archive_notifications(
+    db: Session,
+    days: int,
+    batch_size: int,
+    archive: bool = True,
+    pause: float = 0.0,
+    max_batches: Optional[int] = None,
+) -> int:
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    if archive:
+        ensure_archive_partitions(db, cutoff)
+
+    total = 0
+    batches = 0
+    while True:
+        moved = NotificationRepository.archive_read_before(db, cutoff, batch_size, archive=archive)
+        total += moved
+        batches += 1
+        if moved < batch_size or (max_batches is not None and batches >= max_batches):
+            break
+        # 복제 지연 / 다른 트랜잭션에 양보
+        if pause:
+            time.sleep(pause)
+    return total
+
+
+def purge_archive(db: Session, days: int, batch_size: int) -> int:
+    """
+    보관 테이블에서 days 이전 분 삭제.
+    Postgres: 상한이 cutoff 이전인 월 파티션 DROP (삭제 행 수 대신 DROP한 파티션 수 반환)
+    """
+    cutoff = datetime.utcnow() - timedelta(days=days)
+
+    if _is_postgres(db):
+        names = db.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = 'notifications_archive' AND c.relname LIKE :prefix"
+            ),
+            {"prefix": f"{PARTITION_PREFIX}%"},
+        ).scalars()
+        dropped = 0
+        for name in sorted(names):
+            month = datetime.strptime(name[len(PARTITION_PREFIX):], "%Ym%m")
+            if _next_month(month) <= cutoff:
+                db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+                dropped += 1
+        db.commit()
+        return dropped
+
+    total = 0
+    table = notifications_archive
+    while True:
+        ids = list(
+            db.execute(
+                select(table.c.id).where(table.c.created_at < cutoff).order_by(table.c.id).limit(batch_size)
+            ).scalars()
+        )
+        if ids:
+            db.execute(delete(table).where(table.c.id.in_(ids)))
+        db.commit()
+        total += len(ids)
+        if len(ids) < batch_size:
+            return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="읽은 알림 보관/삭제")
+    parser.add_argument("--days", type=int, default=settings.NOTIFICATION_RETENTION_DAYS)
+    parser.add_argument("--batch-size", type=int, default=settings.NOTIFICATION_ARCHIVE_BATCH_SIZE)
+    parser.add_argument("--delete", action="store_true", help="보관 테이블로 옮기지 않고 삭제만")
+    parser.add_argument("--pause", type=float, default=0.0, help="배치 사이 대기(초)")
+    parser.add_argument("--max-batches", type=int, default=None)
+    parser.add_argument(
+        "--purge-archive-days",
+        type=int,
+        default=settings.NOTIFICATION_ARCHIVE_RETENTION_DAYS,
+        help="보관 테이블에서도 N일 지난 분 삭제 (0이면 유지)",
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        moved = archive_notifications(
+            db,
+            days=args.days,
+            batch_size=args.batch_size,
+            archive=not args.delete,
+            pause=args.pause,
+            max_batches=args.max_batches,
+        )
+        action = "삭제" if args.delete else "보관"
+        print(f"✅ 읽은 알림 {action}: {moved}건 ({args.days}일 이전)")
+
+        if args.purge_archive_days > 0:
+            purged = purge_archive(db, args.purge_archive_days, args.batch_size)
+            print(f"✅ 보관 알림 정리: {purged} ({args.purge_archive_days}일 이전)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+응답 압축 알고리즘/레벨별 전송 크기와 CPU 비용 비교 (DB 없이 대표 payload로 측정)
+
+    python -m app.scripts.bench_compression
+    python -m app.scripts.bench_compression --rounds 50
+
+- trade_list  : /trade/list?size=100 (컬럼 projection 목록)
+- performances: /performances 200건 (description 포함, 페이지네이션 없음)
+- posts       : /community/posts 20건 (본문 포함)
+COMPRESSION_GZIP_LEVEL / COMPRESSION_BROTLI_QUALITY 선택 참고용
+"""
+import argparse
+import time
+import zlib
+from datetime import date, datetime, timedelta
+
+from app.utils.compression import brotli
+from app.utils.responses import dumps
+
+
+def _envelope(data) -> bytes:
+    return dumps({"success": True, "data": data, "error": None})
+
+
+def trade_list_payload(n: int = 100) -> bytes:
+    items = [
+        {
+            "id": i, "trade_type": "RENT" if i % 2 else "SELL", "price": 10000 + i * 100, "deposit": 5000,
+            "is_public": True, "item_id": i, "club_id": i % 7 + 1, "name": f"무대 조명 세트 {i}",
+            "category": "조명", "tags": "조명,무대,LED", "image_path": f"/uploads/items/{i}.jpg",
+        }
+        for i in range(1, n + 1)
+    ]
+    meta = {"page": 1, "size": n, "total": n * 12, "total_pages": 12, "has_next": True, "has_prev": False,
+            "next_cursor": "eyJzIjoiVHJhZGVMaXN0aW5nLmlkIiwidiI6MTAwLCJpZCI6MTAwfQ", "total_is_estimate": True}
+    return _envelope({"items": items, "meta": meta})
+
+
+def performances_payload(n: int = 200) -> bytes:
+    start = date(2026, 1, 1)
+    return dumps([
+        {
+            "id": i, "title": f"{i}회 정기공연 <햄릿>", "region": ["서울", "부산", "대구"][i % 3],
+            "description": "셰익스피어의 비극을 현대적으로 재해석한 학생 연극 동아리의 정기 공연입니다. " * 3,
+            "theme_category": ["비극", "희극", "뮤지컬"][i % 3], "poster_image_url": f"https://cdn.example.com/p/{i}.png",
+            "performance_date": start + timedelta(days=i), "club_id": i % 20 + 1, "school_id": i % 10 + 1,
+        }
+        for i in range(1, n + 1)
+    ])
+
+
+def posts_payload(n: int = 20) -> bytes:
+    now = datetime(2026, 10, 1, 12, 0, 0)
+    return dumps([
+        {
+            "id": i, "type": "general", "title": f"소품 대여 후기 {i}",
+            "content": f"지난 공연에서 빌린 의상과 소품 상태가 아주 좋았습니다. 다음에도 이용하겠습니다. #{i} " * 8,
+            "tags": "후기,의상", "author_id": i, "club_id": None, "like_count": i * 3,
+            "created_at": now - timedelta(hours=i),
+        }
+        for i in range(1, n + 1)
+    ])
+
+
+def _time_us(fn, rounds: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 압축 벤치마크")
+    parser.add_argument("--rounds", type=int, default=30)
+    args = parser.parse_args()
+
+    payloads = {
+        "trade_list": trade_list_payload(),
+        "performances": performances_payload(),
+        "posts": posts_payload(),
+    }
+    codecs = [(f"gzip-{level}", lambda b, l=level: zlib.compress(b, l, 31)) for level in (1, 6, 9)]
+    if brotli is not None:
+        codecs += [(f"br-{q}", lambda b, q=q: brotli.compress(b, quality=q)) for q in (1, 4, 6, 11)]
+    else:
+        print("(brotli 패키지 없음: gzip만 측정)")
+
+    for name, body in payloads.items():
+        print(f"\n{name}: {len(body):,} bytes")
+        for codec, compress in codecs:
+            out = compress(body)
+            us = _time_us(lambda: compress(body), args.rounds)
+            print(f"  {codec:<8} {len(out):>8,} bytes  {len(out) / len(body):6.1%}  {us:9.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
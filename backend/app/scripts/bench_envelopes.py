@@ -0,0 +1,102 @@
+"""
+공통 응답 봉투(ApiResponse / PageData) 직렬화 마이크로벤치마크 (DB 없이 측정)
+
+    python -m app.scripts.bench_envelopes
+    python -m app.scripts.bench_envelopes --items 20 --rounds 5000
+
+봉투별 측정 구간:
+- envelope : ok(PageData(...)) 생성 + response_model(ApiResponse[PageData[X]]) 검증
+- dump_json: 검증된 봉투 → JSON bytes
+- fastapi  : envelope + dump_json + Response 생성 (response_model이 있는 라우트의 기본 경로)
+- json_ok  : 검증 없이 봉투를 바로 직렬화한 Response (app.utils.responses)
+"""
+import argparse
+import time
+from datetime import datetime
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from app.models.trade_listing import TradeType
+from app.models.inventory_item import ItemStatus
+from app.schemas.common import ApiResponse, PageData, PaginationMeta, ok
+from app.schemas.inventory import InventoryItemOut
+from app.schemas.notification import NotificationOut
+from app.schemas.trade import TradeListItem
+from app.utils.responses import json_ok
+
+
+def _trade_items(n: int):
+    return [
+        TradeListItem(
+            id=i, trade_type=TradeType.RENT, price=10000 + i, deposit=5000, is_public=True,
+            item_id=i, club_id=1, name=f"조명 {i}", category="조명", tags="조명,무대", image_path=None,
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def _inventory_items(n: int):
+    now = datetime.utcnow()
+    return [
+        InventoryItemOut(
+            id=i, club_id=1, name=f"의상 {i}", category="의상", tags="한복", size="M", contact=None,
+            image_path=None, purchased_at=None, status=ItemStatus.AVAILABLE, is_deal_done=False,
+            description="설명" * 10, created_at=now, updated_at=now,
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def _notification_items(n: int):
+    now = datetime.utcnow()
+    return [
+        NotificationOut(
+            id=i, recipient_user_id=1, type="TRADE_STATUS", entity_id=i, payload=None,
+            message="예약이 확정되었습니다.", is_read=False, created_at=now,
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def _bench(fn, rounds: int) -> float:
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1_000_000
+
+
+def run(name: str, schema, items, rounds: int) -> None:
+    meta = PaginationMeta(page=1, size=len(items), total=len(items), total_pages=1, has_next=False, has_prev=False)
+    adapter = TypeAdapter(ApiResponse[PageData[schema]])
+    validated = adapter.validate_python(ok(PageData(items=items, meta=meta)))
+
+    def fastapi_path():
+        content = adapter.validate_python(ok(PageData(items=items, meta=meta)))
+        return Response(content=adapter.dump_json(content), media_type="application/json")
+
+    envelope_us = _bench(lambda: adapter.validate_python(ok(PageData(items=items, meta=meta))), rounds)
+    dump_us = _bench(lambda: adapter.dump_json(validated), rounds)
+    fastapi_us = _bench(fastapi_path, rounds)
+    fast_us = _bench(lambda: json_ok({"items": items, "meta": meta}), rounds)
+
+    print(
+        f"{name:<13} envelope {envelope_us:7.1f} µs  dump_json {dump_us:7.1f} µs  "
+        f"fastapi {fastapi_us:7.1f} µs  json_ok {fast_us:7.1f} µs"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 봉투 마이크로벤치마크")
+    parser.add_argument("--items", type=int, default=20, help="페이지당 항목 수")
+    parser.add_argument("--rounds", type=int, default=3000)
+    args = parser.parse_args()
+
+    run("trade", TradeListItem, _trade_items(args.items), args.rounds)
+    run("inventory", InventoryItemOut, _inventory_items(args.items), args.rounds)
+    run("notification", NotificationOut, _notification_items(args.items), args.rounds)
+
+
+if __name__ == "__main__":
+    main()
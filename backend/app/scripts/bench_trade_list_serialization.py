@@ -0,0 +1,109 @@
+"""
+거래 목록 응답 직렬화 비용 비교 (DB 없이 직렬화 구간만 측정)
+
+    python -m app.scripts.bench_trade_list_serialization
+    python -m app.scripts.bench_trade_list_serialization --items 100 --rounds 500
+
+- before: (TradeListing, InventoryItem) 엔티티 → 행마다 TradeListItem 생성 → ApiResponse/PageData
+          → response_model 재검증 → JSON (FastAPI 기본 경로)
+- after : LIST_COLUMNS 컬럼 tuple → dict(zip(LIST_FIELDS)) → orjson 봉투 (json_ok)
+"""
+import argparse
+import json
+import time
+from types import SimpleNamespace
+
+from pydantic import TypeAdapter
+
+from app.models.trade_listing import TradeType
+from app.repositories.trade_repository import LIST_FIELDS
+from app.schemas.common import ApiResponse, PageData, PaginationMeta, ok
+from app.schemas.trade import TradeListItem
+from app.utils.responses import json_ok
+
+
+def _sample_rows(n: int):
+    entities = []
+    columns = []
+    for i in range(1, n + 1):
+        listing = SimpleNamespace(
+            id=i, trade_type=TradeType.RENT, price=10000 + i, deposit=5000, is_public=True
+        )
+        inv = SimpleNamespace(
+            id=i, club_id=1, name=f"조명 {i}", category="조명", tags="조명,무대", image_path=f"/img/{i}.png"
+        )
+        entities.append((listing, inv))
+        columns.append(
+            (listing.id, listing.trade_type, listing.price, listing.deposit, listing.is_public,
+             inv.id, inv.club_id, inv.name, inv.category, inv.tags, inv.image_path)
+        )
+    return entities, columns
+
+
+def _meta(n: int) -> PaginationMeta:
+    return PaginationMeta(page=1, size=n, total=n * 10, total_pages=10, has_next=True, has_prev=False)
+
+
+def before(rows, meta, adapter: TypeAdapter) -> bytes:
+    items = [
+        TradeListItem(
+            id=listing.id,
+            trade_type=listing.trade_type,
+            price=listing.price,
+            deposit=listing.deposit,
+            is_public=listing.is_public,
+            item_id=inv.id,
+            club_id=inv.club_id,
+            name=inv.name,
+            category=inv.category,
+            tags=inv.tags,
+            image_path=inv.image_path,
+        )
+        for listing, inv in rows
+    ]
+    content = ok(PageData(items=items, meta=meta))
+    # FastAPI: response_model로 다시 검증 → jsonable dict → JSONResponse(json.dumps)
+    validated = adapter.validate_python(content, from_attributes=True)
+    return json.dumps(
+        adapter.dump_python(validated, mode="json"), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def after(rows, meta) -> bytes:
+    items = [dict(zip(LIST_FIELDS, row)) for row in rows]
+    return json_ok({"items": items, "meta": meta}).body
+
+
+def _bench(fn, rounds: int) -> float:
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="거래 목록 직렬화 벤치마크")
+    parser.add_argument("--items", type=int, default=100, help="페이지당 항목 수")
+    parser.add_argument("--rounds", type=int, default=300)
+    args = parser.parse_args()
+
+    entities, columns = _sample_rows(args.items)
+    meta = _meta(args.items)
+    adapter = TypeAdapter(ApiResponse[PageData[TradeListItem]])
+
+    # 두 경로의 결과가 같은지 먼저 확인
+    assert json.loads(before(entities, meta, adapter)) == json.loads(after(columns, meta))
+
+    results = {
+        "before": _bench(lambda: before(entities, meta, adapter), args.rounds),
+        "after": _bench(lambda: after(columns, meta), args.rounds),
+    }
+    for name, seconds in results.items():
+        per_item_us = seconds / args.items * 1_000_000
+        print(f"{name:>6}: {seconds * 1000:8.3f} ms/page  {per_item_us:7.2f} µs/item")
+    print(f"speedup: x{results['before'] / results['after']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+공연별 평점 집계(performance_ratings) 재계산 / backfill
+
+    python -m app.scripts.rebuild_performance_ratings
+    python -m app.scripts.rebuild_performance_ratings --check
+    python -m app.scripts.rebuild_performance_ratings --performance-id 12 --performance-id 34
+
+- reviews를 공연 단위로 GROUP BY 해서 다시 계산하고, 값이 다른 행만 덮어씀 (없는 행은 생성)
+- 공연 id 순 배치(--batch-size)마다 commit → 긴 잠금 없이 진행
+- --check: 쓰지 않고 증분 집계와 어긋난 공연 수만 출력
+- 배치 계산 ~ 쓰기 사이에 들어온 후기 변경은 덮어써질 수 있으므로 트래픽이 적을 때 실행
+"""
+import argparse
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import case, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.performance import Performance
+from app.models.performance_rating import PerformanceRating
+from app.models.review import Review
+from app.repositories.review_repository import RATING_COUNTER_COLUMNS
+from app.utils.response_cache import PERFORMANCES, response_cache
+
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def _aggregate_columns():
+    public = Review.is_public == True  # noqa: E712
+    rated = Review.rating.isnot(None)
+
+    def total(cond, value=1):
+        return func.coalesce(func.sum(case((cond, value), else_=0)), 0)
+
+    columns = {
+        "review_count": total(public),
+        "rating_count": total(public & rated),
+        "rating_sum": total(public & rated, Review.rating),
+        "all_review_count": func.count(Review.id),
+        "all_rating_count": total(rated),
+        "all_rating_sum": total(rated, Review.rating),
+    }
+    for score in range(1, 6):
+        columns[f"rating_{score}"] = total(public & (Review.rating == score))
+        columns[f"all_rating_{score}"] = total(Review.rating == score)
+    return columns
+
+
+def compute_ratings(db: Session, performance_ids: Sequence[int]) -> Dict[int, Dict[str, int]]:
+    """
+    performance_id → 집계 컬럼 값 (후기 없는 공연은 0)
+    """
+    columns = _aggregate_columns()
+    rows = db.execute(
+        select(Performance.id, *(expr.label(name) for name, expr in columns.items()))
+        .outerjoin(Review, Review.performance_id == Performance.id)
+        .where(Performance.id.in_(performance_ids))
+        .group_by(Performance.id)
+    ).all()
+    return {row[0]: {name: int(row._mapping[name]) for name in columns} for row in rows}
+
+
+def _current_ratings(db: Session, performance_ids: Sequence[int]) -> Dict[int, Dict[str, int]]:
+    table = PerformanceRating.__table__
+    rows = db.execute(
+        select(table.c.performance_id, *(table.c[name] for name in RATING_COUNTER_COLUMNS))
+        .where(table.c.performance_id.in_(performance_ids))
+    ).all()
+    return {row[0]: {name: row._mapping[name] for name in RATING_COUNTER_COLUMNS} for row in rows}
+
+
+def rebuild_batch(db: Session, performance_ids: Sequence[int], check: bool = False) -> int:
+    """
+    한 배치 재계산. 어긋났던(또는 없던) 공연 수 반환
+    """
+    expected = compute_ratings(db, performance_ids)
+    current = _current_ratings(db, performance_ids)
+    drifted = [pid for pid, values in expected.items() if current.get(pid) != values]
+    if check or not drifted:
+        return len(drifted)
+
+    now = datetime.utcnow()
+    rows = []
+    for pid in drifted:
+        values = expected[pid]
+        avg = values["rating_sum"] / values["rating_count"] if values["rating_count"] else None
+        rows.append({"performance_id": pid, **values, "rating_avg": avg, "updated_at": now})
+
+    table = PerformanceRating.__table__
+    db.execute(delete(table).where(table.c.performance_id.in_(drifted)))
+    db.execute(insert(table), rows)
+    db.commit()
+    return len(drifted)
+
+
+def rebuild_ratings(
+    db: Session,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    performance_ids: Optional[List[int]] = None,
+    check: bool = False,
+) -> int:
+    total = 0
+    if performance_ids:
+        for start in range(0, len(performance_ids), batch_size):
+            total += rebuild_batch(db, performance_ids[start:start + batch_size], check=check)
+    else:
+        last_id = 0
+        while True:
+            ids = list(
+                db.execute(
+                    select(Performance.id).where(Performance.id > last_id).order_by(Performance.id).limit(batch_size)
+                ).scalars()
+            )
+            if not ids:
+                break
+            total += rebuild_batch(db, ids, check=check)
+            last_id = ids[-1]
+
+    if total and not check:
+        response_cache.invalidate(PERFORMANCES)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공연 평점 집계 재계산")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--performance-id", type=int, action="append", dest="performance_ids")
+    parser.add_argument("--check", action="store_true", help="쓰지 않고 어긋난 공연 수만 출력")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        count = rebuild_ratings(
+            db,
+            batch_size=args.batch_size,
+            performance_ids=args.performance_ids,
+            check=args.check,
+        )
+        if args.check:
+            print(f"🔎 집계가 어긋난 공연: {count}건")
+        else:
+            print(f"✅ 공연 평점 집계 재계산: {count}건 갱신")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.database import SessionLocal
 from app.models.school import School
 from app.models.club import Club
+from app.utils.response_cache import SCHOOLS as SCHOOLS_CACHE, response_cache
 
 
 SCHOOLS = [
@@ -111,6 +112,8 @@ def run():
             )
 
         db.commit()
+        # CACHE_BACKEND=redis면 실행 중인 서버의 학교/동아리 목록 캐시도 무효화됨
+        response_cache.invalidate(SCHOOLS_CACHE)
         print("✅ seed 완료: 학교/동아리 더미 데이터 삽입(중복 실행 안전)")
     finally:
         db.close()
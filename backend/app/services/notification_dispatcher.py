@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import get_async_sessionmaker
+from app.models.notification_outbox import NotificationOutbox
+from app.repositories.notification_outbox_repository import NotificationOutboxRepository
+from app.utils.websocket_manager import BrokerPublishError
+from app.utils.ws import ws_manager
+
+logger = logging.getLogger("replay.notification.dispatcher")
+
+
+class DispatcherMetrics:
+    """
+    outbox 전송 누적 통계 (이벤트 루프 안에서만 갱신)
+    """
+
+    def __init__(self) -> None:
+        self.batches = 0
+        self.dispatched = 0
+        self.failed_attempts = 0
+        self.dead = 0
+        self.lag_total_ms = 0.0
+        self.lag_max_ms = 0.0
+        self.last_dispatch_at: Optional[datetime] = None
+
+    def record_success(self, entries: List[NotificationOutbox], now: datetime) -> None:
+        self.batches += 1
+        self.dispatched += len(entries)
+        for entry in entries:
+            lag_ms = (now - entry.created_at).total_seconds() * 1000
+            self.lag_total_ms += lag_ms
+            self.lag_max_ms = max(self.lag_max_ms, lag_ms)
+        self.last_dispatch_at = now
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "dispatched": self.dispatched,
+            "failed_attempts": self.failed_attempts,
+            "dead": self.dead,
+            "lag_avg_ms": round(self.lag_total_ms / self.dispatched, 3) if self.dispatched else 0.0,
+            "lag_max_ms": round(self.lag_max_ms, 3),
+            "last_dispatch_at": self.last_dispatch_at.isoformat() if self.last_dispatch_at else None,
+        }
+
+
+class NotificationDispatcher:
+    """
+    notification_outbox를 배치로 읽어 WebSocket push → 성공 시 삭제, 실패 시 backoff 재시도.
+    - 같은 프로세스에서 알림이 커밋되면 wake()로 즉시 처리, 그 외(다른 워커)는 주기적 polling
+    """
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        interval: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        retry_base_seconds: Optional[float] = None,
+    ) -> None:
+        self.batch_size = batch_size or settings.NOTIFICATION_DISPATCH_BATCH_SIZE
+        self.interval = interval or settings.NOTIFICATION_DISPATCH_INTERVAL_SECONDS
+        self.max_attempts = max_attempts or settings.NOTIFICATION_DISPATCH_MAX_ATTEMPTS
+        self.retry_base_seconds = retry_base_seconds or settings.NOTIFICATION_DISPATCH_RETRY_BASE_SECONDS
+        self.metrics = DispatcherMetrics()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                processed = await self.dispatch_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Notification outbox dispatch failed")
+                processed = 0
+
+            # 배치가 가득 찼으면 밀린 행이 더 있으므로 바로 다음 배치
+            if processed >= self.batch_size:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def dispatch_once(self) -> int:
+        """
+        outbox 한 배치 처리. 처리(성공+실패)한 행 수 반환.
+        """
+        async with get_async_sessionmaker()() as db:
+            entries: List[NotificationOutbox] = await db.run_sync(
+                NotificationOutboxRepository.claim_batch, limit=self.batch_size
+            )
+            if not entries:
+                await db.rollback()
+                return 0
+
+            delivered = len(entries)
+            error: Optional[Exception] = None
+            try:
+                await ws_manager.send_frames_to_users(
+                    ((entry.recipient_user_id, entry.data) for entry in entries),
+                    strict=True,
+                )
+            except BrokerPublishError as e:
+                # 앞쪽 묶음은 이미 모든 워커에 전달됨 → 그 이후만 재시도
+                delivered, error = e.delivered, e.cause
+            except Exception as e:
+                delivered, error = 0, e
+
+            sent, failed = entries[:delivered], entries[delivered:]
+            if sent:
+                await db.run_sync(
+                    NotificationOutboxRepository.delete_many, ids=[entry.id for entry in sent]
+                )
+                self.metrics.record_success(sent, datetime.utcnow())
+            if failed:
+                logger.warning("Notification push failed (%d rows): %r", len(failed), error)
+                dead = await db.run_sync(self._mark_failed, entries=failed, error=repr(error))
+                self.metrics.failed_attempts += len(failed)
+                self.metrics.dead += dead
+
+            await db.commit()
+            return len(entries)
+
+    def _mark_failed(self, db: Session, entries: List[NotificationOutbox], error: str) -> int:
+        return NotificationOutboxRepository.mark_failed(
+            db,
+            entries,
+            error=error,
+            max_attempts=self.max_attempts,
+            retry_base_seconds=self.retry_base_seconds,
+        )
+
+    async def stats(self) -> Dict[str, Any]:
+        async with get_async_sessionmaker()() as db:
+            outbox = await db.run_sync(NotificationOutboxRepository.stats)
+        return {"running": self.running, **outbox, **self.metrics.snapshot()}
+
+
+notification_dispatcher = NotificationDispatcher()
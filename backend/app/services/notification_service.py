@@ -1,16 +1,108 @@
 from __future__ import annotations
 
-from typing import Optional
+import json
+from typing import Any, Dict, Iterable, List, Optional
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.models.notification import NotificationType
+from app.models.notification import Notification, NotificationType
 from app.repositories.notification_repository import NotificationRepository
+from app.repositories.notification_outbox_repository import NotificationOutboxRepository
 from app.schemas.notification import NotificationOut
+from app.services.notification_dispatcher import notification_dispatcher
 from app.utils.ws import ws_manager
 
 
 class NotificationService:
+    """
+    알림 저장 + 실시간 push 예약 (transactional outbox).
+    실제 WebSocket 전송은 NotificationDispatcher가 요청 밖에서 처리.
+    """
+
+    @staticmethod
+    def _frame(notification: Notification) -> str:
+        message: Dict[str, Any] = {
+            "type": "NOTIFICATION",
+            "data": NotificationOut.model_validate(notification).model_dump(mode="json"),
+        }
+        return json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+
+    @staticmethod
+    def enqueue(
+        db: Session,
+        user_ids: Iterable[int],
+        type: NotificationType,
+        message: str,
+        entity_id: Optional[int] = None,
+        payload: Optional[str] = None,
+    ) -> List[Notification]:
+        """
+        알림 + outbox 행 INSERT. commit은 호출자가 (도메인 변경과 같은 트랜잭션)
+        """
+        notifications = NotificationRepository.create_many(
+            db,
+            recipient_user_ids=user_ids,
+            type=type,
+            message=message,
+            entity_id=entity_id,
+            payload=payload,
+        )
+        NotificationOutboxRepository.add_many(
+            db,
+            [(n.id, n.recipient_user_id, NotificationService._frame(n)) for n in notifications],
+        )
+        return notifications
+
+    @staticmethod
+    async def notify_users(
+        db: Session,
+        user_ids: Iterable[int],
+        type: NotificationType,
+        message: str,
+        entity_id: Optional[int] = None,
+        payload: Optional[str] = None,
+    ) -> List[Notification]:
+        """
+        같은 알림을 여러 사용자에게 발행 (INSERT 1회 + commit 1회, push는 dispatcher)
+        """
+        notifications = NotificationService.enqueue(
+            db,
+            user_ids=user_ids,
+            type=type,
+            message=message,
+            entity_id=entity_id,
+            payload=payload,
+        )
+        db.commit()
+        notification_dispatcher.wake()
+        return notifications
+
+    @staticmethod
+    async def notify_users_async(
+        db: AsyncSession,
+        user_ids: Iterable[int],
+        type: NotificationType,
+        message: str,
+        entity_id: Optional[int] = None,
+        payload: Optional[str] = None,
+    ) -> List[Notification]:
+        """
+        notify_users의 AsyncSession 버전.
+        같은 세션에서 flush만 된 도메인 변경(예: 후기 INSERT)도 함께 commit됨.
+        """
+        notifications = await db.run_sync(
+            NotificationService.enqueue,
+            user_ids=user_ids,
+            type=type,
+            message=message,
+            entity_id=entity_id,
+            payload=payload,
+        )
+        await db.commit()
+        notification_dispatcher.wake()
+        return notifications
+
     @staticmethod
     async def notify_user(
         db: Session,
@@ -19,25 +111,49 @@ class NotificationService:
         message: str,
         entity_id: Optional[int] = None,
         payload: Optional[str] = None,
-    ):
+    ) -> Notification:
         """
-        1) 알림 DB 저장
-        2) WebSocket 실시간 push (broadcast)
+        1) 알림 DB 저장 (+ outbox)
+        2) WebSocket 실시간 push는 dispatcher가 수신자 연결에만
         """
-        notification = NotificationRepository.create(
-            db=db,
-            recipient_user_id=user_id,
+        notifications = await NotificationService.notify_users(
+            db,
+            user_ids=[user_id],
             type=type,
             message=message,
             entity_id=entity_id,
             payload=payload,
         )
+        return notifications[0]
 
-        await ws_manager.broadcast_json(
-            {
-                "type": "NOTIFICATION",
-                "data": NotificationOut.model_validate(notification).model_dump(),
-            }
+    @staticmethod
+    async def notify_user_async(
+        db: AsyncSession,
+        user_id: int,
+        type: NotificationType,
+        message: str,
+        entity_id: Optional[int] = None,
+        payload: Optional[str] = None,
+    ) -> Notification:
+        """
+        notify_user의 AsyncSession 버전 (이벤트 루프를 막지 않음)
+        """
+        notifications = await NotificationService.notify_users_async(
+            db,
+            user_ids=[user_id],
+            type=type,
+            message=message,
+            entity_id=entity_id,
+            payload=payload,
         )
+        return notifications[0]
 
-        return notification
+    @staticmethod
+    async def push_unread_count(user_id: int, unread_count: int) -> None:
+        """
+        배지 갱신용 카운터 push (본인 연결에만, 저장하지 않는 일시적 상태)
+        """
+        await ws_manager.send_to_user(
+            user_id,
+            {"type": "UNREAD_COUNT", "data": {"unread_count": unread_count}},
+        )
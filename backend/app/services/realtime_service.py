@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Optional
+
+from fastapi import BackgroundTasks
+
+from app.utils.ws import ws_manager
+
+logger = logging.getLogger("replay.websocket")
+
+
+class RealtimeService:
+    """
+    topic 구독자(/ws/notifications 의 subscribe)에게 보내는 일시적 이벤트.
+    - 프레임: {"type": "EVENT", "topic": "listing:3", "event": "reservation.created", "data": {...}}
+    - 저장/재전송하지 않음 (놓친 이벤트는 클라이언트가 목록을 다시 조회)
+    - listing: / performance: topic은 누구나 구독 가능하므로 공개 정보만 담는다
+    - commit 이후에 호출 (롤백된 변경이 나가지 않도록)
+    """
+
+    @staticmethod
+    async def publish(topic: str, event: str, data: Optional[Dict[str, Any]] = None) -> None:
+        try:
+            await ws_manager.publish(
+                topic,
+                {"type": "EVENT", "topic": topic, "event": event, "data": data or {}},
+            )
+        except Exception:
+            # 실시간 이벤트 실패가 요청/쓰기 결과에 영향을 주지 않도록
+            logger.exception("Realtime event publish failed: %s %s", topic, event)
+
+    @staticmethod
+    def publish_later(
+        background_tasks: BackgroundTasks,
+        topic: str,
+        event: str,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        동기(def) 라우트용: 응답 후 이벤트 루프에서 publish
+        """
+        background_tasks.add_task(RealtimeService.publish, topic, event, data)
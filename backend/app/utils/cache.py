@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import settings
+
+logger = logging.getLogger("replay.cache")
+
+
+class CacheBackend(ABC):
+    """
+    공통 캐시 인터페이스 (프로세스 메모리 / Redis 등)
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class MemoryCache(CacheBackend):
+    """
+    프로세스 메모리 LRU + TTL 캐시 (워커별)
+    """
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"backend": "memory", "size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+
+class RedisCache(CacheBackend):
+    """
+    워커 간 공유 캐시. 값은 JSON 직렬화 가능해야 함.
+    redis 패키지는 CACHE_BACKEND=redis 일 때만 필요.
+    """
+
+    def __init__(self, namespace: str, ttl: float, url: str) -> None:
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package.") from exc
+
+        self.prefix = f"replay:{namespace}:"
+        self.ttl = ttl
+        self._client = redis.Redis.from_url(url, socket_timeout=settings.REDIS_SOCKET_TIMEOUT)
+        self._errors = redis.RedisError
+        self.hits = 0
+        self.misses = 0
+
+    # Redis 장애 시 캐시 miss로 처리 (요청 자체는 DB로 계속 동작)
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = self._client.get(self.prefix + key)
+        except self._errors as e:
+            logger.warning("Redis cache get failed: %s", e)
+            raw = None
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        try:
+            self._client.set(
+                self.prefix + key,
+                json.dumps(value, ensure_ascii=False, default=str),
+                px=int(ttl * 1000),
+            )
+        except self._errors as e:
+            logger.warning("Redis cache set failed: %s", e)
+
+    def delete(self, key: str) -> None:
+        try:
+            self._client.delete(self.prefix + key)
+        except self._errors as e:
+            logger.warning("Redis cache delete failed: %s", e)
+
+    def clear(self) -> None:
+        try:
+            for key in self._client.scan_iter(match=self.prefix + "*"):
+                self._client.delete(key)
+        except self._errors as e:
+            logger.warning("Redis cache clear failed: %s", e)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "redis", "hits": self.hits, "misses": self.misses}
+
+
+def build_cache(namespace: str, max_entries: int, ttl: float, shared: bool = True) -> CacheBackend:
+    """
+    settings.CACHE_BACKEND(memory | redis)에 맞는 캐시 생성.
+    shared=False면 항상 프로세스 메모리 캐시.
+    """
+    if shared and settings.CACHE_BACKEND == "redis":
+        return RedisCache(namespace, ttl, settings.REDIS_URL)
+    return MemoryCache(max_entries, ttl)
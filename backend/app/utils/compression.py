@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import logging
+import zlib
+from typing import Iterable, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("replay.compression")
+
+try:
+    import brotli
+except ImportError:  # brotli는 선택 의존성 (없으면 gzip만 사용)
+    brotli = None
+
+# 압축해도 이득이 없거나 본문이 없는 상태 코드
+_NO_BODY_STATUS = {204, 304}
+
+
+class _GzipStream:
+    def __init__(self, level: int) -> None:
+        # wbits=31: gzip 헤더/트레일러 포함
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        out = self._obj.compress(data)
+        # 스트리밍 중에는 청크마다 sync flush → 클라이언트가 바로 풀 수 있음
+        return out + self._obj.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class _BrotliStream:
+    def __init__(self, quality: int) -> None:
+        self._obj = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        out = self._obj.process(data)
+        return out + (self._obj.finish() if final else self._obj.flush())
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """
+    "gzip;q=0.8, br" → {"gzip": 0.8, "br": 1.0}
+    """
+    accepted: dict[str, float] = {}
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[token] = q
+    return accepted
+
+
+class CompressionMiddleware:
+    """
+    응답 압축 (br / gzip) ASGI 미들웨어.
+    - 서버 선호 순서(algorithms) 중 클라이언트 Accept-Encoding이 허용하는 첫 알고리즘 사용
+    - content-type allowlist(접두사 일치)만 압축, 이미 Content-Encoding이 있으면 그대로 통과
+    - 한 번에 오는 본문은 minimum_size 미만이면 압축하지 않음
+    - 스트리밍 응답(more_body)은 청크 단위로 압축/flush (전체를 메모리에 모으지 않음)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        algorithms: Iterable[str] = ("br", "gzip"),
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        content_types: Iterable[str] = ("application/json", "text/"),
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.content_types = tuple(ct.strip().lower() for ct in content_types if ct.strip())
+
+        self.algorithms: List[str] = []
+        for name in (a.strip().lower() for a in algorithms):
+            if name == "br" and brotli is None:
+                logger.warning("brotli package is not installed, falling back to gzip only")
+                continue
+            if name in ("br", "gzip") and name not in self.algorithms:
+                self.algorithms.append(name)
+
+    def _choose(self, accept_encoding: str) -> Optional[str]:
+        accepted = parse_accept_encoding(accept_encoding)
+        for name in self.algorithms:
+            q = accepted.get(name, accepted.get("*", 0.0))
+            if q > 0:
+                return name
+        return None
+
+    def _compressible(self, headers: Headers) -> bool:
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").lower()
+        return content_type.startswith(self.content_types)
+
+    def _stream(self, algorithm: str):
+        if algorithm == "br":
+            return _BrotliStream(self.brotli_quality)
+        return _GzipStream(self.gzip_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.algorithms:
+            await self.app(scope, receive, send)
+            return
+
+        algorithm = self._choose(Headers(scope=scope).get("accept-encoding", ""))
+        if algorithm is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, algorithm, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, algorithm: str, send: Send) -> None:
+        self.middleware = middleware
+        self.algorithm = algorithm
+        self._send = send
+        self._start: Optional[Message] = None
+        # 압축 스트림 (첫 본문에서 압축하기로 정하면 생성)
+        self._encoder = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            # 첫 본문을 보고 압축 여부를 정해야 하므로 헤더 전송을 미룸
+            self._start = message
+            headers = Headers(raw=message["headers"])
+            if message["status"] in _NO_BODY_STATUS or not self.middleware._compressible(headers):
+                self._passthrough = True
+                await self._send(message)
+            return
+
+        if message_type != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self._encoder is None:
+            headers = MutableHeaders(raw=list(self._start["headers"]))
+            self._start["headers"] = headers.raw
+            headers.add_vary_header("Accept-Encoding")
+
+            if not more_body and len(body) < self.middleware.minimum_size:
+                # 작은 단일 본문: 압축 이득보다 CPU/헤더 비용이 큼
+                self._passthrough = True
+                await self._send(self._start)
+                await self._send(message)
+                return
+
+            self._encoder = self.middleware._stream(self.algorithm)
+            headers["Content-Encoding"] = self.algorithm
+            if more_body:
+                # 최종 길이를 알 수 없으므로 chunked 전송
+                del headers["Content-Length"]
+            else:
+                compressed = self._encoder.compress(body, final=True)
+                headers["Content-Length"] = str(len(compressed))
+                await self._send(self._start)
+                await self._send({"type": "http.response.body", "body": compressed})
+                return
+            await self._send(self._start)
+
+        await self._send(
+            {
+                "type": "http.response.body",
+                "body": self._encoder.compress(body, final=not more_body),
+                "more_body": more_body,
+            }
+        )
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import enum
+import json
+import logging
+import threading
+import time
+from typing import Dict, FrozenSet, Tuple
+
+from sqlalchemy import Table, event
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql.util import find_tables
+
+from app.config import settings
+
+logger = logging.getLogger("replay.pagination")
+
+
+class CountStrategy(str, enum.Enum):
+    EXACT = "exact"          # 매 요청 COUNT(*)
+    CACHED = "cached"        # 필터 조합별 COUNT 결과를 TTL 동안 캐시 (쓰기 시 무효화)
+    ESTIMATE = "estimate"    # Postgres planner 추정치 (그 외 DB는 cached로 대체)
+
+
+class CountCache:
+    """
+    필터 시그니처(카운트 쿼리 SQL + 파라미터) → total 캐시.
+    - 엔트리마다 참조 테이블을 기록해 두고, 해당 테이블에 쓰기가 발생하면 무효화
+    - 프로세스 메모리 기반 (워커별 캐시)
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[str, Tuple[int, float, FrozenSet[str]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> int | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            total, expires_at, _ = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return total
+
+    def set(self, key: str, total: int, tables: FrozenSet[str]) -> None:
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                # 가장 오래된 엔트리부터 제거 (dict는 삽입 순서 유지)
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (total, time.monotonic() + self.ttl_seconds, tables)
+
+    def invalidate_tables(self, tables: set[str]) -> None:
+        if not tables:
+            return
+        with self._lock:
+            stale = [k for k, (_, _, t) in self._entries.items() if t & tables]
+            for k in stale:
+                del self._entries[k]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+count_cache = CountCache(ttl_seconds=settings.COUNT_CACHE_TTL_SECONDS)
+
+
+def _query_tables(query: Query) -> FrozenSet[str]:
+    return frozenset(
+        t.name for t in find_tables(query.statement, include_joins=True) if isinstance(t, Table)
+    )
+
+
+def _signature(query: Query) -> str:
+    compiled = query.statement.compile()
+    params = sorted((k, repr(v)) for k, v in compiled.params.items())
+    return f"{compiled}|{params}"
+
+
+def _cached_count(query: Query) -> Tuple[int, bool]:
+    key = _signature(query)
+    total = count_cache.get(key)
+    if total is not None:
+        # 다른 워커의 쓰기는 TTL 전까지 반영되지 않으므로 추정치로 취급
+        return total, True
+    total = query.count()
+    count_cache.set(key, total, _query_tables(query))
+    return total, False
+
+
+def _planner_estimate(query: Query) -> int | None:
+    """
+    Postgres EXPLAIN의 Plan Rows 추정치. 실패하면 None.
+    """
+    bind = query.session.get_bind()
+    if bind.dialect.name != "postgresql":
+        return None
+    try:
+        sql = str(
+            query.statement.compile(
+                dialect=bind.dialect,
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+        row = query.session.connection().exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {sql}",
+            execution_options={"no_parameters": True},
+        ).first()
+        plan = row[0]
+        if isinstance(plan, str):
+            # asyncpg는 json 결과를 문자열로 돌려줌
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception as e:
+        logger.warning("Planner estimate failed, falling back: %s", e)
+        return None
+
+
+def count_query(query: Query, strategy: CountStrategy | str) -> Tuple[int, bool]:
+    """
+    (total, is_estimate) 반환.
+    query는 ORDER BY가 적용되기 전의 필터 쿼리여야 캐시 키가 정렬과 무관해진다.
+    """
+    strategy = CountStrategy(strategy)
+
+    if strategy == CountStrategy.ESTIMATE:
+        estimate = _planner_estimate(query)
+        if estimate is not None:
+            # 작은 결과는 정확히 세는 비용이 크지 않고, 추정 오차가 더 눈에 띔
+            if estimate >= settings.COUNT_ESTIMATE_THRESHOLD:
+                return estimate, True
+            return query.count(), False
+        strategy = CountStrategy.CACHED
+
+    if strategy == CountStrategy.CACHED:
+        return _cached_count(query)
+
+    return query.count(), False
+
+
+# 커밋 후 무효화할 테이블 이름 (Session.info)
+_PENDING_TABLES_KEY = "count_cache_invalidate"
+
+
+def _mark_written(session: Session, tables: set[str]) -> None:
+    if tables:
+        session.info.setdefault(_PENDING_TABLES_KEY, set()).update(tables)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_orm_writes(session: Session, flush_context) -> None:
+    tables: set[str] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(obj, "__table__", None)
+        if table is not None:
+            tables.add(table.name)
+    _mark_written(session, tables)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_writes(orm_execute_state) -> None:
+    # Session.execute(insert/update/delete(...)) 는 flush를 거치지 않으므로 문장의 대상 테이블로 기록
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if isinstance(table, Table):
+        _mark_written(orm_execute_state.session, {table.name})
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_counts_after_commit(session: Session) -> None:
+    # commit 전에 지우면 다른 요청이 이전 total을 다시 캐시할 수 있으므로 commit 후에
+    count_cache.invalidate_tables(session.info.pop(_PENDING_TABLES_KEY, set()))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_count_writes(session: Session) -> None:
+    session.info.pop(_PENDING_TABLES_KEY, None)
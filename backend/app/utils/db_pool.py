@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.config import settings
+
+logger = logging.getLogger("replay.db.pool")
+
+
+class PoolMetrics:
+    """
+    커넥션 체크아웃 대기시간 / 타임아웃 누적 통계.
+    (현재 사용량 size/checked_out/overflow는 pool 객체에서 직접 읽음)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.slow_checkouts = 0
+
+    def record(self, wait_ms: float, timed_out: bool) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+                self.wait_total_ms += wait_ms
+                self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+            if wait_ms >= settings.DB_POOL_SLOW_CHECKOUT_MS:
+                self.slow_checkouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "slow_checkouts": self.slow_checkouts,
+                "wait_avg_ms": round(self.wait_total_ms / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_max_ms": round(self.wait_max_ms, 3),
+            }
+
+
+class _InstrumentedPoolMixin:
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            wait_ms = (time.perf_counter() - start) * 1000
+            self.metrics.record(wait_ms, timed_out)
+            if timed_out:
+                logger.error("DB pool exhausted: %s", self.status())
+            elif wait_ms >= settings.DB_POOL_SLOW_CHECKOUT_MS:
+                logger.warning("Slow DB connection checkout (%.1fms): %s", wait_ms, self.status())
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    metrics = PoolMetrics()
+
+
+def pool_stats(pool) -> Dict[str, Any]:
+    stats: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=pool.overflow(),
+        )
+    metrics = getattr(pool, "metrics", None)
+    if isinstance(metrics, PoolMetrics):
+        stats.update(metrics.snapshot())
+    return stats
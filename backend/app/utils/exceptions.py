@@ -23,4 +23,8 @@ class UnauthorizedException(AppException):
 
 class ForbiddenException(AppException):
     def __init__(self, message: str = "권한이 없습니다."):
-        super().__init__(code="FORBIDDEN", message=message, status_code=403)
\ No newline at end of file
+        super().__init__(code="FORBIDDEN", message=message, status_code=403)
+
+class ConflictException(AppException):
+    def __init__(self, message: str = "이미 처리된 요청과 충돌합니다."):
+        super().__init__(code="CONFLICT", message=message, status_code=409)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+
+def compute_etag(data: Any) -> str:
+    """
+    응답 데이터(JSON 직렬화 가능)의 내용 기반 약한 ETag
+    """
+    raw = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return 'W/"' + hashlib.sha1(raw.encode()).hexdigest() + '"'
+
+
+def version_etag(kind: str, key: Any, *versions: Optional[datetime]) -> str:
+    """
+    행 버전(updated_at 등)으로 만든 약한 ETag — 본문을 읽거나 직렬화하지 않고 계산 가능
+    """
+    raw = f"{kind}:{key}:" + ",".join(v.isoformat() if v else "-" for v in versions)
+    return 'W/"' + hashlib.sha1(raw.encode()).hexdigest() + '"'
+
+
+def latest(*values: Optional[datetime]) -> Optional[datetime]:
+    return max((v for v in values if v is not None), default=None)
+
+
+def _http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        # DB의 naive datetime은 UTC
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc).replace(microsecond=0), usegmt=True)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # 약한 비교 (W/ 접두사 무시)
+    target = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == target for tag in header.split(","))
+
+
+def is_not_modified(request: Request, etag: Optional[str], last_modified: Optional[datetime] = None) -> bool:
+    """
+    If-None-Match가 있으면 그것만, 없으면 If-Modified-Since로 판단 (RFC 9110)
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag is not None and _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        modified = last_modified if last_modified.tzinfo else last_modified.replace(tzinfo=timezone.utc)
+        return modified.replace(microsecond=0) <= since
+    return False
+
+
+def set_validators(
+    response: Response,
+    etag: Optional[str],
+    last_modified: Optional[datetime] = None,
+    cache_control: str = "no-cache",
+) -> None:
+    """
+    no-cache: 브라우저가 저장은 하되 매번 조건부 요청으로 재검증 (변경 없으면 304)
+    """
+    if etag is not None:
+        response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = _http_date(last_modified)
+    response.headers["Cache-Control"] = cache_control
+
+
+def not_modified_response(
+    etag: Optional[str],
+    last_modified: Optional[datetime] = None,
+    cache_control: str = "no-cache",
+) -> Response:
+    response = Response(status_code=304)
+    set_validators(response, etag, last_modified, cache_control)
+    return response
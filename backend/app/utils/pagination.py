@@ -1,12 +1,30 @@
 from __future__ import annotations
 
+import base64
+import json
+from datetime import date, datetime
+from enum import Enum
 from math import ceil
-from typing import List
+from typing import Any, List, NamedTuple
 
-from sqlalchemy import asc, desc, or_
+from sqlalchemy import and_, asc, desc, or_
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.orm import Query
 
+from app.config import settings
 from app.schemas.common import PaginationMeta
+from app.utils.counting import CountStrategy, count_query
+from app.utils.exceptions import ValidationException
+
+
+class SortKey(NamedTuple):
+    """
+    정렬 기준 컬럼 + 동점 처리용 tiebreaker(보통 PK).
+    keyset(cursor) 페이징은 (column, tiebreaker) 조합이 유일해야 동작한다.
+    """
+    column: Any
+    descending: bool
+    tiebreaker: Any
 
 
 def apply_keyword_filter(query: Query, keyword: str | None, columns: List):
@@ -16,6 +34,33 @@ def apply_keyword_filter(query: Query, keyword: str | None, columns: List):
     return query.filter(or_(*[col.ilike(f"%{keyword}%") for col in columns]))
 
 
+def _get_column(model, field: str):
+    # relationship / 메서드 등 컬럼이 아닌 속성은 정렬 대상에서 제외
+    attr = getattr(model, field, None)
+    if attr is None or not hasattr(getattr(attr, "property", None), "columns"):
+        return None
+    return attr
+
+
+def resolve_sort(sort: str | None, *models, tiebreaker) -> SortKey:
+    """
+    sort=name, -price 형태의 문자열을 SortKey로 변환.
+    models 순서대로 필드를 찾고, 없으면 tiebreaker 기준 오름차순.
+    """
+    if not sort:
+        return SortKey(tiebreaker, False, tiebreaker)
+
+    descending = sort.startswith("-")
+    field = sort[1:] if descending else sort
+
+    for model in models:
+        col = _get_column(model, field)
+        if col is not None:
+            return SortKey(col, descending, tiebreaker)
+
+    return SortKey(tiebreaker, False, tiebreaker)
+
+
 def apply_sort(query: Query, sort: str | None, model):
     if not sort:
         return query
@@ -33,28 +78,223 @@ def apply_sort(query: Query, sort: str | None, model):
     return query.order_by(direction(getattr(model, field)))
 
 
-def paginate_query(query: Query, page: int, size: int):
+# -------------------------
+# Cursor (keyset) 인코딩
+# -------------------------
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+    return value
+
+
+def _sort_signature(sort_key: SortKey) -> str:
+    col = sort_key.column
+    return f"{'-' if sort_key.descending else ''}{col.class_.__name__}.{col.key}"
+
+
+def encode_cursor(sort_key: SortKey, value, tiebreaker_value) -> str:
+    raw = json.dumps(
+        {
+            "s": _sort_signature(sort_key),
+            "v": _encode_value(value),
+            "id": tiebreaker_value,
+        },
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(sort_key: SortKey, cursor: str):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        signature, value, tiebreaker_value = data["s"], data["v"], data["id"]
+    except (ValueError, KeyError, TypeError):
+        raise ValidationException("유효하지 않은 커서입니다.")
+
+    # 정렬 조건이 바뀐 커서는 위치가 의미 없으므로 거부
+    if signature != _sort_signature(sort_key):
+        raise ValidationException("정렬 조건과 맞지 않는 커서입니다.")
+
+    return _decode_value(value), tiebreaker_value
+
+
+# -------------------------
+# Keyset 정렬 / 필터
+# -------------------------
+def _is_nullable(col) -> bool:
+    return any(getattr(c, "nullable", False) for c in col.property.columns)
+
+
+def _apply_keyset_order(query: Query, sort_key: SortKey) -> Query:
+    col, descending, tiebreaker = sort_key
+    direction = desc if descending else asc
+
+    if col is tiebreaker:
+        return query.order_by(direction(col))
+
+    # NULL 정렬 위치는 DB마다 다르므로 nullable 컬럼은 항상 NULL을 마지막으로 고정
+    if _is_nullable(col):
+        query = query.order_by(col.is_(None))
+
+    return query.order_by(direction(col), direction(tiebreaker))
+
+
+def _keyset_filter(sort_key: SortKey, value, tiebreaker_value):
+    col, descending, tiebreaker = sort_key
+
+    def after(c, v):
+        return c < v if descending else c > v
+
+    if col is tiebreaker:
+        return after(tiebreaker, tiebreaker_value)
+
+    if value is None:
+        # NULL 구간(마지막)에서는 tiebreaker로만 진행
+        return and_(col.is_(None), after(tiebreaker, tiebreaker_value))
+
+    cond = or_(
+        after(col, value),
+        and_(col == value, after(tiebreaker, tiebreaker_value)),
+    )
+    if _is_nullable(col):
+        cond = or_(cond, col.is_(None))
+    return cond
+
+
+def _row_value(row, col):
+    # (TradeListing, InventoryItem) 같은 튜플 row, 컬럼 projection row,
+    # 1:1 관계로 함께 로드한 엔티티(Performance.rating 등)도 지원
+    entity = col.class_
+    if isinstance(row, entity):
+        return getattr(row, col.key)
+    mapper = sa_inspect(type(row), raiseerr=False)
+    if mapper is not None:
+        for rel in mapper.relationships:
+            if rel.mapper.class_ is entity and not rel.uselist:
+                related = getattr(row, rel.key)
+                return getattr(related, col.key) if related is not None else None
+    for part in row:
+        if isinstance(part, entity):
+            return getattr(part, col.key)
+    mapping = getattr(row, "_mapping", None)
+    if mapping is not None and col in mapping:
+        return mapping[col]
+    raise ValueError(f"row does not contain {entity.__name__}.{col.key}")
+
+
+def _next_cursor(items: list, sort_key: SortKey) -> str | None:
+    if not items:
+        return None
+    last = items[-1]
+    return encode_cursor(
+        sort_key,
+        _row_value(last, sort_key.column),
+        _row_value(last, sort_key.tiebreaker),
+    )
+
+
+def paginate_query(
+    query: Query,
+    page: int,
+    size: int,
+    *,
+    cursor: str | None = None,
+    sort_key: SortKey | None = None,
+    count_strategy: CountStrategy | str | None = None,
+):
+    """
+    - 기본(offset) 모드: count + OFFSET/LIMIT
+    - cursor 모드(sort_key + cursor): count 없이 keyset 조건으로 size+1개만 조회
+
+    sort_key를 넘기면 정렬도 여기서 적용하고, 다음 페이지용 next_cursor를 meta에 담는다.
+    (첫 페이지는 offset으로 받고 이후 next_cursor로 이어서 조회하는 방식)
+
+    count_strategy(기본: settings.PAGINATION_COUNT_STRATEGY)
+    - exact: 매번 COUNT
+    - cached / estimate: 캐시·추정 total 사용, has_next는 size+1 조회로 정확히 판단
+    """
     # 안전장치 (page/size 최소값)
     page = max(page, 1)
     size = max(size, 1)
 
-    total = query.count()
+    # count는 정렬 전 쿼리 기준 (캐시 키가 정렬과 무관하도록)
+    count_base = query
+
+    if sort_key is not None:
+        query = _apply_keyset_order(query, sort_key)
+
+    if cursor is not None and sort_key is not None:
+        value, tiebreaker_value = decode_cursor(sort_key, cursor)
+        query = query.filter(_keyset_filter(sort_key, value, tiebreaker_value))
+
+        rows = query.limit(size + 1).all()
+        has_next = len(rows) > size
+        items = rows[:size]
+
+        meta = PaginationMeta(
+            page=None,
+            size=size,
+            total=None,
+            total_pages=None,
+            has_next=has_next,
+            has_prev=True,
+            next_cursor=_next_cursor(items, sort_key) if has_next else None,
+        )
+        return items, meta
+
+    strategy = CountStrategy(count_strategy or settings.PAGINATION_COUNT_STRATEGY)
+    offset = (page - 1) * size
+
+    if strategy == CountStrategy.EXACT:
+        total, total_is_estimate = count_query(count_base, strategy)
+        items = query.offset(offset).limit(size).all()
+        has_next = offset + len(items) < total
+    else:
+        rows = query.offset(offset).limit(size + 1).all()
+        has_next = len(rows) > size
+        items = rows[:size]
+
+        if has_next:
+            total, total_is_estimate = count_query(count_base, strategy)
+            # 추정치가 실제로 본 행 수보다 작을 수는 없음
+            total = max(total, offset + len(items) + 1)
+        elif items or page == 1:
+            # 마지막 페이지에 도달했으면 total을 정확히 알 수 있음
+            total, total_is_estimate = offset + len(items), False
+        else:
+            # 범위를 벗어난 page
+            total, total_is_estimate = count_query(count_base, strategy)
+
     total_pages = ceil(total / size) if total else 0
 
-    items = (
-        query
-        .offset((page - 1) * size)
-        .limit(size)
-        .all()
-    )
+    next_cursor = None
+    if has_next and sort_key is not None:
+        next_cursor = _next_cursor(items, sort_key)
 
     meta = PaginationMeta(
         page=page,
         size=size,
-        total=total,                 
+        total=total,
         total_pages=total_pages,
-        has_next=page < total_pages,
+        has_next=has_next,
         has_prev=page > 1,
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
     )
 
     return items, meta
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import threading
+import uuid
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.utils.cache import CacheBackend, build_cache
+
+# 캐시 그룹 (쓰기 시 그룹 단위로 무효화)
+PERFORMANCES = "performances"
+TRADE = "trade"
+SCHOOLS = "schools"
+
+# 커밋 후 무효화할 그룹 (Session.info)
+_PENDING_KEY = "response_cache_invalidate"
+
+# 그룹 세대(generation) 토큰은 항목보다 오래 유지 (만료/축출되면 새 토큰 → 그룹 전체 miss로 안전하게 처리)
+GENERATION_TTL_SECONDS = 24 * 60 * 60
+
+
+@lru_cache(maxsize=None)
+def _adapter(response_type: Any) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+
+def normalize_query(request: Request) -> str:
+    """
+    쿼리 파라미터를 이름/값 순으로 정렬하고 빈 값은 제외 (?b=1&a=2 와 ?a=2&b=1&c= 는 같은 키)
+    """
+    items = sorted((k, v) for k, v in request.query_params.multi_items() if v != "")
+    return urlencode(items)
+
+
+class ResponseCache:
+    """
+    공개 조회(GET) 응답 캐시.
+    - 키: 그룹 + 세대 토큰 + 경로 + 정규화된 쿼리 파라미터, 값: 직렬화된 JSON 본문
+    - 무효화: 그룹 세대 토큰을 바꿔 기존 키를 한 번에 무효화 (이전 항목은 TTL/LRU로 자연 정리)
+    - 세대 토큰도 같은 백엔드에 저장 → CACHE_BACKEND=redis면 다른 워커의 쓰기도 즉시 반영
+      (memory면 쓰기를 처리한 워커만 즉시, 나머지는 TTL 이내 반영)
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float, enabled: bool = True) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "invalidations": 0}
+        )
+
+    def _count(self, group: str, name: str) -> None:
+        with self._lock:
+            self._metrics[group][name] += 1
+
+    def _generation(self, group: str) -> str:
+        key = f"{group}:gen"
+        generation = self.backend.get(key)
+        if generation is None:
+            generation = uuid.uuid4().hex
+            self.backend.set(key, generation, ttl=GENERATION_TTL_SECONDS)
+        return generation
+
+    def _key(self, group: str, request: Request, variant: str) -> str:
+        return f"{group}:{self._generation(group)}:{request.url.path}?{normalize_query(request)}#{variant}"
+
+    def get(self, group: str, request: Request, variant: str = "") -> Optional[Response]:
+        """
+        캐시된 응답이 있으면 Response, 없으면 None (캐시 비활성화 시 항상 None)
+        variant: 키에 덧붙일 값 (예: 행 버전 ETag → 버전이 바뀌면 무효화 없이도 miss)
+        """
+        if not self.enabled:
+            return None
+        body = self.backend.get(self._key(group, request, variant))
+        if body is None:
+            self._count(group, "misses")
+            return None
+        self._count(group, "hits")
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={"X-Cache": "HIT"},
+        )
+
+    def put(
+        self,
+        group: str,
+        request: Request,
+        response_type: Any,
+        content: Any,
+        variant: str = "",
+    ) -> Response:
+        """
+        content를 response_type(라우트의 response_model과 동일)으로 검증/직렬화해 저장하고 응답으로 반환.
+        ORM 객체도 그대로 넘길 수 있음 (from_attributes)
+        """
+        adapter = _adapter(response_type)
+        body = adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+        if self.enabled:
+            self.backend.set(self._key(group, request, variant), body.decode("utf-8"), ttl=self.ttl)
+        return Response(content=body, media_type="application/json", headers={"X-Cache": "MISS"})
+
+    def invalidate(self, *groups: str) -> None:
+        for group in groups:
+            self.backend.set(f"{group}:gen", uuid.uuid4().hex, ttl=GENERATION_TTL_SECONDS)
+            self._count(group, "invalidations")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            groups = {group: dict(metrics) for group, metrics in self._metrics.items()}
+        for metrics in groups.values():
+            lookups = metrics["hits"] + metrics["misses"]
+            metrics["hit_ratio"] = round(metrics["hits"] / lookups, 3) if lookups else 0.0
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl,
+            "groups": groups,
+            "backend": self.backend.stats(),
+        }
+
+
+response_cache = ResponseCache(
+    build_cache(
+        "response",
+        max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+        ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+    ),
+    ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+    enabled=settings.RESPONSE_CACHE_ENABLED,
+)
+
+
+def invalidate_on_commit(db: Session, *groups: str) -> None:
+    """
+    현재 트랜잭션이 commit되면 groups 무효화 (rollback되면 취소).
+    commit 위치가 호출자에게 있는 경우(commit=False 흐름)에도 커밋 전 값이 다시 캐시되지 않도록
+    """
+    db.info.setdefault(_PENDING_KEY, set()).update(groups)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    groups = session.info.pop(_PENDING_KEY, None)
+    if groups:
+        response_cache.invalidate(*groups)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import logging
+from typing import Tuple
+
+from sqlalchemy import Float, Integer, func, or_, text
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Query
+
+from app.config import settings
+from app.models.inventory_item import InventoryItem
+
+logger = logging.getLogger("replay.search")
+
+# Alembic 마이그레이션(물품 검색 인덱스)에서 생성하는 객체 이름
+SQLITE_FTS_TABLE = "inventory_items_fts"
+
+# 인덱스가 활용 가능한 최소 키워드 길이 (FTS5 trigram: 3, MySQL ngram: 2)
+_SQLITE_MIN_LEN = 3
+_MYSQL_MIN_LEN = 2
+
+_sqlite_fts_available: dict[str, bool] = {}
+
+
+def _like_filter(keyword: str):
+    like = f"%{keyword}%"
+    return or_(
+        InventoryItem.name.ilike(like),
+        InventoryItem.category.ilike(like),
+        InventoryItem.tags.ilike(like),
+    )
+
+
+def _has_sqlite_fts(query: Query) -> bool:
+    bind = query.session.get_bind()
+    key = str(bind.url)
+    if key not in _sqlite_fts_available:
+        row = query.session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": SQLITE_FTS_TABLE},
+        ).first()
+        _sqlite_fts_available[key] = row is not None
+        if row is None:
+            logger.info("%s not found, keyword search falls back to LIKE", SQLITE_FTS_TABLE)
+    return _sqlite_fts_available[key]
+
+
+def apply_item_search(query: Query, keyword: str | None) -> Tuple[Query, object | None]:
+    """
+    InventoryItem(name/category/tags) 키워드 검색.
+    DB별 검색 인덱스로 라우팅하고, 정렬에 쓸 수 있는 rank 표현식(클수록 관련도 높음)을 함께 반환.
+
+    - postgresql: pg_trgm GIN 인덱스가 ILIKE '%kw%'를 그대로 처리, rank = similarity
+    - mysql     : ngram FULLTEXT 인덱스 + MATCH ... AGAINST
+    - sqlite    : FTS5(trigram) 가상 테이블 + bm25 (로컬 개발용)
+    - 그 외 / 인덱스 미사용 가능 키워드: 기존 ILIKE (rank 없음)
+    """
+    if not keyword:
+        return query, None
+
+    keyword = keyword.strip()
+    if not keyword:
+        return query, None
+
+    dialect = query.session.get_bind().dialect.name
+    if settings.SEARCH_BACKEND == "like":
+        dialect = "like"
+
+    if dialect == "postgresql":
+        rank = func.greatest(
+            func.similarity(InventoryItem.name, keyword),
+            func.similarity(func.coalesce(InventoryItem.category, ""), keyword),
+            func.similarity(func.coalesce(InventoryItem.tags, ""), keyword),
+        )
+        return query.filter(_like_filter(keyword)), rank
+
+    if dialect == "mysql" and len(keyword) >= _MYSQL_MIN_LEN:
+        # ngram parser: 큰따옴표 phrase 검색이어야 부분 문자열 의미가 유지됨
+        phrase = '"' + keyword.replace('"', " ") + '"'
+        cond = match(
+            InventoryItem.name, InventoryItem.category, InventoryItem.tags,
+            against=phrase,
+        ).in_boolean_mode()
+        rank = match(
+            InventoryItem.name, InventoryItem.category, InventoryItem.tags,
+            against=keyword,
+        ).in_natural_language_mode()
+        return query.filter(cond), rank
+
+    if dialect == "sqlite" and len(keyword) >= _SQLITE_MIN_LEN and _has_sqlite_fts(query):
+        phrase = '"' + keyword.replace('"', '""') + '"'
+        fts = (
+            text(
+                f"SELECT rowid AS item_id, bm25({SQLITE_FTS_TABLE}) AS score "
+                f"FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH :fts_query"
+            )
+            .bindparams(fts_query=phrase)
+            .columns(item_id=Integer, score=Float)
+            .subquery("item_fts")
+        )
+        query = query.join(fts, fts.c.item_id == InventoryItem.id)
+        # bm25는 작을수록 관련도가 높음
+        return query, -fts.c.score
+
+    return query.filter(_like_filter(keyword)), None
@@ -1,59 +1,367 @@
+import asyncio
+import json
 import logging
-from typing import List, Any, Dict
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-from fastapi import WebSocket
+from fastapi import WebSocket, status
+
+from app.config import settings
+from app.utils.ws_broker import MemoryBroker, PubSubBroker
 
 logger = logging.getLogger("replay.websocket")
 
+SLOW_CONSUMER_POLICIES = ("drop_oldest", "disconnect")
+
+# 구독 가능한 topic prefix (예: "listing:3", "performance:7", "club:2")
+TOPIC_PREFIXES = ("club", "listing", "performance")
+
+
+class BrokerPublishError(Exception):
+    """
+    묶음 전송 중 broker publish 실패. delivered: 앞에서부터 이미 전달된 항목 수
+    """
+
+    def __init__(self, delivered: int, cause: Exception) -> None:
+        super().__init__(f"broker publish failed after {delivered} items: {cause!r}")
+        self.delivered = delivered
+        self.cause = cause
+
+
+def parse_topic(topic: str) -> Optional[str]:
+    """
+    "listing:3" 형태만 허용. 올바르지 않으면 None.
+    """
+    prefix, _, entity_id = topic.partition(":")
+    if prefix not in TOPIC_PREFIXES or not entity_id.isdigit():
+        return None
+    return f"{prefix}:{int(entity_id)}"
+
+
+class WebSocketMetrics:
+    """
+    송신 큐 / 전송 지연 누적 통계 (이벤트 루프 안에서만 갱신되므로 lock 없음)
+    """
+
+    def __init__(self) -> None:
+        self.enqueued = 0
+        self.sent = 0
+        self.dropped = 0
+        self.slow_disconnects = 0
+        self.send_errors = 0
+        self.send_total_ms = 0.0
+        self.send_max_ms = 0.0
+        self.queue_wait_total_ms = 0.0
+        self.queue_wait_max_ms = 0.0
+
+    def record_send(self, wait_ms: float, send_ms: float) -> None:
+        self.sent += 1
+        self.send_total_ms += send_ms
+        self.send_max_ms = max(self.send_max_ms, send_ms)
+        self.queue_wait_total_ms += wait_ms
+        self.queue_wait_max_ms = max(self.queue_wait_max_ms, wait_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "slow_disconnects": self.slow_disconnects,
+            "send_errors": self.send_errors,
+            "send_avg_ms": round(self.send_total_ms / self.sent, 3) if self.sent else 0.0,
+            "send_max_ms": round(self.send_max_ms, 3),
+            "queue_wait_avg_ms": round(self.queue_wait_total_ms / self.sent, 3) if self.sent else 0.0,
+            "queue_wait_max_ms": round(self.queue_wait_max_ms, 3),
+        }
+
 
 class WebSocketManager:
     """
     WebSocket 연결을 관리하는 기본 매니저.
-    - 현재는 메모리 기반 리스트로 연결 관리
-    - TODO: 추후 Redis 등 외부 스토리지/브로커로 확장 가능
+    - 연결을 user_id / topic 별로 색인 → 수신자 소켓에만 전송 (O(수신자 연결 수))
+    - 메시지는 한 번만 직렬화해서 send_text
+    - 연결마다 bounded 송신 큐 + writer task → 느린 클라이언트가 다른 연결의 전송을 막지 않음
+      큐가 가득 차면 정책에 따라 가장 오래된 메시지를 버리거나(drop_oldest) 연결을 끊음(disconnect)
+    - 멀티 워커: broker(Redis / Postgres LISTEN-NOTIFY)로 모든 워커에 중계 후 각자 로컬 소켓에 전달
     """
 
-    def __init__(self) -> None:
-        self.active_connections: List[WebSocket] = []
+    def __init__(
+        self,
+        queue_size: Optional[int] = None,
+        slow_consumer_policy: Optional[str] = None,
+        send_timeout: Optional[float] = None,
+        broker: Optional[PubSubBroker] = None,
+    ) -> None:
+        self.queue_size = queue_size or settings.WS_SEND_QUEUE_SIZE
+        self.slow_consumer_policy = slow_consumer_policy or settings.WS_SLOW_CONSUMER_POLICY
+        if self.slow_consumer_policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(f"Unknown WS_SLOW_CONSUMER_POLICY: {self.slow_consumer_policy}")
+        self.send_timeout = send_timeout or settings.WS_SEND_TIMEOUT_SECONDS
+        self.metrics = WebSocketMetrics()
+        self.broker = broker or MemoryBroker()
+        self._broker_started = False
 
-    async def connect(self, websocket: WebSocket) -> None:
+        self.active_connections: Set[WebSocket] = set()
+        self._queues: Dict[WebSocket, "asyncio.Queue[Tuple[str, float]]"] = {}
+        self._writers: Dict[WebSocket, "asyncio.Task[None]"] = {}
+        self._by_user: Dict[int, Set[WebSocket]] = {}
+        self._by_topic: Dict[str, Set[WebSocket]] = {}
+        self._user_of: Dict[WebSocket, int] = {}
+        self._topics_of: Dict[WebSocket, Set[str]] = {}
+
+    async def connect(self, websocket: WebSocket, user_id: Optional[int] = None) -> None:
         """
         새로운 클라이언트 연결을 받아들이고 목록에 추가한다.
+        user_id가 있으면(인증된 연결) 사용자 색인에도 등록한다.
         """
         await websocket.accept()
-        self.active_connections.append(websocket)
-        logger.info("WebSocket connected. current=%d", len(self.active_connections))
+        self.active_connections.add(websocket)
+        self._queues[websocket] = asyncio.Queue(maxsize=self.queue_size)
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket))
+        if user_id is not None:
+            self._user_of[websocket] = user_id
+            self._by_user.setdefault(user_id, set()).add(websocket)
+        logger.info("WebSocket connected. user=%s current=%d", user_id, len(self.active_connections))
 
     def disconnect(self, websocket: WebSocket) -> None:
         """
-        클라이언트 연결을 목록에서 제거한다.
+        클라이언트 연결을 목록/색인에서 제거한다.
         """
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-            logger.info("WebSocket disconnected. current=%d", len(self.active_connections))
+        if websocket not in self.active_connections:
+            return
+        self.active_connections.discard(websocket)
+        self._queues.pop(websocket, None)
+
+        # writer task 안에서 호출된 경우(전송 실패)는 스스로 종료하므로 cancel하지 않음
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+
+        user_id = self._user_of.pop(websocket, None)
+        if user_id is not None:
+            self._discard(self._by_user, user_id, websocket)
+
+        for topic in self._topics_of.pop(websocket, set()):
+            self._discard(self._by_topic, topic, websocket)
+
+        logger.info("WebSocket disconnected. user=%s current=%d", user_id, len(self.active_connections))
+
+    @staticmethod
+    def _discard(index: Dict[Any, Set[WebSocket]], key: Any, websocket: WebSocket) -> None:
+        sockets = index.get(key)
+        if sockets is None:
+            return
+        sockets.discard(websocket)
+        if not sockets:
+            del index[key]
+
+    def subscribe(self, websocket: WebSocket, topic: str) -> None:
+        if websocket not in self.active_connections:
+            return
+        self._topics_of.setdefault(websocket, set()).add(topic)
+        self._by_topic.setdefault(topic, set()).add(websocket)
+
+    def unsubscribe(self, websocket: WebSocket, topic: str) -> None:
+        topics = self._topics_of.get(websocket)
+        if topics is not None:
+            topics.discard(topic)
+        self._discard(self._by_topic, topic, websocket)
+
+    def user_connection_count(self, user_id: int) -> int:
+        return len(self._by_user.get(user_id, ()))
+
+    def queue_depths(self) -> Dict[str, int]:
+        depths = [queue.qsize() for queue in self._queues.values()]
+        return {
+            "queue_depth_total": sum(depths),
+            "queue_depth_max": max(depths, default=0),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "connections": len(self.active_connections),
+            "users": len(self._by_user),
+            "topics": len(self._by_topic),
+            "queue_size": self.queue_size,
+            "slow_consumer_policy": self.slow_consumer_policy,
+            "broker": type(self.broker).__name__,
+            **self.queue_depths(),
+            **self.metrics.snapshot(),
+        }
+
+    # ------------------------------------------------------------------
+    # 송신 큐 / writer task
+    # ------------------------------------------------------------------
+    async def _writer(self, websocket: WebSocket) -> None:
+        queue = self._queues[websocket]
+        while True:
+            message, enqueued_at = await queue.get()
+            start = time.perf_counter()
+            try:
+                await asyncio.wait_for(websocket.send_text(message), timeout=self.send_timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("WebSocket send failed: %r", e)
+                self.metrics.send_errors += 1
+                self.disconnect(websocket)
+                # 타임아웃 등으로 아직 열려 있는 소켓도 닫아 수신 루프가 끝나고 클라이언트가 재연결하도록
+                asyncio.create_task(self._close(websocket, status.WS_1011_INTERNAL_ERROR))
+                return
+            end = time.perf_counter()
+            self.metrics.record_send((start - enqueued_at) * 1000, (end - start) * 1000)
+
+    def _enqueue(self, websocket: WebSocket, message: str) -> bool:
+        queue = self._queues.get(websocket)
+        if queue is None:
+            return False
+
+        if queue.full():
+            if self.slow_consumer_policy == "disconnect":
+                self.metrics.slow_disconnects += 1
+                logger.warning("Slow WebSocket consumer disconnected. user=%s", self._user_of.get(websocket))
+                self.disconnect(websocket)
+                asyncio.create_task(self._close(websocket, status.WS_1013_TRY_AGAIN_LATER))
+                return False
+            queue.get_nowait()
+            self.metrics.dropped += 1
+
+        queue.put_nowait((message, time.perf_counter()))
+        self.metrics.enqueued += 1
+        return True
+
+    @staticmethod
+    async def _close(websocket: WebSocket, code: int) -> None:
+        try:
+            await websocket.close(code=code)
+        except Exception:
+            pass
 
     async def send_personal_text(self, websocket: WebSocket, message: str) -> None:
-        await websocket.send_text(message)
+        self._enqueue(websocket, message)
 
     async def send_personal_json(self, websocket: WebSocket, data: Dict[str, Any]) -> None:
-        await websocket.send_json(data)
+        self._enqueue(websocket, self._dumps(data))
 
-    async def broadcast_text(self, message: str) -> None:
+    @staticmethod
+    def _dumps(data: Dict[str, Any]) -> str:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+
+    # ------------------------------------------------------------------
+    # 워커 간 전달 (broker) → 각 워커가 자기 소켓에만 enqueue
+    # ------------------------------------------------------------------
+    async def start(self) -> None:
         """
-        연결된 모든 클라이언트에게 텍스트 메시지를 전송한다.
+        앱 시작 시 호출. 시작 전에는 현재 프로세스 소켓에만 전달.
+        """
+        await self.broker.start(self._on_broker_message)
+        self._broker_started = True
+
+    async def stop(self) -> None:
+        self._broker_started = False
+        await self.broker.stop()
+        for websocket in list(self.active_connections):
+            self.disconnect(websocket)
+
+    def _on_broker_message(self, message: str) -> None:
+        envelope = json.loads(message)
+        self._deliver_local(envelope["kind"], envelope.get("key"), envelope["frame"])
+
+    def _deliver_local(self, kind: str, key: Any, frame: Any) -> int:
+        """
+        직렬화된 프레임을 각 연결의 큐에 넣기만 함 (실제 전송은 writer task가 병렬로)
+        """
+        if kind == "batch":
+            return sum(self._deliver_local(*item) for item in frame)
+        if kind == "user":
+            connections = self._by_user.get(key, ())
+        elif kind == "topic":
+            connections = self._by_topic.get(key, ())
+        else:
+            connections = self.active_connections
+        return sum(self._enqueue(connection, frame) for connection in list(connections))
+
+    async def _route(self, kind: str, key: Any, frame: Any, strict: bool = False) -> None:
+        """
+        strict=True면 broker 실패를 그대로 raise (호출자가 재시도, 예: outbox dispatcher)
         """
-        for connection in list(self.active_connections):
+        if self._broker_started:
             try:
-                await connection.send_text(message)
+                await self.broker.publish(self._dumps({"kind": kind, "key": key, "frame": frame}))
             except Exception as e:
-                logger.warning("Broadcast text failed: %s", e)
+                if strict:
+                    raise
+                # 브로커 장애 시 최소한 현재 워커의 연결에는 전달
+                logger.warning("WebSocket broker publish failed: %r", e)
+                self._deliver_local(kind, key, frame)
+        else:
+            self._deliver_local(kind, key, frame)
+        # 연속 publish 시 writer task가 큐를 비울 기회를 줌
+        await asyncio.sleep(0)
 
-    async def broadcast_json(self, data: Dict[str, Any]) -> None:
+    async def send_to_user(self, user_id: int, data: Dict[str, Any]) -> None:
+        """
+        특정 사용자의 연결(여러 탭/기기, 모든 워커)에만 전송.
+        """
+        await self._route("user", user_id, self._dumps(data))
+
+    async def send_to_users(self, messages: Iterable[Tuple[int, Dict[str, Any]]]) -> None:
         """
-        연결된 모든 클라이언트에게 JSON 메시지를 전송한다.
+        (user_id, data) 여러 건을 broker 메시지 1건으로 묶어 전송.
         """
-        for connection in list(self.active_connections):
+        await self.send_frames_to_users((user_id, self._dumps(data)) for user_id, data in messages)
+
+    async def send_frames_to_users(self, frames: Iterable[Tuple[int, str]], strict: bool = False) -> None:
+        """
+        이미 직렬화된 (user_id, frame) 여러 건 전송.
+        broker 메시지 크기 한도가 있으면(Postgres NOTIFY) 한도 안으로 나눠 순서대로 publish.
+        strict=True에서 실패하면 BrokerPublishError (delivered 이후 항목은 다른 워커에 전달되지 않음)
+        """
+        batch = [["user", user_id, frame] for user_id, frame in frames]
+        delivered = 0
+        for chunk in self._split_batch(batch):
             try:
-                await connection.send_json(data)
+                await self._route("batch", None, chunk, strict=strict)
             except Exception as e:
-                logger.warning("Broadcast json failed: %s", e)
\ No newline at end of file
+                raise BrokerPublishError(delivered, e) from e
+            delivered += len(chunk)
+
+    def _split_batch(self, batch: List[list]) -> Iterator[List[list]]:
+        limit = self.broker.max_message_bytes if self._broker_started else None
+        if limit is None:
+            if batch:
+                yield batch
+            return
+
+        # {"kind":"batch","key":null,"frame":[...]} 에서 항목을 뺀 크기 + 항목 사이 쉼표
+        overhead = len(self._dumps({"kind": "batch", "key": None, "frame": []}).encode())
+        chunk: List[list] = []
+        size = overhead
+        for item in batch:
+            item_size = len(self._dumps(item).encode()) + (1 if chunk else 0)
+            if chunk and size + item_size > limit:
+                yield chunk
+                chunk, size = [], overhead
+                item_size -= 1
+            chunk.append(item)
+            size += item_size
+        if chunk:
+            yield chunk
+
+    async def publish(self, topic: str, data: Dict[str, Any]) -> None:
+        """
+        topic 구독자에게만 전송.
+        """
+        await self._route("topic", topic, self._dumps(data))
+
+    async def broadcast_text(self, message: str) -> None:
+        """
+        연결된 모든 클라이언트에게 텍스트 메시지를 전송한다.
+        """
+        await self._route("all", None, message)
+
+    async def broadcast_json(self, data: Dict[str, Any]) -> None:
+        """
+        연결된 모든 클라이언트에게 JSON 메시지를 전송한다. (직렬화 1회)
+        """
+        await self._route("all", None, self._dumps(data))
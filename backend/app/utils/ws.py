@@ -1,3 +1,4 @@
 from app.utils.websocket_manager import WebSocketManager
+from app.utils.ws_broker import build_broker
 
-ws_manager = WebSocketManager()
+ws_manager = WebSocketManager(broker=build_broker())
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+from sqlalchemy.engine import make_url
+
+from app.config import settings
+
+logger = logging.getLogger("replay.websocket.broker")
+
+# 브로커에서 받은 메시지(문자열)를 현재 프로세스의 소켓으로 전달하는 콜백
+MessageHandler = Callable[[str], None]
+
+# 재연결 대기 (초)
+RECONNECT_DELAY_SECONDS = 1.0
+RECONNECT_DELAY_MAX_SECONDS = 30.0
+
+# Postgres NOTIFY payload 최대 크기 (기본 빌드 기준 8000 bytes 미만)
+PG_NOTIFY_MAX_BYTES = 7999
+
+
+class MessageTooLargeError(Exception):
+    """
+    브로커가 한 번에 보낼 수 없는 크기의 메시지
+    """
+
+
+class PubSubBroker(ABC):
+    """
+    워커 프로세스 간 WebSocket 메시지 중계 인터페이스.
+    - publish한 메시지는 (자기 자신 포함) 모든 워커의 handler로 전달됨
+    - start/stop은 앱 lifespan에서 호출
+    - max_message_bytes: 메시지 1건 최대 크기 (None이면 제한 없음, 넘으면 publish가 MessageTooLargeError)
+    """
+
+    max_message_bytes: Optional[int] = None
+
+    @abstractmethod
+    async def start(self, handler: MessageHandler) -> None:
+        ...
+
+    @abstractmethod
+    async def stop(self) -> None:
+        ...
+
+    @abstractmethod
+    async def publish(self, message: str) -> None:
+        ...
+
+
+class MemoryBroker(PubSubBroker):
+    """
+    단일 프로세스용 (기본값). publish 즉시 같은 프로세스의 handler 호출.
+    """
+
+    def __init__(self) -> None:
+        self._handler: Optional[MessageHandler] = None
+
+    async def start(self, handler: MessageHandler) -> None:
+        self._handler = handler
+
+    async def stop(self) -> None:
+        self._handler = None
+
+    async def publish(self, message: str) -> None:
+        if self._handler is not None:
+            self._handler(message)
+
+
+class _ListenerBroker(PubSubBroker):
+    """
+    외부 브로커 공통: 백그라운드 listen task + 끊기면 지수 backoff로 재연결
+    """
+
+    name = "broker"
+
+    def __init__(self, channel: str) -> None:
+        self.channel = channel
+        self._handler: Optional[MessageHandler] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def start(self, handler: MessageHandler) -> None:
+        self._handler = handler
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._close()
+
+    def _dispatch(self, message: str) -> None:
+        if self._handler is None:
+            return
+        try:
+            self._handler(message)
+        except Exception:
+            logger.exception("WebSocket broker handler failed")
+
+    async def _run(self) -> None:
+        delay = RECONNECT_DELAY_SECONDS
+        while True:
+            try:
+                await self._listen()
+                delay = RECONNECT_DELAY_SECONDS
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("%s listener disconnected (%r), retrying in %.1fs", self.name, e, delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_DELAY_MAX_SECONDS)
+
+    @abstractmethod
+    async def _connect(self):
+        """
+        수신용 연결 생성 (Redis: 구독한 pubsub, Postgres: asyncpg 커넥션)
+        """
+
+    @abstractmethod
+    async def _listen(self) -> None:
+        ...
+
+    async def _close(self) -> None:
+        pass
+
+
+class RedisBroker(_ListenerBroker):
+    """
+    Redis PUBLISH/SUBSCRIBE. redis 패키지는 WS_BROKER_BACKEND=redis 일 때만 필요.
+    client를 넘기면(예: fakeredis.aioredis) 로컬 테스트 가능.
+    """
+
+    name = "redis"
+
+    def __init__(self, channel: str, url: Optional[str] = None, client=None) -> None:
+        super().__init__(channel)
+        if client is None:
+            try:
+                import redis.asyncio as aioredis
+            except ImportError as exc:
+                raise RuntimeError("WS_BROKER_BACKEND=redis requires the 'redis' package.") from exc
+            client = aioredis.Redis.from_url(url or settings.REDIS_URL)
+        self._client = client
+
+    async def publish(self, message: str) -> None:
+        await self._client.publish(self.channel, message)
+
+    async def _connect(self):
+        pubsub = self._client.pubsub()
+        try:
+            await pubsub.subscribe(self.channel)
+        except Exception:
+            await self._close_pubsub(pubsub)
+            raise
+        return pubsub
+
+    @staticmethod
+    async def _close_pubsub(pubsub) -> None:
+        close = getattr(pubsub, "aclose", None) or pubsub.close
+        await close()
+
+    async def _listen(self) -> None:
+        pubsub = await self._connect()
+        try:
+            async for msg in pubsub.listen():
+                if msg.get("type") != "message":
+                    continue
+                data = msg["data"]
+                self._dispatch(data.decode() if isinstance(data, bytes) else data)
+        finally:
+            await self._close_pubsub(pubsub)
+
+    async def _close(self) -> None:
+        close = getattr(self._client, "aclose", None) or self._client.close
+        await close()
+
+
+class PostgresBroker(_ListenerBroker):
+    """
+    Postgres LISTEN/NOTIFY (asyncpg). Redis 없이 DB만으로 워커 간 전달.
+    - payload가 8000 bytes를 넘으면 NOTIFY 불가 → MessageTooLargeError
+      (manager가 묶음 메시지를 한도 안으로 나눠 보내고, 그래도 넘는 단건만 실패)
+    - listen/publish 커넥션은 풀과 별도로 1개씩 사용
+    """
+
+    name = "postgres"
+    max_message_bytes = PG_NOTIFY_MAX_BYTES
+
+    def __init__(self, channel: str, dsn: Optional[str] = None) -> None:
+        super().__init__(channel.replace(":", "_"))
+        self.dsn = dsn or self._asyncpg_dsn(settings.DATABASE_URL)
+        self._publish_conn = None
+        self._publish_lock = asyncio.Lock()
+
+    @staticmethod
+    def _asyncpg_dsn(database_url: str) -> str:
+        url = make_url(database_url)
+        if url.get_backend_name() != "postgresql":
+            raise RuntimeError("WS_BROKER_BACKEND=postgres requires a PostgreSQL DATABASE_URL.")
+        return url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+    async def _connect(self):
+        import asyncpg
+
+        return await asyncpg.connect(self.dsn)
+
+    async def publish(self, message: str) -> None:
+        size = len(message.encode())
+        if size > PG_NOTIFY_MAX_BYTES:
+            raise MessageTooLargeError(f"WebSocket message too large for NOTIFY ({size} bytes)")
+
+        # asyncpg 커넥션은 동시 쿼리 불가 → lock으로 직렬화
+        async with self._publish_lock:
+            if self._publish_conn is None or self._publish_conn.is_closed():
+                self._publish_conn = await self._connect()
+            await self._publish_conn.execute("SELECT pg_notify($1, $2)", self.channel, message)
+
+    async def _listen(self) -> None:
+        conn = await self._connect()
+        closed = asyncio.get_running_loop().create_future()
+
+        def on_notify(_conn, _pid, _channel, payload: str) -> None:
+            self._dispatch(payload)
+
+        def on_terminate(_conn) -> None:
+            if not closed.done():
+                closed.set_result(None)
+
+        conn.add_termination_listener(on_terminate)
+        try:
+            await conn.add_listener(self.channel, on_notify)
+            await closed
+            raise ConnectionError("LISTEN connection closed")
+        finally:
+            if not conn.is_closed():
+                await conn.close()
+
+    async def _close(self) -> None:
+        if self._publish_conn is not None and not self._publish_conn.is_closed():
+            await self._publish_conn.close()
+        self._publish_conn = None
+
+
+def build_broker(backend: Optional[str] = None) -> PubSubBroker:
+    """
+    settings.WS_BROKER_BACKEND(memory | redis | postgres)에 맞는 브로커 생성.
+    """
+    backend = backend or settings.WS_BROKER_BACKEND
+    if backend == "memory":
+        return MemoryBroker()
+    if backend == "redis":
+        return RedisBroker(settings.WS_BROKER_CHANNEL)
+    if backend == "postgres":
+        return PostgresBroker(settings.WS_BROKER_CHANNEL)
+    raise ValueError(f"Unknown WS_BROKER_BACKEND: {backend}")